@@ -0,0 +1,81 @@
+import json
+
+from python.common.common import notify_io
+
+PRETTY_INDENT = 4
+COMPACT_SEPARATORS = (',', ':')
+
+
+def _encode(data, compact):
+    if compact:
+        return json.dumps(data, separators=COMPACT_SEPARATORS)
+    return json.dumps(data, indent=PRETTY_INDENT)
+
+
+def serialize_wordforms(wordforms, compact=False):
+    # Yields the JSON text of each wordform's to_dict(), in order; wordforms can be any iterable. WordNet attributes
+    # should be resolved beforehand (resolve_wordnet_attributes)
+    for word in wordforms:
+        yield _encode(word.to_dict(), compact)
+
+
+def encode_records(records, texts, compact=False):
+    # Passes records through, appending the JSON text of each to texts, so that records serialised once can feed both
+    # a forest and a Records array
+    for record in records:
+        texts.append(_encode(record, compact))
+        yield record
+
+
+class Records:
+    """
+        A JSON array of already-encoded elements (as made by serialize_wordforms, in the same mode), for
+        write_json_stream to write one element at a time. The elements may be any iterable, and are read once.
+    """
+
+    def __init__(self, texts):
+        self.texts = texts
+
+
+def _indented(text, depth):
+    return text.replace('\n', '\n' + ' ' * (PRETTY_INDENT * depth))
+
+
+def write_json_stream(fp, document, compact=False):
+    # Writes a dict whose values are plain JSON or Records. Pretty mode is byte-identical to json.dump(indent=4) of
+    # the same document, and compact mode to json.dump with separators (',', ':')
+    if compact:
+        fp.write('{')
+        for i, (key, value) in enumerate(document.items()):
+            fp.write(('' if i == 0 else ',') + json.dumps(key) + ':')
+            if isinstance(value, Records):
+                fp.write('[')
+                for j, text in enumerate(value.texts):
+                    fp.write(text if j == 0 else ',' + text)
+                fp.write(']')
+            else:
+                fp.write(_encode(value, compact=True))
+        fp.write('}')
+        return
+
+    if not document:
+        fp.write('{}')
+        return
+    fp.write('{\n')
+    for i, (key, value) in enumerate(document.items()):
+        fp.write(('' if i == 0 else ',\n') + ' ' * PRETTY_INDENT + json.dumps(key) + ': ')
+        if isinstance(value, Records):
+            empty = True
+            for text in value.texts:
+                fp.write(('[\n' if empty else ',\n') + ' ' * (2 * PRETTY_INDENT) + _indented(text, 2))
+                empty = False
+            fp.write('[]' if empty else '\n' + ' ' * PRETTY_INDENT + ']')
+        else:
+            fp.write(_indented(_encode(value, compact=False), 1))
+    fp.write('\n}')
+
+
+def save_json_stream(file, document, compact=False):
+    with open(file, 'w') as fp:
+        write_json_stream(fp, document, compact=compact)
+    notify_io('write', file)
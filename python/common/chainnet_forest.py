@@ -0,0 +1,252 @@
+import os
+
+import numpy as np
+
+from python.common.common import info, open_json, save_json, notify_io
+from python.common.string_table import StringTableBuilder, StringTable
+
+FORMAT_VERSION = 2
+
+LABEL_CODES = {
+    "prototype": 0,
+    "metonymy": 1,
+    "metaphor": 2
+}
+LABELS = {code: label for label, code in LABEL_CODES.items()}
+
+FEATURE_LABEL_CODES = {
+    "new": 0,
+    "kept": 1,
+    "lost": 2,
+    "modified": 3
+}
+FEATURE_LABELS = {code: label for label, code in FEATURE_LABEL_CODES.items()}
+
+STRING_TABLES = ['wordforms', 'annotators', 'sense_ids', 'sense_keys', 'synsets', 'definitions', 'feature_ids',
+                 'feature_strings']
+
+WORD_COLUMNS = {
+    'word_wordform': np.int32,
+    'word_annotator': np.int32,
+    'word_is_known': np.int8,
+    'word_seconds': np.int64,
+    'word_sense_start': np.int64,
+}
+
+SENSE_COLUMNS = {
+    'sense_word': np.int32,
+    'sense_wordform': np.int32,
+    'sense_id': np.int32,
+    'sense_key': np.int32,
+    'sense_synset': np.int32,
+    'sense_definition': np.int32,
+    'sense_parent': np.int32,
+    'sense_label': np.int8,
+    'sense_is_known': np.int8,
+    'sense_is_virtual': np.int8,
+    'sense_is_split': np.int8,
+    'sense_position': np.int16,
+    'sense_has_features': np.int8,
+    'sense_feature_start': np.int64,
+}
+
+FEATURE_COLUMNS = {
+    'feature_sense': np.int32,
+    'feature_id': np.int32,
+    'feature_string': np.int32,
+    'feature_label': np.int8,
+    'feature_source_id': np.int32,
+    'feature_source_string': np.int32,
+}
+
+
+def _flag(value):
+    # Booleans are stored as 0/1, with -1 for missing values
+    if value is None:
+        return -1
+    return int(value)
+
+
+def _unflag(value):
+    if value < 0:
+        return None
+    return bool(value)
+
+
+def save_chainnet_forest(directory, chainnet):
+    # chainnet is either a release dict (with metadata and content) or WordForm.to_dict() records; either way the
+    # records may be any iterable, and are read once
+    if isinstance(chainnet, dict):
+        metadata = chainnet['metadata']
+        content = chainnet['content']
+    else:
+        metadata = None
+        content = chainnet
+
+    tables = {name: StringTableBuilder() for name in STRING_TABLES}
+    word_columns = {name: [] for name in WORD_COLUMNS.keys()}
+    sense_columns = {name: [] for name in SENSE_COLUMNS.keys()}
+    feature_columns = {name: [] for name in FEATURE_COLUMNS.keys()}
+
+    for word_index, word in enumerate(content):
+        senses = word['senses']
+        first_row = len(sense_columns['sense_word'])
+        rows = {sense['sense_id']: first_row + i for i, sense in enumerate(senses)}
+
+        word_columns['word_wordform'].append(tables['wordforms'].add(word['wordform']))
+        word_columns['word_annotator'].append(tables['annotators'].add(word.get('annotator_id')))
+        word_columns['word_is_known'].append(_flag(word.get('is_known')))
+        seconds = word.get('annotation_seconds')
+        word_columns['word_seconds'].append(-1 if seconds is None else seconds)
+        word_columns['word_sense_start'].append(first_row)
+
+        for position, sense in enumerate(senses):
+            features = sense.get('features')
+            sense_columns['sense_word'].append(word_index)
+            sense_columns['sense_wordform'].append(tables['wordforms'].add(sense.get('wordform', word['wordform'])))
+            sense_columns['sense_id'].append(tables['sense_ids'].add(sense['sense_id']))
+            sense_columns['sense_key'].append(tables['sense_keys'].add(sense['wordnet_sense_id']))
+            sense_columns['sense_synset'].append(tables['synsets'].add(sense['wordnet_synset_id']))
+            sense_columns['sense_definition'].append(tables['definitions'].add(sense['definition']))
+            sense_columns['sense_parent'].append(-1 if sense['child_of'] is None else rows[sense['child_of']])
+            sense_columns['sense_label'].append(LABEL_CODES[sense['label']])
+            sense_columns['sense_is_known'].append(_flag(sense.get('is_known')))
+            sense_columns['sense_is_virtual'].append(_flag(sense['is_virtual']))
+            sense_columns['sense_is_split'].append(_flag(sense['is_split']))
+            sense_columns['sense_position'].append(position)
+            sense_columns['sense_has_features'].append(int(features is not None))
+            sense_columns['sense_feature_start'].append(len(feature_columns['feature_sense']))
+
+            for feature in features or []:
+                feature_columns['feature_sense'].append(first_row + position)
+                feature_columns['feature_id'].append(tables['feature_ids'].add(feature['feature_id']))
+                feature_columns['feature_string'].append(tables['feature_strings'].add(feature['feature_string']))
+                feature_columns['feature_label'].append(FEATURE_LABEL_CODES[feature['label']])
+                feature_columns['feature_source_id'].append(tables['feature_ids'].add(feature['source_feature_id']))
+                feature_columns['feature_source_string'].append(
+                    tables['feature_strings'].add(feature['source_feature_string']))
+
+    word_columns['word_sense_start'].append(len(sense_columns['sense_word']))
+    sense_columns['sense_feature_start'].append(len(feature_columns['feature_sense']))
+
+    num_words = len(word_columns['word_wordform'])
+    info(f'Saving forest of {num_words} words and {len(sense_columns["sense_word"])} senses to {directory}')
+    os.makedirs(directory, exist_ok=True)
+    for name, table in tables.items():
+        table.save(directory, name)
+    for columns, dtypes in [(word_columns, WORD_COLUMNS), (sense_columns, SENSE_COLUMNS),
+                            (feature_columns, FEATURE_COLUMNS)]:
+        for name, values in columns.items():
+            np.save(os.path.join(directory, f'{name}.npy'), np.array(values, dtype=dtypes[name]))
+    save_json(os.path.join(directory, 'forest.json'), {
+        'format_version': FORMAT_VERSION,
+        'metadata': metadata,
+        'num_words': num_words,
+        'num_senses': len(sense_columns['sense_word']),
+        'num_features': len(feature_columns['feature_sense']),
+        'labels': LABEL_CODES,
+        'feature_labels': FEATURE_LABEL_CODES
+    })
+    notify_io('write', directory)
+
+
+class ChainNetForest:
+    """
+        Zero-copy view of the ChainNet sense forest written by save_chainnet_forest.
+        Every column is memory-mapped, so loading is near instant and the pages are shared between processes.
+        Parent indices are rows of the sense columns (-1 for prototypes), and each sense's features are the rows of the
+        feature columns from its sense_feature_start.
+    """
+
+    def __init__(self, directory):
+        header = open_json(os.path.join(directory, 'forest.json'))
+        assert header['format_version'] == FORMAT_VERSION, f'Unsupported forest version in {directory}'
+        self.directory = directory
+        self.metadata = header['metadata']
+
+        for name in STRING_TABLES:
+            setattr(self, name, StringTable(directory, name))
+        for name in list(WORD_COLUMNS.keys()) + list(SENSE_COLUMNS.keys()) + list(FEATURE_COLUMNS.keys()):
+            setattr(self, name, np.load(os.path.join(directory, f'{name}.npy'), mmap_mode='r'))
+        self._word_indices = None
+
+    def __len__(self):
+        return len(self.word_wordform)
+
+    def __iter__(self):
+        for word_index in range(len(self)):
+            yield self.word_to_dict(word_index)
+
+    def __contains__(self, wordform):
+        return self.word_index(wordform) >= 0
+
+    def wordform(self, word_index):
+        return self.wordforms[self.word_wordform[word_index]]
+
+    def all_wordforms(self):
+        return [self.wordform(i) for i in range(len(self))]
+
+    def word_index(self, wordform):
+        if self._word_indices is None:
+            self._word_indices = {self.wordform(i): i for i in range(len(self))}
+        return self._word_indices.get(wordform, -1)
+
+    def sense_rows(self, word_index):
+        return range(int(self.word_sense_start[word_index]), int(self.word_sense_start[word_index+1]))
+
+    def label(self, row):
+        return LABELS[int(self.sense_label[row])]
+
+    def feature_rows(self, row):
+        return range(int(self.sense_feature_start[row]), int(self.sense_feature_start[row+1]))
+
+    def feature_to_dict(self, feature_row):
+        return {
+            'feature_id': self.feature_ids[self.feature_id[feature_row]],
+            'feature_string': self.feature_strings[self.feature_string[feature_row]],
+            'label': FEATURE_LABELS[int(self.feature_label[feature_row])],
+            'source_feature_id': self.feature_ids[self.feature_source_id[feature_row]],
+            'source_feature_string': self.feature_strings[self.feature_source_string[feature_row]]
+        }
+
+    def features(self, row):
+        # The features of a sense, as in its record; None if the record had none
+        if not self.sense_has_features[row]:
+            return None
+        return [self.feature_to_dict(feature_row) for feature_row in self.feature_rows(row)]
+
+    def sense_to_dict(self, row):
+        parent = int(self.sense_parent[row])
+        return {
+            'sense_id': self.sense_ids[self.sense_id[row]],
+            'wordform': self.wordforms[self.sense_wordform[row]],
+            'definition': self.definitions[self.sense_definition[row]],
+            'wordnet_sense_id': self.sense_keys[self.sense_key[row]],
+            'wordnet_synset_id': self.synsets[self.sense_synset[row]],
+            'label': self.label(row),
+            'child_of': None if parent < 0 else self.sense_ids[self.sense_id[parent]],
+            'is_known': _unflag(self.sense_is_known[row]),
+            'is_virtual': _unflag(self.sense_is_virtual[row]),
+            'is_split': _unflag(self.sense_is_split[row]),
+            'features': self.features(row)
+        }
+
+    def word_to_dict(self, word_index):
+        seconds = int(self.word_seconds[word_index])
+        return {
+            'wordform': self.wordform(word_index),
+            'is_known': _unflag(self.word_is_known[word_index]),
+            'annotator_id': self.annotators[self.word_annotator[word_index]],
+            'annotation_seconds': None if seconds < 0 else seconds,
+            'senses': [self.sense_to_dict(row) for row in self.sense_rows(word_index)]
+        }
+
+    def get(self, wordform):
+        word_index = self.word_index(wordform)
+        if word_index < 0:
+            raise KeyError(wordform)
+        return self.word_to_dict(word_index)
+
+
+def open_chainnet_forest(directory='bin/analysis/chainnet_forest'):
+    return ChainNetForest(directory)
@@ -0,0 +1,198 @@
+import json
+import os
+
+from python.common.common import info, open_json, save_json, chainnet_file
+
+
+class ChainNetReader:
+    """
+        Lazily reads the wordform records of a ChainNet JSON release.
+        Records are parsed one at a time as the file is scanned, and a byte-offset index is persisted
+        so that get(wordform) only needs a seek and a parse of that one record.
+    """
+
+    INDEX_VERSION = 1
+    BATCH_SIZE = 1024  # Records read per get_many when iterating through the index
+
+    def __init__(self, file, index_file=None, chunk_size=1 << 20):
+        self.file = file
+        if index_file is None:
+            index_file = os.path.join('bin', 'indices', os.path.basename(file) + '.idx.json')
+        self.index_file = index_file
+        self.chunk_size = chunk_size
+
+        self._metadata = None
+        self._offsets = None
+
+    def __iter__(self):
+        # Through the offset index if it is loaded, so the file is not scanned again
+        if self._offsets is not None:
+            wordforms = list(self._offsets.keys())
+            for i in range(0, len(wordforms), self.BATCH_SIZE):
+                yield from self.get_many(wordforms[i:i + self.BATCH_SIZE])
+            return
+        for key, offset, length, value in self._scan():
+            if key == 'content':
+                yield value
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def __contains__(self, wordform):
+        return wordform in self.offsets
+
+    def wordforms(self):
+        return list(self.offsets.keys())
+
+    @property
+    def metadata(self):
+        if self._metadata is None:
+            if self._offsets is None and self._load_index():
+                return self._metadata
+            for key, offset, length, value in self._scan():
+                if self._metadata is not None:
+                    break
+        return self._metadata
+
+    @property
+    def offsets(self):
+        # wordform -> (byte offset, byte length)
+        if self._offsets is None:
+            if not self._load_index():
+                self.build_index()
+        return self._offsets
+
+    def get(self, wordform):
+        offset, length = self.offsets[wordform]
+        with open(self.file, 'rb') as fp:
+            fp.seek(offset)
+            raw = fp.read(length)
+        return json.loads(raw.decode('utf-8'))
+
+    def get_many(self, wordforms):
+        entries = sorted((self.offsets[w] + (w,) for w in set(wordforms)))
+        records = {}
+        with open(self.file, 'rb') as fp:
+            for offset, length, wordform in entries:
+                fp.seek(offset)
+                records[wordform] = json.loads(fp.read(length).decode('utf-8'))
+        return [records[w] for w in wordforms]
+
+    def build_index(self):
+        info(f'Indexing {self.file}')
+        offsets = {}
+        for key, offset, length, value in self._scan():
+            if key == 'content':
+                offsets[value['wordform']] = (offset, length)
+        self._offsets = offsets
+
+        stat = os.stat(self.file)
+        os.makedirs(os.path.dirname(self.index_file) or '.', exist_ok=True)
+        save_json(self.index_file, {
+            'index_version': self.INDEX_VERSION,
+            'source_size': stat.st_size,
+            'source_mtime_ns': stat.st_mtime_ns,
+            'metadata': self._metadata,
+            'entries': [[w, o, l] for w, (o, l) in offsets.items()]
+        })
+
+    def _load_index(self):
+        if not os.path.isfile(self.index_file):
+            return False
+        index = open_json(self.index_file)
+        stat = os.stat(self.file)
+        if index.get('index_version') != self.INDEX_VERSION or index['source_size'] != stat.st_size \
+                or index['source_mtime_ns'] != stat.st_mtime_ns:
+            return False
+        self._metadata = index['metadata']
+        self._offsets = {w: (o, l) for (w, o, l) in index['entries']}
+        return True
+
+    def _scan(self):
+        # Yields (key, byte offset, byte length, value) for each top-level value, and for each element of 'content'.
+        # The file is decoded as latin-1 so that string indices are byte offsets; JSON structure is pure ASCII, so any
+        # record that is not ASCII is parsed again from its UTF-8 bytes.
+        decoder = json.JSONDecoder()
+        with open(self.file, 'rb') as fp:
+            state = {'buffer': '', 'start': 0, 'eof': False}  # start is the file offset of buffer[0]
+
+            def fill():
+                chunk = fp.read(self.chunk_size)
+                if not chunk:
+                    state['eof'] = True
+                    return False
+                state['buffer'] += chunk.decode('latin-1')
+                return True
+
+            def skip_whitespace(pos):
+                while True:
+                    buffer = state['buffer']
+                    while pos < len(buffer) and buffer[pos] in ' \t\r\n':
+                        pos += 1
+                    if pos < len(buffer) or not fill():
+                        return pos
+
+            def expect(pos, characters):
+                pos = skip_whitespace(pos)
+                assert pos < len(state['buffer']) and state['buffer'][pos] in characters, \
+                    f'Malformed ChainNet JSON at byte {state["start"] + pos} of {self.file}'
+                return pos + 1, state['buffer'][pos]
+
+            def decode(pos):
+                pos = skip_whitespace(pos)
+                while True:
+                    try:
+                        value, end = decoder.raw_decode(state['buffer'], pos)
+                    except json.JSONDecodeError:
+                        if not fill():
+                            raise
+                        continue
+                    if end == len(state['buffer']) and not state['eof']:
+                        # A number may continue into the next chunk
+                        fill()
+                        continue
+                    span = state['buffer'][pos:end]
+                    if not span.isascii():
+                        value = json.loads(span.encode('latin-1').decode('utf-8'))
+                    return value, pos, end
+
+            def trim(pos):
+                if pos > self.chunk_size:
+                    state['buffer'] = state['buffer'][pos:]
+                    state['start'] += pos
+                    return 0
+                return pos
+
+            pos, _ = expect(0, '{')
+            pos = skip_whitespace(pos)
+            if state['buffer'][pos:pos+1] == '}':
+                return
+            while True:
+                key, _, pos = decode(pos)
+                pos, _ = expect(pos, ':')
+                if key == 'content':
+                    pos, _ = expect(pos, '[')
+                    pos = skip_whitespace(pos)
+                    if state['buffer'][pos:pos+1] == ']':
+                        pos += 1
+                    else:
+                        while True:
+                            record, start, end = decode(pos)
+                            yield key, state['start'] + start, end - start, record
+                            pos, delimiter = expect(end, ',]')
+                            pos = trim(pos)
+                            if delimiter == ']':
+                                break
+                else:
+                    value, start, end = decode(pos)
+                    if key == 'metadata':
+                        self._metadata = value
+                    yield key, state['start'] + start, end - start, value
+                    pos = end
+                pos, delimiter = expect(pos, ',}')
+                if delimiter == '}':
+                    return
+
+
+def open_chainnet_reader(version=None):
+    return ChainNetReader(chainnet_file(version=version))
@@ -1,19 +1,32 @@
 import csv
+import gc
+import itertools
 import json
 import os
 import pickle
 import logging
-import bz2
 import re
+import shutil
+from contextlib import contextmanager
+
+from python.common.compression import artifact_codec, open_artifact
 
 logging.basicConfig(format='%(asctime)s : %(levelname)s : %(message)s', level=logging.INFO)
 
+# Callbacks of the form listener(mode, file), called after each artifact is read ('read') or written ('write')
+io_listeners = []
+
 
 def flatten(list_of_lists):
     flat_list = [item for sublist in list_of_lists for item in sublist]
     return flat_list
 
 
+def notify_io(mode, file):
+    for listener in io_listeners:
+        listener(mode, file)
+
+
 def info(text):
     logging.info(text)
 
@@ -81,25 +94,12 @@ def open_csv(file):
     with open(file, 'r') as csv_file:
         for line in csv.reader(csv_file, delimiter=delimiter):
             all_lines += [line]
+    notify_io('read', file)
     return all_lines
 
 
 def open_dict_csv(file, delimiter=None, encoding=None):
-    ftype = file[-4:]
-    if delimiter is None:
-        if ftype == '.tsv':
-            delimiter = '\t'
-        elif ftype == '.csv':
-            delimiter = ','
-        else:
-            # update
-            print("Invalid file extension: {}".format(file))
-            exit()
-    all_lines = []
-    with open(file, 'r', encoding=encoding) as csv_file:
-        for line in csv.DictReader(csv_file, delimiter=delimiter):
-            all_lines += [line]
-    return all_lines
+    return list(iter_dict_csv(file, delimiter=delimiter, encoding=encoding))
 
 
 def save_list_csv(file, all_lines):
@@ -118,35 +118,140 @@ def save_list_csv(file, all_lines):
         csv_writer = csv.writer(csv_file, delimiter=delimiter)
         for row in all_lines:
             csv_writer.writerow(row)
+    notify_io('write', file)
 
 
-def save_csv(file, all_lines, encoding=None):
+def csv_delimiter(file):
     ftype = file[-4:]
-    delimiter = ''
     if ftype == '.tsv':
-        delimiter = '\t'
+        return '\t'
     elif ftype == '.csv':
-        delimiter = ','
+        return ','
     else:
         # update
         print("Invalid file extension: {}".format(file))
         exit()
+
+
+def iter_dict_csv(file, delimiter=None, encoding=None):
+    # Row iterator mode: yields one dict per line without holding the file in memory
+    if delimiter is None:
+        delimiter = csv_delimiter(file)
+    with open(file, 'r', encoding=encoding) as csv_file:
+        for line in csv.DictReader(csv_file, delimiter=delimiter):
+            yield line
+    notify_io('read', file)
+
+
+class CategoricalColumn:
+    """
+        A string column stored as integer codes into a list of distinct categories.
+        Indexing and iteration give back the strings, so it can be used wherever a list of strings is expected.
+    """
+
+    def __init__(self, codes, categories):
+        self.codes = codes
+        self.categories = categories
+        self._category_codes = None
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __getitem__(self, row):
+        return self.categories[self.codes[row]]
+
+    def __iter__(self):
+        categories = self.categories
+        for code in self.codes:
+            yield categories[code]
+
+    def code(self, category):
+        # Code of a category, or -1 if it never occurs in the column
+        if self._category_codes is None:
+            self._category_codes = {c: i for i, c in enumerate(self.categories)}
+        return self._category_codes.get(category, -1)
+
+
+def _parse_bool(value):
+    return value in {'True', 'true', '1'}
+
+
+def open_csv_columns(file, dtypes=None, categorical=(), delimiter=None, encoding=None):
+    """
+        Reads a CSV/TSV with a header into a dict of columns, in file order.
+        dtypes maps a column to a Python type (int, float, bool or str), giving a list, or to a numpy dtype, giving
+        an array. Columns in categorical are interned into a CategoricalColumn. Other columns are lists of strings.
+    """
+    dtypes = dtypes if dtypes is not None else {}
+    if delimiter is None:
+        delimiter = csv_delimiter(file)
+
+    with open(file, 'r', encoding=encoding) as csv_file:
+        reader = csv.reader(csv_file, delimiter=delimiter)
+        header = next(reader, [])
+        values = [[] for _ in header]
+        categories = {name: {} for name in categorical}
+        appenders = []
+        for name, column in zip(header, values):
+            if name in categories:
+                seen = categories[name]
+                appenders.append(lambda value, column=column, seen=seen: column.append(seen.setdefault(value, len(seen))))
+            else:
+                appenders.append(column.append)
+        for line in reader:
+            if not line:
+                continue
+            for append, value in zip(appenders, line):
+                append(value)
+    notify_io('read', file)
+
+    columns = {}
+    for name, column in zip(header, values):
+        assert len(column) == len(values[0]), f'Ragged column {name} in {file}'
+        if name in categories:
+            import numpy as np
+            columns[name] = CategoricalColumn(np.array(column, dtype=np.int32), list(categories[name].keys()))
+        elif name not in dtypes or dtypes[name] is str:
+            columns[name] = column
+        elif dtypes[name] is bool:
+            columns[name] = [_parse_bool(value) for value in column]
+        elif dtypes[name] in {int, float}:
+            columns[name] = [dtypes[name](value) for value in column]
+        else:
+            import numpy as np
+            columns[name] = np.array(column).astype(dtypes[name])
+    return columns
+
+
+def save_csv(file, all_lines, encoding=None, fieldnames=None):
+    # all_lines may be any iterable of dicts, including a generator; rows are written as they are produced.
+    # Without fieldnames, the keys of the first row are used.
+    delimiter = csv_delimiter(file)
+    all_lines = iter(all_lines)
+    if fieldnames is None:
+        first_line = next(all_lines, None)
+        assert first_line is not None, f'No rows to save to {file}'
+        fieldnames = first_line.keys()
+        all_lines = itertools.chain([first_line], all_lines)
     with open(file, 'w', encoding=encoding) as csv_file:
-        dict_writer = csv.DictWriter(csv_file, fieldnames=all_lines[0].keys(), delimiter=delimiter,
+        dict_writer = csv.DictWriter(csv_file, fieldnames=fieldnames, delimiter=delimiter,
                                      quoting=csv.QUOTE_NONE, escapechar='\\')
         dict_writer.writeheader()
         dict_writer.writerows(all_lines)
+    notify_io('write', file)
     return
 
 
 def save_json(file, dictionary):
     with open(file, "w") as fp:
         json.dump(dictionary, fp, indent=4)
+    notify_io('write', file)
 
 
 def open_json(file):
     with open(file, "r") as fp:
         dictionary = json.load(fp)
+    notify_io('read', file)
     return dictionary
 
 
@@ -155,25 +260,57 @@ def strip_surrounding_whitespace(string):
 
 
 def open_pickle(file):
-    with open(file, 'rb') as fp:
-        data = pickle.load(fp)
+    # Reads raw pickles and compressed artifacts of any codec. Unpickling allocates many objects and frees none, so the
+    # cyclic garbage collector is paused meanwhile
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        with open_artifact(file, 'rb') as fp:
+            data = pickle.load(fp)
+    finally:
+        if gc_enabled:
+            gc.enable()
+    notify_io('read', file)
     return data
 
 
-def save_pickle(file, data):
-    with open(file, 'wb') as fp:
-        pickle.dump(data, fp)
+def save_pickle(file, data, codec=None):
+    # The codec defaults to the one configured for this path in compression.ARTIFACT_CODECS
+    with staged_file(file) as staging:
+        with open_artifact(staging, 'wb', codec=codec or artifact_codec(file)) as fp:
+            pickle.dump(data, fp)
+    notify_io('write', file)
 
 
 def open_pickle_bz2(file):
-    with bz2.open(file, 'rb') as fp:
-        data = pickle.load(fp)
-    return data
+    return open_pickle(file)
 
 
 def save_pickle_bz2(file, data):
-    with bz2.open(file, 'wb') as fp:
-        pickle.dump(data, fp)
+    save_pickle(file, data, codec='bz2')
+
+
+def iter_pickle_stream(file):
+    # Yields the objects of a file written by save_pickle_stream, header first, unpickling one at a time
+    with open_artifact(file, 'rb') as fp:
+        while True:
+            try:
+                yield pickle.load(fp)
+            except EOFError:
+                break
+    notify_io('read', file)
+
+
+def save_pickle_stream(file, header, records, codec=None):
+    # Pickles the header and then each record on its own, passing the records through as they are written, so that
+    # neither this nor iter_pickle_stream holds them all. The file is replaced only once the records are exhausted
+    with staged_file(file) as staging:
+        with open_artifact(staging, 'wb', codec=codec or artifact_codec(file)) as fp:
+            pickle.dump(header, fp)
+            for record in records:
+                pickle.dump(record, fp)
+                yield record
+    notify_io('write', file)
 
 
 def save_text_lines(file, lines):
@@ -181,11 +318,58 @@ def save_text_lines(file, lines):
         lines = [line + '\n' for line in lines[:-1]] + [lines[-1]]
     with open(file, 'w') as fp:
         fp.writelines(lines)
+    notify_io('write', file)
 
 
 def save_text_block(file, block):
     with open(file, 'w') as fp:
         fp.write(block)
+    notify_io('write', file)
+
+
+def save_text_blocks(file, blocks):
+    # Writes an iterable of blocks as they are produced
+    with open(file, 'w') as fp:
+        for block in blocks:
+            fp.write(block)
+    notify_io('write', file)
+
+
+@contextmanager
+def staged_file(file):
+    # Yields a temporary path to write to, which replaces file only once the block completes, so that a failed write
+    # never leaves a truncated file in its place
+    staging = f'{file}.tmp{os.getpid()}'
+    try:
+        yield staging
+    except BaseException:
+        if os.path.exists(staging):
+            os.remove(staging)
+        raise
+    os.replace(staging, file)
+
+
+@contextmanager
+def staged_directory(directory):
+    # Yields a temporary directory to write into, which is moved into place as directory only once the block completes,
+    # so that a half-written directory is never opened (by this or another process)
+    staging = f'{directory}.tmp{os.getpid()}'
+    shutil.rmtree(staging, ignore_errors=True)
+    os.makedirs(staging)
+    try:
+        yield staging
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+    if os.path.isdir(directory):
+        previous = f'{directory}.old{os.getpid()}'
+        os.replace(directory, previous)
+        os.replace(staging, directory)
+        shutil.rmtree(previous, ignore_errors=True)
+    else:
+        os.replace(staging, directory)
+    notify_io('write', directory)
+
 
 def safe_lemma_from_key(word, sense_id):
     from nltk.corpus.reader.wordnet import WordNetError
@@ -209,44 +393,56 @@ def safe_lemma_from_key(word, sense_id):
 def open_text_lines(file):
     with open(file, 'r') as fp:
         lines = fp.readlines()
+    notify_io('read', file)
     lines_stripped = [line.rstrip() for line in lines]
     return lines_stripped
 
 def open_text_block(file):
     with open(file, 'r') as fp:
         block = fp.read()
+    notify_io('read', file)
     return block
 
 
+TEX_ESCAPES = {
+    '&': r'\&',
+    '%': r'\%',
+    '$': r'\$',
+    '#': r'\#',
+    '_': r'\_',
+    '{': r'\{',
+    '}': r'\}',
+    '~': r'\textasciitilde{}',
+    '^': r'\^{}',
+    '\\': r'\textbackslash{}',
+    '<': r'\textless{}',
+    '>': r'\textgreater{}',
+}
+TEX_ESCAPE_REGEX = re.compile('|'.join(re.escape(key) for key in sorted(TEX_ESCAPES.keys(), key=lambda item: - len(item))))
+
+
 def tex_escape(text):
     """
         :param text: a plain text message
         :return: the message escaped to appear correctly in LaTeX
     """
-    conv = {
-        '&': r'\&',
-        '%': r'\%',
-        '$': r'\$',
-        '#': r'\#',
-        '_': r'\_',
-        '{': r'\{',
-        '}': r'\}',
-        '~': r'\textasciitilde{}',
-        '^': r'\^{}',
-        '\\': r'\textbackslash{}',
-        '<': r'\textless{}',
-        '>': r'\textgreater{}',
-    }
-    regex = re.compile('|'.join(re.escape(str(key)) for key in sorted(conv.keys(), key = lambda item: - len(item))))
-    return regex.sub(lambda match: conv[match.group()], text)
+    return TEX_ESCAPE_REGEX.sub(lambda match: TEX_ESCAPES[match.group()], text)
 
 def chunks(lst, n):
     """Yield successive n-sized chunks from lst."""
     for i in range(0, len(lst), n):
         yield lst[i:i + n]
 
-def open_chainnet(version=None):
+def chainnet_file(version=None):
+    # Older versions are rebuilt from the version store when available, falling back to full snapshot files
     if version is None:
-        return open_json('data/chainnet.json')['content']
-    else:
-        return open_json(f'data/versions/chainnet_v{version}.json')['content']
+        return 'data/chainnet.json'
+    from python.common.version_store import open_version_store
+    store = open_version_store()
+    if version in store:
+        return store.materialized_file(version)
+    return f'data/versions/chainnet_v{version}.json'
+
+
+def open_chainnet(version=None):
+    return open_json(chainnet_file(version=version))['content']
@@ -0,0 +1,208 @@
+import bz2
+import fnmatch
+import gzip
+import io
+import lzma
+import os
+import struct
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+# Compressed artifacts are written as independently compressed blocks, each a complete gzip member, bz2 stream or xz
+# stream. As each format allows several of these in one file, an artifact is an ordinary .gz, .bz2 or .xz file, whose
+# own magic bytes name its codec. Each gzip member also records its length in an extra header field (as BGZF does), so
+# that gzip artifacts can be decompressed block by block in parallel. Uncompressed artifacts are plain files.
+BLOCK_SIZE = 4 << 20
+
+GZIP_MAGIC = b'\x1f\x8b'
+BZ2_MAGIC = b'BZh'
+XZ_MAGIC = b'\xfd7zXZ\x00'
+
+GZIP_HEADER = struct.Struct('<2sBBIBBH')  # magic, method, flags, mtime, extra flags, OS, extra length
+GZIP_FEXTRA = 4
+BLOCK_FIELD = b'CN'  # gzip extra subfield holding the member's length
+BLOCK_EXTRA = struct.Struct('<2sHI')
+
+
+def _gzip_member(data, level=6):
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    body = compressor.compress(data) + compressor.flush()
+    length = GZIP_HEADER.size + BLOCK_EXTRA.size + len(body) + 8
+    return GZIP_HEADER.pack(GZIP_MAGIC, 8, GZIP_FEXTRA, 0, 0, 255, BLOCK_EXTRA.size) + \
+        BLOCK_EXTRA.pack(BLOCK_FIELD, 4, length) + body + struct.pack('<II', zlib.crc32(data), len(data) & 0xffffffff)
+
+
+CODECS = {
+    'gzip': (_gzip_member, gzip.open),
+    'bz2': (lambda data: bz2.compress(data, compresslevel=9), bz2.open),
+    'lzma': (lambda data: lzma.compress(data, preset=6), lzma.open),
+}
+
+DEFAULT_CODEC = 'none'
+
+# (glob pattern, codec) pairs, checked in order; the first pattern matching an artifact's path picks its codec
+ARTIFACT_CODECS = [
+    ('bin/parsing/sensembert_embeddings.pkl', 'gzip'),
+    ('bin/collection/example_sentences_princeton.pkl', 'gzip'),
+    ('bin/collection/concepts_to_definitions.pkl', 'gzip'),
+    ('bin/collection/glosstag_ir/*.pkl', 'gzip'),
+]
+
+
+def set_artifact_codec(pattern, codec):
+    assert codec == 'none' or codec in CODECS, f'Unknown codec {codec}'
+    ARTIFACT_CODECS.insert(0, (pattern, codec))
+
+
+def artifact_codec(file):
+    path = os.path.normpath(file)
+    for pattern, codec in ARTIFACT_CODECS:
+        if fnmatch.fnmatch(path, os.path.normpath(pattern)):
+            return codec
+    return DEFAULT_CODEC
+
+
+def _workers(workers):
+    return workers if workers is not None else (os.cpu_count() or 1)
+
+
+class BlockWriter(io.RawIOBase):
+    """
+        Splits everything written to it into fixed-size blocks, which a thread pool compresses independently.
+        At most two blocks per worker are held in memory at any time.
+    """
+
+    def __init__(self, file, codec, block_size=BLOCK_SIZE, workers=None):
+        super().__init__()
+        assert codec in CODECS, f'Unknown codec {codec}'
+        self.compress = CODECS[codec][0]
+        self.block_size = block_size
+        self.workers = _workers(workers)
+        self.pool = ThreadPoolExecutor(max_workers=self.workers)
+        self.pending = deque()
+        self.buffer = bytearray()
+        self.blocks = 0
+        self.fp = open(file, 'wb')
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.buffer += data
+        while len(self.buffer) >= self.block_size:
+            self._submit(bytes(self.buffer[:self.block_size]))
+            del self.buffer[:self.block_size]
+        return len(data)
+
+    def _submit(self, block):
+        self.pending.append(self.pool.submit(self.compress, block))
+        self.blocks += 1
+        while len(self.pending) > 2 * self.workers:
+            self.fp.write(self.pending.popleft().result())
+
+    def close(self):
+        if self.closed:
+            return
+        if self.buffer or self.blocks == 0:
+            self._submit(bytes(self.buffer))
+            self.buffer = bytearray()
+        while self.pending:
+            self.fp.write(self.pending.popleft().result())
+        self.fp.close()
+        self.pool.shutdown()
+        super().close()
+
+
+def _gzip_block_length(header):
+    # The member length recorded in a gzip member's header by _gzip_member, or None if it has none
+    if len(header) < GZIP_HEADER.size + BLOCK_EXTRA.size:
+        return None
+    magic, method, flags, mtime, extra_flags, os_code, extra_length = GZIP_HEADER.unpack_from(header)
+    if magic != GZIP_MAGIC or not flags & GZIP_FEXTRA or extra_length != BLOCK_EXTRA.size:
+        return None
+    field, field_length, length = BLOCK_EXTRA.unpack_from(header, GZIP_HEADER.size)
+    if field != BLOCK_FIELD or field_length != 4:
+        return None
+    return length
+
+
+class BlockReader(io.RawIOBase):
+    """
+        Reads a gzip artifact written by BlockWriter, decompressing up to two blocks per worker ahead of the reader.
+    """
+
+    def __init__(self, file, workers=None):
+        super().__init__()
+        self.file = file
+        self.fp = open(file, 'rb')
+        self.workers = _workers(workers)
+        self.pool = ThreadPoolExecutor(max_workers=self.workers)
+        self.pending = deque()
+        self.finished = False
+        self.current = memoryview(b'')
+
+    def readable(self):
+        return True
+
+    def _fill(self):
+        while not self.finished and len(self.pending) < 2 * self.workers:
+            header = self.fp.read(GZIP_HEADER.size + BLOCK_EXTRA.size)
+            if not header:
+                self.finished = True
+                break
+            length = _gzip_block_length(header)
+            assert length is not None, f'Corrupted block in {self.file}'
+            member = header + self.fp.read(length - len(header))
+            self.pending.append(self.pool.submit(gzip.decompress, member))
+
+    def readinto(self, target):
+        while len(self.current) == 0:
+            self._fill()
+            if not self.pending:
+                return 0
+            self.current = memoryview(self.pending.popleft().result())
+        size = min(len(target), len(self.current))
+        target[:size] = self.current[:size]
+        self.current = self.current[size:]
+        return size
+
+    def close(self):
+        if self.closed:
+            return
+        self.fp.close()
+        self.pool.shutdown(cancel_futures=True)
+        super().close()
+
+
+def detect_codec(file):
+    # The codec an artifact was written with, from its magic bytes
+    with open(file, 'rb') as fp:
+        head = fp.read(len(XZ_MAGIC))
+    if head.startswith(GZIP_MAGIC):
+        return 'gzip'
+    if head.startswith(BZ2_MAGIC):
+        return 'bz2'
+    if head.startswith(XZ_MAGIC):
+        return 'lzma'
+    return 'none'
+
+
+def open_artifact(file, mode='rb', codec=None, workers=None):
+    # Binary file object for an artifact. Reading detects the codec; writing uses the given codec, or the one
+    # configured for the artifact's path
+    if mode == 'rb':
+        codec = detect_codec(file)
+        if codec == 'gzip':
+            with open(file, 'rb') as fp:
+                if _gzip_block_length(fp.read(GZIP_HEADER.size + BLOCK_EXTRA.size)) is not None:
+                    return io.BufferedReader(BlockReader(file, workers=workers), buffer_size=1 << 16)
+        if codec == 'none':
+            return open(file, 'rb')
+        return CODECS[codec][1](file, 'rb')
+    assert mode == 'wb', f'Invalid mode {mode}'
+    if codec is None:
+        codec = artifact_codec(file)
+    if codec == 'none':
+        return open(file, 'wb')
+    return io.BufferedWriter(BlockWriter(file, codec, workers=workers), buffer_size=1 << 16)
@@ -17,8 +17,24 @@ pos_map_reverse = {
 
 seed = 42
 
-import torch
-device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
+_device = None
+
+
+def get_device():
+    # torch is only imported once a device is actually needed
+    global _device
+    if _device is None:
+        import torch
+        _device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
+    return _device
+
+
+def __getattr__(name):
+    # Keeps `from python.common.global_variables import device` working, resolved on first use
+    if name == 'device':
+        return get_device()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 BATCH_SIZE = 32
 EARLY_STOPPING = 8
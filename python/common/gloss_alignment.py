@@ -0,0 +1,89 @@
+MAX_ALIGNMENT_COST = 100000
+MERGEABLE_GAPS = {' ', '-', ''}
+
+
+def _align_from(tokens, raw_string, offset):
+    # Aligns lowercased tokens to the lowercased raw_string from offset, each at its first occurrence after the
+    # previous token; None if they do not align
+    annotated_tokens = []
+    current_offset = offset
+    for (token, sense) in tokens:
+        current_offset = raw_string.find(token, current_offset)
+        if current_offset < 0:
+            return None
+        end_offset = current_offset + len(token)
+        annotated_tokens.append((token, sense, current_offset, end_offset))
+        current_offset = end_offset
+    return annotated_tokens
+
+
+class SentenceAligner:
+    """
+        Finds the first ordering of a gloss's sentences, in itertools.permutations order, whose concatenated tokens
+        align to the raw gloss, without trying the orderings one by one. Each sentence is anchored on its own: the
+        greedy alignment of a sentence from a given offset is computed once, and as aligning from later offsets can only
+        end later (or fail), a search state (sentences left, offset) fails as soon as any sentence left cannot align
+        from its offset. Failed states are remembered, so the search is bounded by the distinct states rather than the
+        number of orderings. The cost is the number of sentence alignments made.
+    """
+
+    def __init__(self, sentences, raw_string, max_cost=MAX_ALIGNMENT_COST):
+        self.sentences = sentences
+        self.raw_string = raw_string.lower()
+        self.tokens = [[(token.lower(), sense) for (token, sense) in tokens] for (tokens, code) in sentences]
+        self.max_cost = max_cost
+        self.cost = 0
+        self.alignments = {}  # (sentence, offset) -> annotated tokens, or None
+        self.failed_states = set()
+
+    def _align(self, i, offset):
+        key = (i, offset)
+        if key not in self.alignments:
+            self.cost += 1
+            self.alignments[key] = _align_from(self.tokens[i], self.raw_string, offset)
+        return self.alignments[key]
+
+    def _search(self, remaining, offset):
+        # The alignments of the remaining sentences (a tuple of indices, in order) from offset, in the first ordering
+        # that aligns; None if none does
+        if not remaining:
+            return []
+        if (remaining, offset) in self.failed_states or self.cost > self.max_cost:
+            return None
+        if all(self._align(i, offset) is not None for i in remaining):
+            for i in remaining:
+                aligned = self._align(i, offset)
+                end_offset = aligned[-1][3] if aligned else offset
+                rest = self._search(tuple(j for j in remaining if j != i), end_offset)
+                if rest is not None:
+                    return [(i, aligned)] + rest
+        self.failed_states.add((remaining, offset))
+        return None
+
+    def align(self):
+        # Returns the ordering of sentences and the flat annotated tokens, or (sentences, None) if no ordering aligns or
+        # the search exceeds max_cost
+        result = self._search(tuple(range(len(self.sentences))), 0)
+        if result is None:
+            return list(self.sentences), None
+        ordering = [self.sentences[i] for (i, aligned) in result]
+        return ordering, [token for (i, aligned) in result for token in aligned]
+
+    @property
+    def exhausted(self):
+        return self.cost > self.max_cost
+
+
+def merge_same_sense(sentence, raw_string):
+    # Merges runs of consecutive annotated tokens with the same sense that are separated by a space, a hyphen or
+    # nothing into single tokens spanning them, in one sweep
+    merged = []
+    for (token, sense, start_index, end_index) in sentence:
+        if merged:
+            (previous_token, previous_sense, previous_start, previous_end) = merged[-1]
+            if previous_sense is not None and previous_sense == sense and \
+                    raw_string[previous_end:start_index] in MERGEABLE_GAPS:
+                merged[-1] = (raw_string[previous_start:end_index], sense, previous_start, end_index)
+                continue
+        merged.append((token, sense, start_index, end_index))
+    return merged
@@ -0,0 +1,204 @@
+import atexit
+import functools
+import glob
+import json
+import os
+import resource
+import sys
+import time
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+
+from python.common.common import info, io_listeners
+
+REPORT_DIR = 'bin/reports'
+
+REPORT_VERSION = 1
+REPORTS_KEPT = 20  # Per script; older reports are removed as new ones are saved
+
+_report = None
+
+
+def _peak_rss_mb():
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':
+        peak /= 1024
+    return peak / 1024
+
+
+def _size(path):
+    if os.path.isfile(path):
+        return os.path.getsize(path)
+    total = 0
+    for root, _, files in os.walk(path):
+        for file in files:
+            total += os.path.getsize(os.path.join(root, file))
+    return total
+
+
+def _script_name():
+    main = sys.modules['__main__']
+    if not hasattr(main, '__file__'):
+        return 'interactive'
+    path = os.path.relpath(os.path.abspath(main.__file__), os.path.abspath('python'))
+    return os.path.splitext(path)[0]
+
+
+class RunReport:
+    """
+        Timings, counters, peak memory and artifact I/O for one script run, written as JSON to bin/reports on exit.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.started = datetime.now()
+        self.start_time = time.perf_counter()
+        self.timers = {}
+        self.counters = {}
+        self.io = {'read': {'files': 0, 'bytes': 0}, 'write': {'files': 0, 'bytes': 0}}
+        self.annotations = {}
+
+        io_listeners.append(self._listen)
+        atexit.register(self.save)
+
+    def _listen(self, mode, file):
+        self.io[mode]['files'] += 1
+        if os.path.exists(file):
+            self.io[mode]['bytes'] += _size(file)
+
+    @contextmanager
+    def timer(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            entry = self.timers.setdefault(name, {'calls': 0, 'seconds': 0.0, 'max_seconds': 0.0})
+            entry['calls'] += 1
+            entry['seconds'] += seconds
+            entry['max_seconds'] = max(entry['max_seconds'], seconds)
+            entry['peak_rss_mb'] = _peak_rss_mb()
+
+    def count(self, name, n=1):
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def annotate(self, key, value):
+        self.annotations[key] = value
+
+    def to_dict(self):
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        return {
+            'report_version': REPORT_VERSION,
+            'name': self.name,
+            'started': self.started.isoformat(timespec='seconds'),
+            'argv': sys.argv,
+            'status': 'failed' if hasattr(sys, 'last_type') else 'ok',
+            'wall_seconds': time.perf_counter() - self.start_time,
+            'cpu_seconds': usage.ru_utime + usage.ru_stime,
+            'peak_rss_mb': _peak_rss_mb(),
+            'io': self.io,
+            'timers': self.timers,
+            'counters': self.counters,
+            'annotations': self.annotations
+        }
+
+    def save(self):
+        # Written with plain json rather than save_json, so that reports are not themselves counted as stage outputs
+        os.makedirs(REPORT_DIR, exist_ok=True)
+        file = os.path.join(REPORT_DIR, f'{self.name.replace("/", ".")}.{self.started.strftime("%Y%m%d-%H%M%S")}.json')
+        with open(file, 'w') as fp:
+            json.dump(self.to_dict(), fp, indent=4)
+        info(f'Run report saved to {file}')
+        for old_file in _report_files(self.name)[:-REPORTS_KEPT]:
+            os.remove(old_file)
+
+
+def run_report(name=None):
+    # The report for this run, started on first use by a script's main block (or its Stage); name defaults to the
+    # script's path under python/
+    global _report
+    if _report is None:
+        _report = RunReport(name if name is not None else _script_name())
+    return _report
+
+
+def timer(name):
+    # Times a block in this run's report; like count and annotate, a no-op if no report was started (as when a script's
+    # functions are imported)
+    if _report is None:
+        return nullcontext()
+    return _report.timer(name)
+
+
+def timed(name=None):
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with timer(name if name is not None else function.__qualname__):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def count(name, n=1):
+    if _report is not None:
+        _report.count(name, n)
+
+
+def annotate(key, value):
+    if _report is not None:
+        _report.annotate(key, value)
+
+
+def _report_files(name):
+    # Oldest first, as the timestamps in the names sort chronologically
+    return sorted(glob.glob(os.path.join(REPORT_DIR, f'{name.replace("/", ".")}.*.json')))
+
+
+def latest_reports(name, n=2):
+    return _report_files(name)[-n:]
+
+
+def _change(old, new):
+    if old == 0:
+        return ''
+    return f'{100 * (new - old) / old:+.1f}%'
+
+
+def compare_reports(file_1, file_2):
+    with open(file_1, 'r') as fp:
+        report_1 = json.load(fp)
+    with open(file_2, 'r') as fp:
+        report_2 = json.load(fp)
+
+    rows = [
+        ('wall seconds', report_1['wall_seconds'], report_2['wall_seconds']),
+        ('cpu seconds', report_1['cpu_seconds'], report_2['cpu_seconds']),
+        ('peak rss (MB)', report_1['peak_rss_mb'], report_2['peak_rss_mb'])
+    ]
+    for mode in ['read', 'write']:
+        rows.append((f'bytes {mode}', report_1['io'][mode]['bytes'], report_2['io'][mode]['bytes']))
+    for name in sorted(set(report_1['timers']) | set(report_2['timers'])):
+        rows.append((f'timer {name}', report_1['timers'].get(name, {}).get('seconds', 0),
+                     report_2['timers'].get(name, {}).get('seconds', 0)))
+    for name in sorted(set(report_1['counters']) | set(report_2['counters'])):
+        rows.append((f'counter {name}', report_1['counters'].get(name, 0), report_2['counters'].get(name, 0)))
+
+    width = max(len(row[0]) for row in rows)
+    print(f'{"":{width}}  {report_1["started"]:>20}  {report_2["started"]:>20}')
+    for label, old, new in rows:
+        print(f'{label:{width}}  {old:>20.3f}  {new:>20.3f}  {_change(old, new):>8}')
+
+
+if __name__ == '__main__':
+    # python -m python.common.instrumentation compare <report_1> <report_2>
+    # python -m python.common.instrumentation compare <script name>   (the two most recent reports for that script)
+    assert len(sys.argv) in {3, 4} and sys.argv[1] == 'compare', \
+        'Usage: python -m python.common.instrumentation compare (<report_1> <report_2> | <script name>)'
+    if len(sys.argv) == 4:
+        compare_reports(sys.argv[2], sys.argv[3])
+    else:
+        reports = latest_reports(sys.argv[2])
+        assert len(reports) == 2, f'Fewer than two reports for {sys.argv[2]} in {REPORT_DIR}'
+        compare_reports(*reports)
@@ -0,0 +1,45 @@
+import importlib
+
+
+class LazyModule:
+    """
+        Stands in for a module (or an attribute of one), importing it the first time anything is looked up on it.
+        Heavy dependencies imported this way cost nothing for scripts that never use them.
+    """
+
+    def __init__(self, name, attribute=None):
+        self._name = name
+        self._attribute = attribute
+        self._module = None
+
+    def _load(self):
+        if self._module is None:
+            module = importlib.import_module(self._name)
+            self._module = getattr(module, self._attribute) if self._attribute is not None else module
+        return self._module
+
+    def __getattr__(self, name):
+        return getattr(self._load(), name)
+
+    def __call__(self, *args, **kwargs):
+        return self._load()(*args, **kwargs)
+
+    def __repr__(self):
+        target = self._name if self._attribute is None else f'{self._name}.{self._attribute}'
+        return f'<lazy {target} ({"loaded" if self._module is not None else "not loaded"})>'
+
+
+def lazy_import(name, attribute=None):
+    return LazyModule(name, attribute)
+
+
+wordnet = lazy_import('nltk.corpus', 'wordnet')
+sklearn_metrics = lazy_import('sklearn.metrics')
+inter_rater = lazy_import('statsmodels.stats.inter_rater')
+wordnet_snapshot = lazy_import('python.common.wordnet_snapshot')
+
+
+def wordnet_error():
+    # For except clauses, which are only evaluated once an exception is being handled
+    from nltk.corpus.reader import WordNetError
+    return WordNetError
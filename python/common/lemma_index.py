@@ -0,0 +1,135 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from python.common.common import info, warn, open_pickle, save_pickle
+from python.common.global_variables import pos_map
+from python.common.lazy import wordnet_error
+from python.common.stage_cache import hash_path
+from python.common.wordnet_snapshot import SNAPSHOT_DIR, open_wordnet_snapshot
+
+INDEX_FILE = 'bin/indices/lemmas.pkl'
+INDEX_VERSION = 1
+SHARD_SIZE = 8192  # Synsets per task
+
+
+class _Shard:
+    """
+        Indexes contiguous ranges of synsets; one per worker process. The snapshot's columns are read as plain lists,
+        as element access through numpy.memmap is slow.
+    """
+
+    def __init__(self):
+        self.wn = open_wordnet_snapshot()
+        self.synset_pos = [pos_map[chr(code)] for code in np.asarray(self.wn.synset_pos).tolist()]
+        self.synset_lemma_start = np.asarray(self.wn.synset_lemma_start).tolist()
+        self.lemma_synset = np.asarray(self.wn.lemma_synset).tolist()
+        self.lemma_key = np.asarray(self.wn.lemma_key).tolist()
+        self.lemma_key_valid = np.asarray(self.wn.lemma_key_valid).tolist()
+        self.forms = {}  # lowercased lemma name -> POS -> its valid keys, in wn.lemmas order
+
+    def key_valid(self, row, key):
+        # Whether wn.lemma_from_key accepts the key; read from the snapshot unless the lookup would go elsewhere
+        if key == key.lower():
+            return bool(self.lemma_key_valid[row])
+        try:
+            self.wn.lemma_from_key(key)
+            return True
+        except wordnet_error():
+            return False
+
+    def ordered_senses(self, wordform, pos):
+        if wordform not in self.forms:
+            ordered = {}
+            for lemma in self.wn.lemmas(wordform):
+                sense_ids = ordered.setdefault(self.synset_pos[self.lemma_synset[lemma.row]], {})
+                key = lemma.key()
+                if key not in sense_ids and self.key_valid(lemma.row, key):
+                    sense_ids[key] = None
+            self.forms[wordform] = {lemma_pos: list(sense_ids) for lemma_pos, sense_ids in ordered.items()}
+        return self.forms[wordform].get(pos, [])
+
+    def index(self, rows):
+        encountered = {}  # lemma ID -> valid keys, in order
+        ordered = {}  # lemma ID -> the same keys, in wn.lemmas order
+        synsets = {}  # synset -> (sense key, lemma name) of each of its lemmas
+        for row in rows:
+            pos = self.synset_pos[row]
+            senses = []
+            for lemma_row in range(self.synset_lemma_start[row], self.synset_lemma_start[row + 1]):
+                sense_id = self.wn.lemma_keys[self.lemma_key[lemma_row]]
+                wordform = self.wn.lemma_names[self.wn.lemma_name[lemma_row]]
+                senses.append((sense_id, wordform))
+
+                if self.key_valid(lemma_row, sense_id):
+                    lemma_id = f'{wordform.lower()}:{pos}:1'
+                    encountered.setdefault(lemma_id, []).append(sense_id)
+                    if lemma_id not in ordered:
+                        ordered[lemma_id] = self.ordered_senses(wordform.lower(), pos)
+                else:
+                    warn(f'{sense_id} not safe; skipping')
+            synsets[self.wn.synset_names[row]] = senses
+        return encountered, ordered, synsets
+
+
+_shard = None
+
+
+def _index_shard(rows):
+    # The _Shard is made once per process and reused for all of its tasks, sharing the columns and the forms cache
+    global _shard
+    if _shard is None:
+        _shard = _Shard()
+    return _shard.index(rows)
+
+
+def build_lemma_index(jobs=None):
+    # One pass over WordNet, in shards of synsets that are merged in all_synsets() order, so the result does not
+    # depend on the number of workers. lemmas_to_senses maps 'wordform:pos:1' to its sense keys in wn.lemmas order,
+    # with lemma IDs in order of first appearance; synsets maps each synset to its lemmas' (sense key, name) pairs
+    wn = open_wordnet_snapshot()
+    info('Building lemma index')
+    num_synsets = len(wn.synset_names)
+    shards = [range(start, min(start + SHARD_SIZE, num_synsets)) for start in range(0, num_synsets, SHARD_SIZE)]
+    jobs = jobs if jobs is not None else os.cpu_count() or 1
+    if jobs <= 1 or len(shards) <= 1:
+        results = list(map(_index_shard, shards))
+    else:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(shards))) as executor:
+            results = list(executor.map(_index_shard, shards))
+
+    lemmas_to_senses = {}
+    encountered = {}
+    synsets = {}
+    for shard_encountered, shard_ordered, shard_synsets in results:
+        for lemma_id, sense_ids in shard_encountered.items():
+            encountered.setdefault(lemma_id, set()).update(sense_ids)
+            if lemma_id not in lemmas_to_senses:
+                lemmas_to_senses[lemma_id] = shard_ordered[lemma_id]
+        synsets.update(shard_synsets)
+
+    for lemma_id, sense_ids_ordered in lemmas_to_senses.items():
+        assert set(sense_ids_ordered) == encountered[lemma_id], f'{sense_ids_ordered} != {encountered[lemma_id]}'
+        assert len(sense_ids_ordered) == len(set(sense_ids_ordered))
+    return {'lemmas_to_senses': lemmas_to_senses, 'synsets': synsets}
+
+
+_index = None
+
+
+def lemma_index(file=INDEX_FILE):
+    # Shared index, (re)built when missing or made from a different WordNet snapshot
+    global _index
+    if _index is None:
+        open_wordnet_snapshot()
+        header = {'index_version': INDEX_VERSION, 'snapshot': hash_path(SNAPSHOT_DIR)}
+        if os.path.isfile(file):
+            file_header, index = open_pickle(file)
+            if file_header == header:
+                _index = index
+        if _index is None:
+            _index = build_lemma_index()
+            os.makedirs(os.path.dirname(file), exist_ok=True)
+            save_pickle(file, (header, _index))
+    return _index
@@ -0,0 +1,76 @@
+import string
+from collections import deque
+
+WORD_CHARACTERS = set(string.ascii_letters)
+
+
+class PatternMatcher:
+    """
+        Aho-Corasick automaton over a fixed list of patterns, which finds every occurrence of every pattern in a text in
+        one pass over it. Patterns are matched as given, so callers lowercase both sides for case-insensitive matching.
+    """
+
+    def __init__(self, patterns):
+        self.patterns = list(patterns)
+        self.transitions = [{}]  # state -> character -> state
+        self.outputs = [[]]  # state -> indices of the patterns ending at that state (including through fail links)
+        self.fail = [0]
+        self.empty = [i for i, pattern in enumerate(self.patterns) if pattern == '']
+
+        for i, pattern in enumerate(self.patterns):
+            if pattern == '':
+                continue
+            state = 0
+            for character in pattern:
+                if character not in self.transitions[state]:
+                    self.transitions[state][character] = len(self.transitions)
+                    self.transitions.append({})
+                    self.outputs.append([])
+                    self.fail.append(0)
+                state = self.transitions[state][character]
+            self.outputs[state].append(i)
+
+        # Breadth-first, so that each state's fail state is complete before its children's are found
+        queue = deque(self.transitions[0].values())
+        while queue:
+            state = queue.popleft()
+            for character, child in self.transitions[state].items():
+                queue.append(child)
+                fallback = self.fail[state]
+                while fallback and character not in self.transitions[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[child] = self.transitions[fallback].get(character, 0)
+                self.outputs[child] = self.outputs[child] + self.outputs[self.fail[child]]
+
+    def occurrences(self, text):
+        # Yields (start, end, pattern index) for every occurrence, in order of end position
+        for i in self.empty:
+            yield 0, 0, i
+        state = 0
+        for position, character in enumerate(text):
+            while state and character not in self.transitions[state]:
+                state = self.fail[state]
+            state = self.transitions[state].get(character, 0)
+            for i in self.outputs[state]:
+                yield position + 1 - len(self.patterns[i]), position + 1, i
+
+    def first_occurrences(self, text):
+        # Pattern index -> start of its first occurrence (as str.find), for the patterns that occur in text
+        first = {}
+        for start, end, i in self.occurrences(text):
+            if i not in first:
+                first[i] = start
+        return first
+
+    def matched(self, text):
+        # Indices of the patterns that occur in text (as the in operator)
+        return set(self.first_occurrences(text).keys())
+
+
+def expand_to_word(text, start, end, characters=WORD_CHARACTERS):
+    # Widens [start, end) outwards over any adjoining word characters
+    while start > 0 and text[start-1] in characters:
+        start -= 1
+    while end < len(text) and text[end] in characters:
+        end += 1
+    return start, end
@@ -0,0 +1,116 @@
+import os
+from collections import namedtuple
+from functools import lru_cache
+
+import numpy as np
+
+from python.common.common import info, open_json, save_json, staged_directory
+from python.common.string_table import StringTableBuilder, StringTable
+
+INDEX_DIR = 'bin/indices/sense_keys'
+INDEX_VERSION = 1
+CACHE_SIZE = 1 << 16
+
+SenseKeyEntry = namedtuple('SenseKeyEntry', ['synset', 'lemma_name', 'pos'])
+
+
+def build_sense_key_index(directory=INDEX_DIR):
+    # One pass over WordNet; every lemma is indexed under its own key(), so keys that wn.lemma_from_key cannot
+    # resolve (and that safe_lemma_from_key would otherwise find by scanning synsets) are resolved here once
+    from python.common.wordnet_snapshot import open_wordnet_snapshot
+    wn = open_wordnet_snapshot()
+
+    info(f'Building sense key index in {directory}')
+    entries = {}
+    for synset in wn.all_synsets():
+        for lemma in synset.lemmas():
+            entries[lemma.key()] = (synset.name(), lemma.name(), synset.pos())
+    keys = sorted(entries.keys())
+
+    tables = {name: StringTableBuilder() for name in ['keys', 'synsets', 'lemma_names', 'pos']}
+    columns = {name: [] for name in ['synsets', 'lemma_names', 'pos']}
+    for key in keys:
+        tables['keys'].add(key)
+        for name, value in zip(['synsets', 'lemma_names', 'pos'], entries[key]):
+            columns[name].append(tables[name].add(value))
+
+    with staged_directory(directory) as staging:
+        for name, table in tables.items():
+            table.save(staging, name)
+        for name, values in columns.items():
+            np.save(os.path.join(staging, f'key_{name}.npy'), np.array(values, dtype=np.int32))
+        save_json(os.path.join(staging, 'index.json'), {
+            'index_version': INDEX_VERSION,
+            'wordnet_version': wn.get_version(),
+            'num_keys': len(keys)
+        })
+
+
+class SenseKeyIndex:
+    """
+        On-disk map from WordNet sense key to (synset name, lemma name, POS), searched in place over memory-mapped
+        sorted keys. Hot keys are served from a bounded LRU cache; cache_info() reports its hits and misses.
+    """
+
+    def __init__(self, directory=INDEX_DIR):
+        header = open_json(os.path.join(directory, 'index.json'))
+        assert header['index_version'] == INDEX_VERSION, f'Unsupported sense key index in {directory}'
+        self.wordnet_version = header['wordnet_version']
+
+        self.keys = StringTable(directory, 'keys')
+        self.tables = {name: StringTable(directory, name) for name in ['synsets', 'lemma_names', 'pos']}
+        self.columns = {name: np.load(os.path.join(directory, f'key_{name}.npy'), mmap_mode='r')
+                        for name in ['synsets', 'lemma_names', 'pos']}
+        self.lookup = lru_cache(maxsize=CACHE_SIZE)(self._lookup)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __contains__(self, key):
+        return self._row(key) >= 0
+
+    def _find(self, key):
+        return self.keys.find_sorted(key)
+
+    def _row(self, key):
+        # Keys are matched exactly, then in lower case as wn.lemma_from_key matches them
+        row = self._find(key)
+        if row < 0:
+            row = self._find(key.lower())
+        return row
+
+    def _lookup(self, key):
+        row = self._row(key)
+        if row < 0:
+            raise KeyError(key)
+        return SenseKeyEntry(*[self.tables[name][self.columns[name][row]] for name in ['synsets', 'lemma_names', 'pos']])
+
+    def cache_info(self):
+        return self.lookup.cache_info()
+
+
+_index = None
+
+
+def sense_key_index(directory=INDEX_DIR):
+    # Shared index, built from WordNet the first time it is needed
+    global _index
+    if _index is None:
+        if not os.path.isfile(os.path.join(directory, 'index.json')):
+            build_sense_key_index(directory)
+        _index = SenseKeyIndex(directory)
+    return _index
+
+
+def lookup_sense_key(key):
+    return sense_key_index().lookup(key)
+
+
+def lookup_sense_keys(keys):
+    # Batched lookups, made in key order so the binary searches walk the memory-mapped keys front to back
+    index = sense_key_index()
+    return {key: index.lookup(key) for key in sorted(set(keys))}
+
+
+def sense_key_synset(key):
+    return lookup_sense_key(key).synset
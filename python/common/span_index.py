@@ -0,0 +1,188 @@
+import os
+import sys
+from collections import Counter, namedtuple
+
+import numpy as np
+
+from python.common.common import info, warn, open_json, open_pickle, save_json, staged_directory
+from python.common.stage_cache import hash_path
+from python.common.string_table import StringTableBuilder, StringTable
+
+INDEX_DIR = 'bin/indices/spans'
+INDEX_VERSION = 1
+
+KINDS = ['definition', 'example']
+SOURCES = {
+    'definition': 'bin/collection/concepts_to_definitions.pkl',
+    'example': 'bin/collection/example_sentences_princeton.pkl'
+}
+
+Posting = namedtuple('Posting', ['concept', 'kind', 'number', 'start', 'end'])
+
+
+def _source_hashes():
+    return {kind: hash_path(file) for kind, file in SOURCES.items()}
+
+
+def build_span_index(directory=INDEX_DIR):
+    # Sentences are numbered definitions first, then examples, each in concept order. Postings are grouped by sense
+    # key (in key order) and, within a key, ordered by sentence and offset
+    from python.common.sense_key_index import sense_key_index
+
+    info(f'Building span index in {directory}')
+    concepts = StringTableBuilder()
+    sentences = {name: [] for name in ['concept', 'kind', 'number']}
+    spans = []
+
+    definitions = open_pickle(SOURCES['definition'])
+    examples = open_pickle(SOURCES['example'])
+    for kind, annotated_strings in [('definition', {concept: [definition] for concept, definition in definitions.items()}),
+                                    ('example', examples)]:
+        for concept in sorted(annotated_strings.keys()):
+            for number, annotated_string in enumerate(annotated_strings[concept]):
+                row = len(sentences['concept'])
+                sentences['concept'].append(concepts.add(concept))
+                sentences['kind'].append(KINDS.index(kind))
+                sentences['number'].append(number)
+                spans.extend((sense_key, row, start, end) for (start, end, sense_key) in annotated_string.senses)
+
+    keys = StringTableBuilder()
+    for sense_key in sorted({span[0] for span in spans}):
+        keys.add(sense_key)
+    spans.sort(key=lambda span: (keys.ids[span[0]], span[1], span[2]))
+
+    columns = {
+        'sentence_concept': (np.int32, sentences['concept']),
+        'sentence_kind': (np.uint8, sentences['kind']),
+        'sentence_number': (np.int32, sentences['number']),
+        'posting_sentence': (np.int32, [span[1] for span in spans]),
+        'posting_start': (np.int32, [span[2] for span in spans]),
+        'posting_end': (np.int32, [span[3] for span in spans])
+    }
+    key_ids = np.array([keys.ids[span[0]] for span in spans], dtype=np.int64)
+    columns['key_posting_start'] = (np.int64, np.searchsorted(key_ids, np.arange(len(keys) + 1)))
+
+    # Distinct keys of each sentence, for co-citation
+    sentence_keys = [set() for _ in sentences['concept']]
+    for span in spans:
+        sentence_keys[span[1]].add(keys.ids[span[0]])
+    columns['sentence_key_start'] = (np.int64, np.cumsum([0] + [len(ids) for ids in sentence_keys]))
+    columns['sentence_keys'] = (np.int32, [key_id for ids in sentence_keys for key_id in sorted(ids)])
+
+    # Keys of each synset that are cited anywhere
+    index = sense_key_index()
+    synset_keys = {}
+    for key_id, sense_key in enumerate(keys.strings):
+        try:
+            synset_keys.setdefault(index.lookup(sense_key).synset, []).append(key_id)
+        except KeyError:
+            warn(f'Cited sense key {sense_key} is not in WordNet')
+    synsets = StringTableBuilder()
+    for synset in sorted(synset_keys.keys()):
+        synsets.add(synset)
+    columns['synset_key_start'] = (np.int64, np.cumsum([0] + [len(synset_keys[synset]) for synset in synsets.strings]))
+    columns['synset_keys'] = (np.int32, [key_id for synset in synsets.strings for key_id in synset_keys[synset]])
+
+    with staged_directory(directory) as staging:
+        for name, table in [('concepts', concepts), ('keys', keys), ('synsets', synsets)]:
+            table.save(staging, name)
+        for name, (dtype, values) in columns.items():
+            np.save(os.path.join(staging, f'{name}.npy'), np.asarray(values, dtype=dtype))
+        save_json(os.path.join(staging, 'index.json'), {
+            'index_version': INDEX_VERSION,
+            'sources': _source_hashes(),
+            'num_sentences': len(sentences['concept']),
+            'num_postings': len(spans)
+        })
+
+
+class SpanIndex:
+    """
+        Inverted index from the sense keys (and synsets) cited in WordNet's tagged glosses to where they are cited:
+        the concept, whether in its definition or an example (and which), and the character offsets. Keys and synsets
+        are found by binary search over memory-mapped sorted tables, and postings are contiguous slices.
+    """
+
+    def __init__(self, directory=INDEX_DIR):
+        self.header = open_json(os.path.join(directory, 'index.json'))
+        assert self.header['index_version'] == INDEX_VERSION, f'Unsupported span index in {directory}'
+
+        for name in ['concepts', 'keys', 'synsets']:
+            setattr(self, name, StringTable(directory, name))
+        for name in ['sentence_concept', 'sentence_kind', 'sentence_number', 'posting_sentence', 'posting_start',
+                     'posting_end', 'key_posting_start', 'sentence_key_start', 'sentence_keys', 'synset_key_start',
+                     'synset_keys']:
+            setattr(self, name, np.load(os.path.join(directory, f'{name}.npy'), mmap_mode='r'))
+
+    def _key_rows(self, sense_key):
+        key_id = self.keys.find_sorted(sense_key)
+        if key_id < 0:
+            return range(0)
+        return range(int(self.key_posting_start[key_id]), int(self.key_posting_start[key_id + 1]))
+
+    def _posting(self, row):
+        sentence = self.posting_sentence[row]
+        return Posting(self.concepts[self.sentence_concept[sentence]], KINDS[self.sentence_kind[sentence]],
+                       int(self.sentence_number[sentence]), int(self.posting_start[row]), int(self.posting_end[row]))
+
+    def postings(self, sense_key):
+        return [self._posting(row) for row in self._key_rows(sense_key)]
+
+    def synset_keys_cited(self, synset):
+        synset_id = self.synsets.find_sorted(synset)
+        if synset_id < 0:
+            return []
+        start, end = self.synset_key_start[synset_id:synset_id + 2]
+        return [self.keys[key_id] for key_id in self.synset_keys[start:end]]
+
+    def synset_postings(self, synset):
+        return [posting for sense_key in self.synset_keys_cited(synset) for posting in self.postings(sense_key)]
+
+    def glosses_citing(self, sense_key):
+        # Concepts whose definition cites sense_key
+        return sorted({posting.concept for posting in self.postings(sense_key) if posting.kind == 'definition'})
+
+    def examples_citing(self, sense_key):
+        # (concept, example number) of every example that cites sense_key
+        return sorted({(posting.concept, posting.number) for posting in self.postings(sense_key)
+                       if posting.kind == 'example'})
+
+    def co_cited(self, sense_key):
+        # Other sense keys cited in the same sentences as sense_key, with the number of sentences they share
+        key_id = self.keys.find_sorted(sense_key)
+        counts = Counter()
+        for sentence in sorted({int(self.posting_sentence[row]) for row in self._key_rows(sense_key)}):
+            start, end = self.sentence_key_start[sentence:sentence + 2]
+            counts.update(self.keys[other] for other in self.sentence_keys[start:end] if other != key_id)
+        return counts
+
+
+_index = None
+
+
+def span_index(directory=INDEX_DIR):
+    # Shared index, (re)built from the definition and example pickles when missing, out of date or in an older layout
+    global _index
+    if _index is None:
+        header_file = os.path.join(directory, 'index.json')
+        header = open_json(header_file) if os.path.isfile(header_file) else {}
+        if header.get('index_version') != INDEX_VERSION or header.get('sources') != _source_hashes():
+            build_span_index(directory)
+        _index = SpanIndex(directory)
+    return _index
+
+
+if __name__ == '__main__':
+    # python -m python.common.span_index (glosses | examples | cocited) <sense key>
+    assert len(sys.argv) == 3 and sys.argv[1] in {'glosses', 'examples', 'cocited'}, \
+        'Usage: python -m python.common.span_index (glosses | examples | cocited) <sense key>'
+    query, sense_key = sys.argv[1:]
+    if query == 'glosses':
+        for concept in span_index().glosses_citing(sense_key):
+            print(concept)
+    elif query == 'examples':
+        for concept, number in span_index().examples_citing(sense_key):
+            print(f'{concept}\t{number}')
+    else:
+        for other, count in span_index().co_cited(sense_key).most_common():
+            print(f'{other}\t{count}')
@@ -0,0 +1,148 @@
+import glob
+import hashlib
+import inspect
+import json
+import os
+import sys
+
+from python.common.common import info, io_listeners, open_json, save_json
+from python.common.instrumentation import run_report
+
+CACHE_DIR = 'bin/stage_cache'
+HASH_MEMO_FILE = os.path.join(CACHE_DIR, 'file_hashes.json')
+
+_hash_memo = None
+
+
+def _load_hash_memo():
+    global _hash_memo
+    if _hash_memo is None:
+        _hash_memo = open_json(HASH_MEMO_FILE) if os.path.isfile(HASH_MEMO_FILE) else {}
+    return _hash_memo
+
+
+def _save_hash_memo():
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(HASH_MEMO_FILE, 'w') as fp:
+        json.dump(_load_hash_memo(), fp)
+
+
+def hash_file(file):
+    # Content hash, memoised on (size, mtime) so that unchanged files are not re-read
+    memo = _load_hash_memo()
+    stat = os.stat(file)
+    key = os.path.normpath(file)
+    stamp = [stat.st_size, stat.st_mtime_ns]
+    if key in memo and memo[key][0] == stamp:
+        return memo[key][1]
+
+    digest = hashlib.sha256()
+    with open(file, 'rb') as fp:
+        for block in iter(lambda: fp.read(1 << 20), b''):
+            digest.update(block)
+    memo[key] = [stamp, digest.hexdigest()]
+    return memo[key][1]
+
+
+def hash_path(path):
+    # Hashes a file, every file under a directory, or every match of a glob pattern
+    if os.path.isfile(path):
+        return hash_file(path)
+    if os.path.isdir(path):
+        files = sorted(f for f in glob.glob(os.path.join(path, '**', '*'), recursive=True) if os.path.isfile(f))
+    else:
+        files = sorted(f for f in glob.glob(path, recursive=True) if os.path.isfile(f))
+    if not files:
+        return None
+    digest = hashlib.sha256()
+    for file in files:
+        digest.update(os.path.relpath(file, path if os.path.isdir(path) else '.').encode('utf-8'))
+        digest.update(hash_file(file).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def hash_functions(functions):
+    # Hashes the source of each function, for artifacts made by only part of a module
+    digest = hashlib.sha256()
+    for function in functions:
+        digest.update(inspect.getsource(function).encode('utf-8'))
+    return digest.hexdigest()
+
+
+class Stage:
+    """
+        Content-addressed cache for a pipeline stage.
+        The fingerprint covers the stage's input artifacts, its code and its parameters. Outputs are whatever the stage
+        declares plus every file it writes through the common save_* helpers. If the fingerprint matches the last run
+        and the outputs are untouched, the stage can be skipped and its previous outputs reused.
+    """
+
+    def __init__(self, name, inputs=(), outputs=(), params=None, code=None):
+        self.name = name
+        self.inputs = list(inputs)
+        self.outputs = list(outputs)
+        self.params = params if params is not None else {}
+        if code is None:
+            main = sys.modules['__main__']
+            code = [main.__file__] if hasattr(main, '__file__') else []
+        self.code = list(code)
+        self.manifest_file = os.path.join(CACHE_DIR, name.replace('/', '.') + '.json')
+
+        self._fingerprint = None
+        self._written = []
+        io_listeners.append(self._listen)
+        self.report = run_report(name)
+
+    def _listen(self, mode, file):
+        if mode == 'write' and file not in self._written:
+            self._written.append(file)
+
+    def fingerprint(self):
+        # Computed once, before the stage runs, so that it describes the inputs the outputs were built from
+        if self._fingerprint is not None:
+            return self._fingerprint
+        digest = hashlib.sha256()
+        for kind, paths in [('input', self.inputs), ('code', self.code)]:
+            for path in paths:
+                digest.update(f'{kind}:{path}:{hash_path(path)}\n'.encode('utf-8'))
+        digest.update(json.dumps(self.params, sort_keys=True, default=str).encode('utf-8'))
+        self._fingerprint = digest.hexdigest()
+        return self._fingerprint
+
+    def is_fresh(self):
+        fingerprint = self.fingerprint()
+        if not os.path.isfile(self.manifest_file):
+            return False
+        manifest = open_json(self.manifest_file)
+        if manifest['fingerprint'] != fingerprint:
+            return False
+        fresh = all(hash_path(path) == output_hash for path, output_hash in manifest['outputs'].items())
+        _save_hash_memo()
+        return fresh
+
+    def skip_if_fresh(self):
+        # Whether the stage can be skipped; it is then finished with, and the caller should not run it
+        if not self.is_fresh():
+            return False
+        self.report.annotate('cached', True)
+        info(f'Stage {self.name} is up to date; reusing cached outputs')
+        self._detach()
+        return True
+
+    def record(self):
+        fingerprint = self.fingerprint()
+        outputs = {}
+        for path in self.outputs + self._written:
+            outputs[path] = hash_path(path)
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        save_json(self.manifest_file, {
+            'name': self.name,
+            'fingerprint': fingerprint,
+            'outputs': outputs
+        })
+        _save_hash_memo()
+        self._detach()
+
+    def _detach(self):
+        if self._listen in io_listeners:
+            io_listeners.remove(self._listen)
@@ -0,0 +1,84 @@
+import mmap
+import os
+
+import numpy as np
+
+
+class StringTableBuilder:
+    """
+        Interns strings into consecutive integer IDs. None is stored as -1.
+    """
+
+    def __init__(self):
+        self.strings = []
+        self.ids = {}
+
+    def add(self, string):
+        if string is None:
+            return -1
+        string_id = self.ids.get(string)
+        if string_id is None:
+            string_id = len(self.strings)
+            self.ids[string] = string_id
+            self.strings.append(string)
+        return string_id
+
+    def __len__(self):
+        return len(self.strings)
+
+    def save(self, directory, name):
+        encoded = [s.encode('utf-8') for s in self.strings]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        if encoded:
+            offsets[1:] = np.cumsum([len(e) for e in encoded])
+        with open(os.path.join(directory, f'{name}.strings'), 'wb') as fp:
+            fp.write(b''.join(encoded))
+        np.save(os.path.join(directory, f'{name}.offsets.npy'), offsets)
+
+
+class StringTable:
+    """
+        Read-only view of a string table written by StringTableBuilder.
+        The string bytes and offsets are memory-mapped, so opening a table costs nothing until strings are read.
+    """
+
+    def __init__(self, directory, name):
+        self.offsets = np.load(os.path.join(directory, f'{name}.offsets.npy'), mmap_mode='r')
+        file = os.path.join(directory, f'{name}.strings')
+        if os.path.getsize(file) > 0:
+            with open(file, 'rb') as fp:
+                self.blob = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            self.blob = b''
+        self._ids = None
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, string_id):
+        if string_id < 0:
+            return None
+        return self.blob[int(self.offsets[string_id]):int(self.offsets[string_id+1])].decode('utf-8')
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def index(self, string):
+        # Reverse lookup; the dictionary is only built the first time it is needed
+        if self._ids is None:
+            self._ids = {s: i for i, s in enumerate(self)}
+        return self._ids.get(string, -1)
+
+    def find_sorted(self, string):
+        # Binary search, for tables whose strings were added in sorted order; -1 if absent
+        low, high = 0, len(self)
+        while low < high:
+            middle = (low + high) // 2
+            if self[middle] < string:
+                low = middle + 1
+            else:
+                high = middle
+        if low < len(self) and self[low] == string:
+            return low
+        return -1
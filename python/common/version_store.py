@@ -0,0 +1,197 @@
+import glob
+import hashlib
+import json
+import os
+
+from python.common.chainnet_export import Records, save_json_stream
+from python.common.common import info, open_json, save_json
+
+# The store is the published record of past releases, so it lives in data/ and is kept under version control; the
+# full files materialised from it are derived and can be rebuilt at any time, so they are kept with the other artifacts
+# in bin/
+STORE_DIR = 'data/versions/store'
+CACHE_DIR = 'bin/versions'
+
+FORMAT_VERSION = 1
+
+
+def _digest(parent_digest, file):
+    digest = hashlib.sha256(parent_digest.encode('utf-8'))
+    with open(file, 'rb') as fp:
+        for block in iter(lambda: fp.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _record_digest(text):
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+def _digested(records, digests, written, changed_only=False):
+    # Yields the texts of (wordform, text) records, or only of those whose digest differs if changed_only, updating
+    # digests and noting the wordforms written
+    for wordform, text in records:
+        digest = _record_digest(text)
+        if not changed_only or digests.get(wordform) != digest:
+            digests[wordform] = digest
+            written.append(wordform)
+            yield text
+
+
+class VersionStore:
+    """
+        Stores a sequence of ChainNet releases as one base snapshot plus, for each later version, a delta holding only
+        the wordform records that changed. Any version can be rebuilt by replaying the deltas onto the base.
+    """
+
+    def __init__(self, directory=STORE_DIR):
+        self.directory = directory
+        self.manifest_file = os.path.join(directory, 'manifest.json')
+        if os.path.isfile(self.manifest_file):
+            self.manifest = open_json(self.manifest_file)
+            assert self.manifest['format_version'] == FORMAT_VERSION, f'Unsupported version store in {directory}'
+        else:
+            self.manifest = {'format_version': FORMAT_VERSION, 'versions': []}
+
+        # Order and record digests of the last version added, so that successive deltas are computed without
+        # replaying the store
+        self._head = None
+
+    def versions(self):
+        return [entry['version'] for entry in self.manifest['versions']]
+
+    def __contains__(self, version):
+        return str(version) in self.versions()
+
+    def entry(self, version):
+        for entry in self.manifest['versions']:
+            if entry['version'] == str(version):
+                return entry
+        raise KeyError(version)
+
+    def clear(self):
+        for file in glob.glob(os.path.join(self.directory, '*.json')):
+            os.remove(file)
+        self.manifest = {'format_version': FORMAT_VERSION, 'versions': []}
+        self._head = None
+
+    def add_version(self, release):
+        # release is a full release dict (metadata and content)
+        content = release['content']
+        self.add_records(release['metadata'], [word['wordform'] for word in content],
+                         ((word['wordform'], json.dumps(word, indent=4)) for word in content))
+
+    def add_records(self, metadata, wordforms, records):
+        # wordforms is the release order, and records an iterable of (wordform, JSON text (indent=4)) pairs in that
+        # order, as made by chainnet_export.serialize_wordforms: of every wordform for the first version, and after that
+        # of at least those that may have changed since the last version added. Records are streamed into the store,
+        # where only those that differ from the last version are written; only their digests are kept
+        version = str(metadata['version'])
+        assert version not in self, f'Version {version} already in the store'
+        os.makedirs(self.directory, exist_ok=True)
+        wordforms = list(wordforms)
+        written = []
+
+        if not self.manifest['versions']:
+            digests = {}
+            file = os.path.join(self.directory, f'base_v{version}.json')
+            save_json_stream(file, {'metadata': metadata, 'content': Records(_digested(records, digests, written))})
+            parent_digest = ''
+        else:
+            if self._head is None:
+                self._head = self._load_head()
+            digests = dict(self._head['digests'])
+            file = os.path.join(self.directory, f'delta_v{version}.json')
+            save_json_stream(file, {
+                'metadata': metadata,
+                'changed': Records(_digested(records, digests, written, changed_only=True)),
+                'order': wordforms if wordforms != self._head['order'] else None
+            })
+            parent_digest = self.manifest['versions'][-1]['digest']
+
+        missing = [wordform for wordform in wordforms if wordform not in digests]
+        assert not missing, f'No records given for {missing[:10]}'
+        info(f'Stored ChainNet v{version} ({len(written)} records written)')
+        self.manifest['versions'].append({
+            'version': version,
+            'file': os.path.basename(file),
+            'digest': _digest(parent_digest, file)
+        })
+        save_json(self.manifest_file, self.manifest)
+        self._head = {'order': wordforms, 'digests': {wordform: digests[wordform] for wordform in wordforms}}
+
+    def _load_head(self):
+        content = self.materialize(self.versions()[-1])['content']
+        return {
+            'order': [word['wordform'] for word in content],
+            'digests': {word['wordform']: _record_digest(json.dumps(word, indent=4)) for word in content}
+        }
+
+    def materialize(self, version):
+        # Replays the deltas onto the nearest earlier version whose full file is already in the cache (or the base)
+        version = str(version)
+        assert version in self, f'Version {version} not in the store'
+        entries = self.manifest['versions']
+        target = self.versions().index(version)
+
+        start = 0
+        for i in range(target, 0, -1):
+            if self._cached_file(entries[i]['version']) is not None:
+                start = i
+                break
+        release = open_json(self._cached_file(entries[start]['version']) if start > 0 else
+                            os.path.join(self.directory, entries[0]['file']))
+
+        metadata = release['metadata']
+        words = {word['wordform']: word for word in release['content']}
+        order = [word['wordform'] for word in release['content']]
+        for entry in entries[start + 1:target + 1]:
+            data = open_json(os.path.join(self.directory, entry['file']))
+            metadata = data['metadata']
+            for word in data['changed']:
+                words[word['wordform']] = word
+            if data['order'] is not None:
+                order = data['order']
+        return {
+            'metadata': metadata,
+            'content': [words[wordform] for wordform in order]
+        }
+
+    def _cached_file(self, version, cache_dir=CACHE_DIR):
+        # The full JSON file for a version in the cache, if it was written from the store as it is now
+        file = os.path.join(cache_dir, f'chainnet_v{version}.json')
+        stamp_file = file + '.digest'
+        if os.path.isfile(file) and os.path.isfile(stamp_file):
+            with open(stamp_file, 'r') as fp:
+                if fp.read() == self.entry(version)['digest']:
+                    return file
+        return None
+
+    def materialized_file(self, version, cache_dir=CACHE_DIR):
+        # Full JSON file for a version, rebuilt only when the store has changed since it was last written
+        version = str(version)
+        file = self._cached_file(version, cache_dir=cache_dir)
+        if file is not None:
+            return file
+
+        file = os.path.join(cache_dir, f'chainnet_v{version}.json')
+        info(f'Materialising ChainNet v{version} to {file}')
+        os.makedirs(cache_dir, exist_ok=True)
+        # Written directly rather than through save_json, as the cache is not an output of whichever stage asked for it
+        with open(file, 'w') as fp:
+            json.dump(self.materialize(version), fp, indent=4)
+        with open(file + '.digest', 'w') as fp:
+            fp.write(self.entry(version)['digest'])
+        return file
+
+
+_stores = {}
+
+
+def open_version_store(directory=STORE_DIR):
+    # Shared per directory, and only read again when its manifest has changed on disk
+    manifest_file = os.path.join(directory, 'manifest.json')
+    stamp = os.stat(manifest_file).st_mtime_ns if os.path.isfile(manifest_file) else None
+    if directory not in _stores or _stores[directory][0] != stamp:
+        _stores[directory] = (stamp, VersionStore(directory))
+    return _stores[directory][1]
@@ -0,0 +1,227 @@
+import json
+import os
+
+import numpy as np
+
+from python.common.common import info, open_json, save_json, staged_directory
+from python.common.lazy import wordnet_error
+from python.common.string_table import StringTableBuilder, StringTable
+
+SNAPSHOT_DIR = 'bin/indices/wordnet'
+SNAPSHOT_VERSION = 1
+
+STRING_TABLES = ['synset_names', 'lexnames', 'definitions', 'examples', 'lemma_keys', 'lemma_names', 'lemma_forms']
+
+COLUMNS = {
+    'synset_pos': np.uint8,
+    'synset_lexname': np.int16,
+    'synset_definition': np.int32,
+    'synset_examples': np.int32,
+    'synset_lemma_start': np.int32,
+    'synset_instance_start': np.int32,
+    'instance_hypernyms': np.int32,
+    'lemma_name': np.int32,
+    'lemma_key': np.int32,
+    'lemma_synset': np.int32,
+    'lemma_key_valid': np.int8,
+    'form_lemma_start': np.int32,
+    'form_lemmas': np.int32,
+    'key_lemma': np.int32,
+}
+
+
+def compile_wordnet_snapshot(directory=SNAPSHOT_DIR):
+    # One-time pass over the NLTK WordNet reader. Synsets are stored in all_synsets() order and lemmas in
+    # synset.lemmas() order; for every lowercased lemma name the result of wn.lemmas(name) is stored as is. Keys are
+    # stored per lemma like names, so a repeated key cannot shift the lemma rows; a key looks up its first lemma.
+    from nltk.corpus import wordnet as wn
+    from nltk.corpus.reader import WordNetError
+
+    info(f'Compiling WordNet {wn.get_version()} snapshot to {directory}')
+    tables = {name: StringTableBuilder() for name in STRING_TABLES}
+    columns = {name: [] for name in COLUMNS.keys()}
+
+    synsets = list(wn.all_synsets())
+    synset_rows = {synset.name(): row for row, synset in enumerate(synsets)}
+    lemma_rows = {}
+    for row, synset in enumerate(synsets):
+        tables['synset_names'].add(synset.name())
+        columns['synset_pos'].append(ord(synset.pos()))
+        columns['synset_lexname'].append(tables['lexnames'].add(synset.lexname()))
+        columns['synset_definition'].append(tables['definitions'].add(synset.definition()))
+        columns['synset_examples'].append(tables['examples'].add(json.dumps(synset.examples())))
+        columns['synset_lemma_start'].append(len(columns['lemma_synset']))
+        columns['synset_instance_start'].append(len(columns['instance_hypernyms']))
+        columns['instance_hypernyms'].extend(synset_rows[hypernym.name()] for hypernym in synset.instance_hypernyms())
+
+        for lemma in synset.lemmas():
+            key = lemma.key()
+            lemma_rows[(synset.name(), lemma.name())] = len(columns['lemma_synset'])
+            columns['lemma_key'].append(tables['lemma_keys'].add(key))
+            columns['lemma_name'].append(tables['lemma_names'].add(lemma.name()))
+            columns['lemma_synset'].append(row)
+            try:
+                wn.lemma_from_key(key)
+                columns['lemma_key_valid'].append(1)
+            except WordNetError:
+                columns['lemma_key_valid'].append(0)
+    columns['synset_lemma_start'].append(len(columns['lemma_synset']))
+    columns['synset_instance_start'].append(len(columns['instance_hypernyms']))
+    key_lemmas = {}
+    for lemma_row, key_id in enumerate(columns['lemma_key']):
+        key_lemmas.setdefault(key_id, lemma_row)
+    columns['key_lemma'] = [key_lemmas[key_id] for key_id in range(len(tables['lemma_keys']))]
+
+    info('Ordering lemmas by name')
+    for form in sorted({name.lower() for name in tables['lemma_names'].strings}):
+        tables['lemma_forms'].add(form)
+        columns['form_lemma_start'].append(len(columns['form_lemmas']))
+        columns['form_lemmas'].extend(lemma_rows[(lemma.synset().name(), lemma.name())] for lemma in wn.lemmas(form))
+    columns['form_lemma_start'].append(len(columns['form_lemmas']))
+
+    with staged_directory(directory) as staging:
+        for name, table in tables.items():
+            table.save(staging, name)
+        for name, values in columns.items():
+            np.save(os.path.join(staging, f'{name}.npy'), np.array(values, dtype=COLUMNS[name]))
+        save_json(os.path.join(staging, 'snapshot.json'), {
+            'snapshot_version': SNAPSHOT_VERSION,
+            'wordnet_version': wn.get_version(),
+            'num_synsets': len(synsets),
+            'num_lemmas': len(columns['lemma_synset'])
+        })
+
+
+class SnapshotSynset:
+
+    __slots__ = ['snapshot', 'row']
+
+    def __init__(self, snapshot, row):
+        self.snapshot = snapshot
+        self.row = row
+
+    def __eq__(self, other):
+        return isinstance(other, SnapshotSynset) and other.row == self.row and other.snapshot is self.snapshot
+
+    def __hash__(self):
+        return hash(self.row)
+
+    def __repr__(self):
+        return f"Synset('{self.name()}')"
+
+    def name(self):
+        return self.snapshot.synset_names[self.row]
+
+    def pos(self):
+        return chr(self.snapshot.synset_pos[self.row])
+
+    def lexname(self):
+        return self.snapshot.lexnames[self.snapshot.synset_lexname[self.row]]
+
+    def definition(self):
+        return self.snapshot.definitions[self.snapshot.synset_definition[self.row]]
+
+    def examples(self):
+        return json.loads(self.snapshot.examples[self.snapshot.synset_examples[self.row]])
+
+    def lemmas(self):
+        start, end = self.snapshot.synset_lemma_start[self.row:self.row+2]
+        return [SnapshotLemma(self.snapshot, row) for row in range(start, end)]
+
+    def lemma_names(self):
+        return [lemma.name() for lemma in self.lemmas()]
+
+    def instance_hypernyms(self):
+        start, end = self.snapshot.synset_instance_start[self.row:self.row+2]
+        return [SnapshotSynset(self.snapshot, int(row)) for row in self.snapshot.instance_hypernyms[start:end]]
+
+
+class SnapshotLemma:
+
+    __slots__ = ['snapshot', 'row']
+
+    def __init__(self, snapshot, row):
+        self.snapshot = snapshot
+        self.row = row
+
+    def __eq__(self, other):
+        return isinstance(other, SnapshotLemma) and other.row == self.row and other.snapshot is self.snapshot
+
+    def __hash__(self):
+        return hash(self.row)
+
+    def __repr__(self):
+        return f"Lemma('{self.synset().name()}.{self.name()}')"
+
+    def key(self):
+        return self.snapshot.lemma_keys[self.snapshot.lemma_key[self.row]]
+
+    def name(self):
+        return self.snapshot.lemma_names[self.snapshot.lemma_name[self.row]]
+
+    def synset(self):
+        return SnapshotSynset(self.snapshot, int(self.snapshot.lemma_synset[self.row]))
+
+
+class WordNetSnapshot:
+    """
+        Memory-mapped copy of the parts of WordNet the pipeline uses, with the same query methods as the NLTK reader
+        for those parts. Full passes over WordNet run over plain arrays rather than the NLTK database files.
+    """
+
+    def __init__(self, directory=SNAPSHOT_DIR):
+        header = open_json(os.path.join(directory, 'snapshot.json'))
+        assert header['snapshot_version'] == SNAPSHOT_VERSION, f'Unsupported WordNet snapshot in {directory}'
+        self.wordnet_version = header['wordnet_version']
+
+        for name in STRING_TABLES:
+            setattr(self, name, StringTable(directory, name))
+        for name in COLUMNS.keys():
+            setattr(self, name, np.load(os.path.join(directory, f'{name}.npy'), mmap_mode='r'))
+
+    def get_version(self):
+        return self.wordnet_version
+
+    def all_synsets(self):
+        for row in range(len(self.synset_names)):
+            yield SnapshotSynset(self, row)
+
+    def synset(self, name):
+        row = self.synset_names.index(name)
+        if row < 0:
+            raise wordnet_error()(f'No synset named {name!r}')
+        return SnapshotSynset(self, row)
+
+    def safe_lemma_from_key(self, key):
+        # Also finds lemmas whose keys the NLTK reader cannot look up directly
+        key_id = self.lemma_keys.index(key)
+        if key_id < 0:
+            raise wordnet_error()(f'No lemma found for key {key!r}')
+        return SnapshotLemma(self, int(self.key_lemma[key_id]))
+
+    def lemma_from_key(self, key):
+        lemma = self.safe_lemma_from_key(key.lower())
+        if not self.lemma_key_valid[lemma.row]:
+            raise wordnet_error()(f'No synset found for key {key!r}')
+        return lemma
+
+    def lemmas(self, name):
+        form = self.lemma_forms.index(name.lower())
+        if form < 0:
+            return []
+        start, end = self.form_lemma_start[form:form+2]
+        return [SnapshotLemma(self, int(row)) for row in self.form_lemmas[start:end]]
+
+
+_snapshot = None
+
+
+def open_wordnet_snapshot(directory=SNAPSHOT_DIR):
+    # Shared snapshot, compiled from the NLTK reader the first time it is needed (or when its layout has changed)
+    global _snapshot
+    if _snapshot is None:
+        header_file = os.path.join(directory, 'snapshot.json')
+        if not os.path.isfile(header_file) or open_json(header_file).get('snapshot_version') != SNAPSHOT_VERSION:
+            compile_wordnet_snapshot(directory)
+        _snapshot = WordNetSnapshot(directory)
+    return _snapshot
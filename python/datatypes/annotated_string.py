@@ -10,15 +10,23 @@ class AnnotatedString:
         self.senses = senses
 
     def to_string(self):
-        output_string = self.string
-        last_start_offset = len(output_string)
+        # Spans are highlighted from the right; a span overlapping one already highlighted is skipped
+        highlighted = []
+        last_start_offset = len(self.string)
         for (start_offset, end_offset, sense_id) in sorted(self.senses, key=lambda x: x[1], reverse=True):
             if end_offset > last_start_offset:
                 continue
             last_start_offset = start_offset
-            output_string = output_string[:]
-            output_string = output_string[:start_offset] + green(output_string[start_offset:end_offset].replace(' ', '_'), ['bold']) + output_string[end_offset:]
-        return output_string
+            highlighted.append((start_offset, end_offset))
+
+        pieces = []
+        offset = 0
+        for start_offset, end_offset in reversed(highlighted):
+            pieces.append(self.string[offset:start_offset])
+            pieces.append(green(self.string[start_offset:end_offset].replace(' ', '_'), ['bold']))
+            offset = end_offset
+        pieces.append(self.string[offset:])
+        return ''.join(pieces)
 
     def get_all_senses(self):
         return {sense for (start, end, sense) in self.senses}
@@ -1,7 +1,10 @@
 from python.datatypes.feature_label import FeatureLabel
+from python.datatypes.slotted import Slotted
 
 
-class KeptFeature:
+class KeptFeature(Slotted):
+
+    __slots__ = ['feature_id', 'sense', 'label', 'source_feature']
 
     def __init__(self, feature_id, sense, source_feature):
         self.feature_id = feature_id
@@ -9,6 +12,11 @@ class KeptFeature:
         self.label = FeatureLabel.KEPT
         self.source_feature = source_feature
 
+    @classmethod
+    def from_dict(cls, data, sense):
+        # source_feature is linked by WordForm.from_dict
+        return cls(feature_id=data['feature_id'], sense=sense, source_feature=None)
+
     def get_feature_string(self):
         return self.source_feature.get_feature_string()
 
@@ -19,4 +27,4 @@ class KeptFeature:
             'label': self.label.value,
             'source_feature_id': self.source_feature.feature_id,
             'source_feature_string': self.get_feature_string(),
-        }
\ No newline at end of file
+        }
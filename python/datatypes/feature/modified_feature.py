@@ -1,7 +1,10 @@
 from python.datatypes.feature_label import FeatureLabel
+from python.datatypes.slotted import Slotted
 
 
-class ModifiedFeature:
+class ModifiedFeature(Slotted):
+
+    __slots__ = ['feature_id', 'sense', 'label', 'source_feature', 'edited_feature_string']
 
     def __init__(self, feature_id, sense, source_feature, edited_feature_string):
         self.feature_id = feature_id
@@ -10,6 +13,12 @@ class ModifiedFeature:
         self.source_feature = source_feature
         self.edited_feature_string = edited_feature_string
 
+    @classmethod
+    def from_dict(cls, data, sense):
+        # source_feature is linked by WordForm.from_dict
+        return cls(feature_id=data['feature_id'], sense=sense, source_feature=None,
+                   edited_feature_string=data['feature_string'])
+
     def get_feature_string(self):
         return self.edited_feature_string
 
@@ -20,4 +29,4 @@ class ModifiedFeature:
             'label': self.label.value,
             'source_feature_id': self.source_feature.feature_id,
             'source_feature_string': self.source_feature.get_feature_string()
-        }
\ No newline at end of file
+        }
@@ -1,7 +1,10 @@
 from python.datatypes.feature_label import FeatureLabel
+from python.datatypes.slotted import Slotted
 
 
-class NewFeature:
+class NewFeature(Slotted):
+
+    __slots__ = ['feature_id', 'sense', 'label', 'feature_string']
 
     def __init__(self, feature_id, sense, feature_string):
         self.feature_id = feature_id
@@ -9,6 +12,10 @@ class NewFeature:
         self.label = FeatureLabel.NEW
         self.feature_string = feature_string
 
+    @classmethod
+    def from_dict(cls, data, sense):
+        return cls(feature_id=data['feature_id'], sense=sense, feature_string=data['feature_string'])
+
     def get_feature_string(self):
         return self.feature_string
 
@@ -19,4 +26,4 @@ class NewFeature:
             'label': self.label.value,
             'source_feature_id': None,
             'source_feature_string': None,
-        }
\ No newline at end of file
+        }
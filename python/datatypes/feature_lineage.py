@@ -0,0 +1,85 @@
+from collections import defaultdict
+
+from python.datatypes.feature_label import FeatureLabel
+
+STRING_LABELS = {FeatureLabel.NEW, FeatureLabel.MODIFIED}
+
+
+class FeatureLineage:
+    """
+        Resolves every feature of a set of wordforms to the NewFeature its source_feature chain starts from, in one
+        pass: each chain is walked only as far as the first feature already resolved, and everything walked is then
+        resolved from there. Features are keyed by object, as feature IDs are only unique within one annotation.
+    """
+
+    def __init__(self, wordforms):
+        self.roots = {}
+        self.depths = {}
+        self.modification_paths = {}  # feature -> ModifiedFeatures on the path from its root, inclusive
+        self.bases = {}  # feature -> the nearest feature above it (if any) that has its own string
+        self.descendants = defaultdict(list)  # root -> features derived from it, in resolution order
+
+        for wordform in wordforms:
+            for sense in wordform.senses:
+                for feature in sense.features:
+                    self._resolve(feature)
+
+    def _resolve(self, feature):
+        path = []
+        while feature not in self.roots and feature.label != FeatureLabel.NEW:
+            path.append(feature)
+            feature = feature.source_feature
+        if feature not in self.roots:
+            self.roots[feature] = feature
+            self.depths[feature] = 0
+            self.modification_paths[feature] = ()
+            self.bases[feature] = None
+
+        for child in reversed(path):
+            root = self.roots[feature]
+            self.roots[child] = root
+            self.depths[child] = self.depths[feature] + 1
+            modifications = self.modification_paths[feature]
+            self.modification_paths[child] = modifications + (child,) if child.label == FeatureLabel.MODIFIED \
+                else modifications
+            self.bases[child] = feature if feature.label in STRING_LABELS else self.bases[feature]
+            self.descendants[root].append(child)
+            feature = child
+
+    def __contains__(self, feature):
+        return feature in self.roots
+
+    def root(self, feature):
+        return self.roots[feature]
+
+    def depth(self, feature):
+        # Number of metaphor steps from the root feature
+        return self.depths[feature]
+
+    def modifications(self, feature):
+        return list(self.modification_paths[feature])
+
+    def base_string(self, feature):
+        # The string that this feature keeps, loses or modifies
+        base = self.bases[feature]
+        if base is None:
+            return None
+        return base.get_feature_string()
+
+    def inheriting_features(self, root):
+        # Features that kept or modified root (directly or through other features)
+        return [feature for feature in self.descendants[root] if feature.label != FeatureLabel.LOST]
+
+    def inheriting_senses(self, root):
+        return [feature.sense for feature in self.inheriting_features(root)]
+
+    def retention_rate(self, root):
+        # Of the features derived from root, the proportion not lost; None if nothing was derived from it
+        descendants = self.descendants[root]
+        if not descendants:
+            return None
+        return len(self.inheriting_features(root)) / len(descendants)
+
+    def retention_rates(self):
+        # For every root feature
+        return {root: self.retention_rate(root) for feature, root in self.roots.items() if feature is root}
@@ -1,38 +1,129 @@
-from nltk.corpus.reader import WordNetError
+import sys
 
 from python.common.common import safe_lemma_from_key, warn, tex_escape
+from python.common.lazy import wordnet as wn, wordnet_error
+from python.common.sense_key_index import lookup_sense_key
 from python.datatypes.sense_label import SenseLabel
-from nltk.corpus import wordnet as wn
+from python.datatypes.slotted import Slotted
 
+LABELS = list(SenseLabel)
+LABEL_CODES = {label: code for code, label in enumerate(LABELS)}
 
-class Sense:
+
+class Sense(Slotted):
+    """
+        Parent, label and position live in the wordform's arrays once the sense is added to a WordForm (index is its
+        row there); until then they are held on the sense itself. The WordNet lemma name and synset are looked up the
+        first time they are read (see resolve_wordnet_attributes in wordform.py for doing so in bulk).
+    """
+
+    __slots__ = ['sense_id', 'definition', 'wordform', 'index', '_word_string', 'is_known', 'is_virtual', 'is_mixed',
+                 'wordnet_sense_id', 'features', '_label', '_position', '_parent', '_children',
+                 '_synset_id']
 
     def __init__(self, sense_id, wordnet_sense_id, is_known, is_virtual, is_mixed, definition, label, position):
 
-        self.sense_id = sense_id
+        self.sense_id = sys.intern(sense_id)
         self.definition = definition
         self.wordform = None
-        self.position = position
+        self.index = None
+        self._position = position
 
         self.is_known = is_known
         self.is_virtual = is_virtual
         self.is_mixed = is_mixed
 
         assert isinstance(label, SenseLabel)
-        self.label = label
+        self._label = label
 
-        self.parent = None
-        self.children = set()
+        self._parent = None
+        self._children = []
 
         self.wordnet_sense_id = wordnet_sense_id
         if wordnet_sense_id is not None:
+            self.wordnet_sense_id = sys.intern(wordnet_sense_id)
             assert not is_virtual
         else:
             assert is_virtual
 
         self.features = []
 
+        self._word_string = None
+        self._synset_id = None
+
+    @classmethod
+    def from_dict(cls, data, position):
+        # Inverse of to_dict, without the parent and features (which WordForm.from_dict links)
+        sense = cls(sense_id=data['sense_id'], wordnet_sense_id=data['wordnet_sense_id'], is_known=data['is_known'],
+                    is_virtual=data['is_virtual'], is_mixed=data['is_split'], definition=data['definition'],
+                    label=SenseLabel(data['label']), position=position)
+        if data['wordnet_synset_id'] is not None:
+            sense._synset_id = sys.intern(data['wordnet_synset_id'])
+        return sense
+
+    def __setstate__(self, state):
+        if isinstance(state, dict) and 'children' in state:
+            # Pickled before Sense was slotted; the WordForm packs these into its arrays when it is loaded
+            state = dict(state)
+            state['index'] = None
+            for name in ['label', 'position', 'parent']:
+                state[f'_{name}'] = state.pop(name)
+            state['_children'] = list(state.pop('children'))
+            state['_word_string'] = state.pop('word_string', None)
+            state['_synset_id'] = None
+            for name in ['sense_id', 'wordnet_sense_id', '_word_string']:
+                if state.get(name) is not None:
+                    state[name] = sys.intern(state[name])
+        super().__setstate__(state)
+
+    @property
+    def word_string(self):
+        if self._word_string is None:
+            if self.is_virtual:
+                self._word_string = self.wordform.word_string
+            else:
+                self.resolve(lookup_sense_key(self.wordnet_sense_id))
+        return self._word_string
+
+    @property
+    def wordnet_synset_id(self):
+        if self._synset_id is None and not self.is_virtual:
+            self.resolve(lookup_sense_key(self.wordnet_sense_id))
+        return self._synset_id
+
+    def resolve(self, entry):
+        # entry is this sense's SenseKeyEntry
+        self._word_string = sys.intern(entry.lemma_name)
+        self._synset_id = sys.intern(entry.synset)
+
+    @property
+    def label(self):
+        if self.index is None:
+            return self._label
+        return LABELS[self.wordform.labels[self.index]]
+
+    @property
+    def position(self):
+        if self.index is None:
+            return self._position
+        return self.wordform.positions[self.index]
+
+    @property
+    def parent(self):
+        if self.index is None:
+            return self._parent
+        parent = self.wordform.parents[self.index]
+        return None if parent < 0 else self.wordform.senses[parent]
+
+    @property
+    def children(self):
+        if self.index is None:
+            return self._children
+        return self.wordform.children(self.index)
+
     def is_conduit(self):
+        if self.index is not None:
+            return self.wordform.tree_index().conduits[self.index]
         if self.label == SenseLabel.METONYMY:
             # Then if ass child
             for child in self.children:
@@ -45,9 +136,10 @@ class Sense:
         return False
 
     def set_parent(self, sense):
-        assert self.parent is None
-        self.parent = sense
-        sense.children.add(self)
+        assert self.index is None and sense.index is None, 'Parents are set before senses are added to a WordForm'
+        assert self._parent is None
+        self._parent = sense
+        sense._children.append(self)
 
     def add_feature(self, feature):
         if feature not in self.features:
@@ -57,7 +149,7 @@ class Sense:
         if not self.is_virtual:
             try:
                 return wn.lemma_from_key(self.wordnet_sense_id)
-            except WordNetError:
+            except wordnet_error():
                 warn(f'{self.wordnet_sense_id} not safe')
                 return safe_lemma_from_key(self.wordform.word_string, self.wordnet_sense_id)
         else:
@@ -82,7 +174,7 @@ class Sense:
             'wordform': self.wordform.word_string,
             'definition': self.definition,
             'wordnet_sense_id': self.wordnet_sense_id,
-            'wordnet_synset_id': wn.lemma_from_key(self.wordnet_sense_id).synset().name() if self.wordnet_sense_id is not None else None,
+            'wordnet_synset_id': self.wordnet_synset_id,
             'label': self.label.value,
             'child_of': None if self.label == SenseLabel.PROTOTYPE else self.parent.sense_id,
             'is_known': self.is_known,
@@ -166,7 +258,11 @@ class Sense:
         return '\makecell[l]{' + ' \\\\ '.join(features_latex) + '}'
 
     def get_metaphorical_children(self):
+        if self.index is not None:
+            return [self.wordform.senses[row] for row in self.wordform.tree_index().metaphorical_children[self.index]]
         return sorted([sense for sense in self.children if sense.label == SenseLabel.METAPHOR], key=lambda x: x.position)
 
     def get_associated_children(self):
+        if self.index is not None:
+            return [self.wordform.senses[row] for row in self.wordform.tree_index().associated_children[self.index]]
         return sorted([sense for sense in self.children if sense.label == SenseLabel.METONYMY], key=lambda x: x.position)
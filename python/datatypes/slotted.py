@@ -0,0 +1,33 @@
+import itertools
+
+
+class Slotted:
+    """
+        Base for the datatypes that use __slots__. Pickles the slot values as a tuple in slot order; objects pickled
+        before the classes were slotted (whose state is their __dict__) still load.
+    """
+
+    __slots__ = ()
+
+    # Slots holding derived data, which are pickled as None
+    transient = ()
+
+    _slot_names = {}
+
+    @classmethod
+    def slot_names(cls):
+        if cls not in Slotted._slot_names:
+            Slotted._slot_names[cls] = [name for klass in reversed(cls.__mro__) for name in getattr(klass, '__slots__', ())]
+        return Slotted._slot_names[cls]
+
+    def __getstate__(self):
+        return tuple(None if name in self.transient else getattr(self, name, None) for name in self.slot_names())
+
+    def __setstate__(self, state):
+        if isinstance(state, dict):
+            for name, value in state.items():
+                setattr(self, name, value)
+        else:
+            # Slots added since the object was pickled are left as None
+            for name, value in itertools.zip_longest(self.slot_names(), state):
+                setattr(self, name, value)
@@ -0,0 +1,124 @@
+from collections import defaultdict
+
+from python.datatypes.sense_label import SenseLabel
+
+TIKZ_HEADER = '''\\begin{center} \\resizebox{%
+      \\ifdim\\width>\\columnwidth
+        \\columnwidth
+      \\else
+        \\width
+      \\fi}{!}{
+\\begin{tikzpicture}[derivation]
+\\node[shape=coordinate] (origin) [node contents={}];\n'''
+
+TIKZ_FOOTER = '''\\end{tikzpicture} }
+\\end{center}'''
+
+
+class TikzRenderer:
+    """
+        Lays out one WordForm's senses as a TikZ picture, writing to a text stream as it goes. Prototypes are placed
+        left to right; metonymies continue to their right and metaphors start a new row beneath (or above, if upward).
+    """
+
+    def __init__(self, wordform, stream, upward=False, node_width=3):
+        self.wordform = wordform
+        self.stream = stream
+        self.upward = upward
+        self.node_width = node_width
+        self.x_shift = 1
+        self.y_shift = 1 if upward else -1
+
+        self.y_pos_to_last_sense = defaultdict(list)  # y_pos -> sense ids, in order
+        self.y_pos_to_last_sense[-1 if upward else 1].append("origin")
+        self.furthest_right_per_row = {}
+        self.furthest_right = {'node': None, 'x': -1}
+        self.seen_merged_senses = set()
+
+    def render(self):
+        self.stream.write(TIKZ_HEADER)
+        horizontal_queue = [sense for sense in self.wordform.senses if sense.label == SenseLabel.PROTOTYPE]
+        self.subsection(x_pos=0, y_pos=0, vertical_queue=[], horizontal_queue=horizontal_queue)
+        self.stream.write(TIKZ_FOOTER)
+
+    def subsection(self, x_pos, y_pos, vertical_queue, horizontal_queue):
+        # Returns the next free x position
+        if vertical_queue:
+            # Move down a level, then across
+            next_x = self.subsection(x_pos=x_pos, y_pos=y_pos+self.y_shift, vertical_queue=[],
+                                     horizontal_queue=vertical_queue)
+            return self.subsection(x_pos=next_x, y_pos=y_pos, vertical_queue=[], horizontal_queue=horizontal_queue)
+        elif horizontal_queue:
+            # Move across a node
+            sense = horizontal_queue.pop(0)
+            self.stream.write(self.node(sense, x_pos, y_pos))
+            self.stream.write(self.edge(sense))
+
+            vertical_queue = list(sense.get_metaphorical_children())
+            horizontal_queue = list(sense.get_associated_children()) + horizontal_queue
+            if not vertical_queue:
+                # Shift right
+                x_pos += self.x_shift
+            return self.subsection(x_pos=x_pos, y_pos=y_pos, vertical_queue=vertical_queue,
+                                   horizontal_queue=horizontal_queue)
+        else:
+            # Both are empty
+            return x_pos
+
+    def node(self, sense, x_pos, y_pos):
+        # Get connection
+        if y_pos in self.y_pos_to_last_sense.keys():
+            position = 'right'
+            connecting_sense = f'{self.y_pos_to_last_sense[y_pos][-1]}'
+
+            num_gaps = x_pos - self.furthest_right_per_row[y_pos] - 1
+            assert num_gaps >= 0
+            if num_gaps > 0:
+                if sense.label == SenseLabel.METAPHOR:
+                    # Below
+                    position = 'at'
+                    connecting_sense += f' -| {self.furthest_right["node"]}'
+                else:
+                    connecting_sense += f' -| {self.furthest_right["node"]}.east'
+        else:
+            position = 'above' if self.upward else 'below'
+            connecting_sense = self.y_pos_to_last_sense[y_pos - self.y_shift][-1]
+
+        if position != "at":
+            position_code = f'[{position} =of {connecting_sense}]'
+        else:
+            position_code = f'at ({connecting_sense})'
+        node = sense.get_tikz_box(position_code=position_code, width=f'{self.node_width}cm')
+        self.y_pos_to_last_sense[y_pos].append(sense.sense_id)
+        self.furthest_right_per_row[y_pos] = x_pos
+
+        # Update furthest right
+        if x_pos > self.furthest_right["x"]:
+            self.furthest_right["x"] = x_pos
+            self.furthest_right["node"] = sense.sense_id
+        return node
+
+    def edge(self, sense):
+        if sense.label == SenseLabel.METAPHOR:
+            edge = f'\\draw[metaphor] ({sense.parent.sense_id}) -| ({sense.sense_id});\n'
+        elif sense.label == SenseLabel.METONYMY:
+            edge = f'\\draw[metonymy] ({sense.parent.sense_id}) to [bend left={-45 if self.upward else 45}] ({sense.sense_id});\n'
+        else:
+            assert sense.label == SenseLabel.PROTOTYPE
+            root_id = sense.sense_id + "_root"
+            edge = f'\\path let \\p1 = ({sense.sense_id}) in node[shape=coordinate] ({root_id}) at (\\x1,{0}) {{}};\n\\draw[start] ({root_id}) to ({sense.sense_id});\n'
+
+        # If it is split draw a box around them
+        if sense.is_mixed:
+            assert sense.sense_id not in self.seen_merged_senses
+            self.seen_merged_senses.add(sense.sense_id)
+
+            if "B" in sense.sense_id:
+                other_half = sense.sense_id.replace('B', 'A')
+                assert other_half in self.seen_merged_senses
+                edge += f"\\draw[split] ($({other_half}.north west) + (-0.2, 0.2)$)  rectangle ($({sense.sense_id}.south east) + (0.2, -0.55)$);\n"
+        return edge
+
+
+def write_tikz(wordform, stream, upward=False):
+    TikzRenderer(wordform, stream, upward=upward).render()
@@ -0,0 +1,76 @@
+from python.datatypes.sense import LABEL_CODES
+from python.datatypes.sense_label import SenseLabel
+
+METAPHOR = LABEL_CODES[SenseLabel.METAPHOR]
+METONYMY = LABEL_CODES[SenseLabel.METONYMY]
+
+
+class TreeIndex:
+    """
+        Tree structure of one WordForm's senses, computed once from its arrays. Senses are referred to by row (their
+        index in the wordform), so children lists are in position order. Ancestry is answered with Euler-tour
+        intervals, and clusters by the row of their root: the prototype when metaphors are collapsed, otherwise the
+        nearest ancestor-or-self that is a metaphor or prototype.
+    """
+
+    def __init__(self, wordform):
+        parents = wordform.parents
+        labels = wordform.labels
+        self.wordform = wordform
+
+        self.children = [[] for _ in parents]
+        for row, parent in enumerate(parents):
+            if parent >= 0:
+                self.children[parent].append(row)
+        self.metaphorical_children = [[child for child in children if labels[child] == METAPHOR]
+                                      for children in self.children]
+        self.associated_children = [[child for child in children if labels[child] == METONYMY]
+                                    for children in self.children]
+        self.conduits = [(label == METONYMY and len(associated) > 0) or (label == METAPHOR and len(children) > 0)
+                         for label, children, associated in zip(labels, self.children, self.associated_children)]
+
+        self.root_rows = [row for row, parent in enumerate(parents) if parent < 0]
+        self.roots = [-1] * len(parents)
+        self.cluster_roots = [-1] * len(parents)
+        self.enter = [-1] * len(parents)
+        self.exit = [-1] * len(parents)
+        clock = 0
+        for root in self.root_rows:
+            self.roots[root] = root
+            self.cluster_roots[root] = root
+            stack = [(root, False)]
+            while stack:
+                row, finished = stack.pop()
+                if finished:
+                    self.exit[row] = clock
+                    continue
+                self.enter[row] = clock
+                clock += 1
+                stack.append((row, True))
+                for child in reversed(self.children[row]):
+                    self.roots[child] = root
+                    self.cluster_roots[child] = child if labels[child] == METAPHOR else self.cluster_roots[row]
+                    stack.append((child, False))
+        assert -1 not in self.enter, f'Senses of {wordform.word_string} are not a forest'
+
+        self._clusters = {}
+
+    def is_ancestor(self, ancestor, row):
+        # Including row itself
+        return self.enter[ancestor] <= self.enter[row] and self.exit[row] <= self.exit[ancestor]
+
+    def cluster_root(self, row, collapse_metaphors=True):
+        return self.roots[row] if collapse_metaphors else self.cluster_roots[row]
+
+    def same_cluster(self, row_1, row_2, collapse_metaphors=True):
+        return self.cluster_root(row_1, collapse_metaphors) == self.cluster_root(row_2, collapse_metaphors)
+
+    def cluster(self, row, collapse_metaphors=True):
+        # Sense IDs in the same cluster as row
+        root = self.cluster_root(row, collapse_metaphors)
+        key = (root, collapse_metaphors)
+        if key not in self._clusters:
+            roots = self.roots if collapse_metaphors else self.cluster_roots
+            self._clusters[key] = frozenset(self.wordform.senses[other].sense_id
+                                            for other, other_root in enumerate(roots) if other_root == root)
+        return self._clusters[key]
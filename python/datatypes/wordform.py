@@ -1,28 +1,117 @@
+import io
+import sys
+from array import array
 from collections import defaultdict
 
-from python.datatypes.sense_label import SenseLabel
-
-
-class WordForm:
+from python.common.sense_key_index import lookup_sense_keys
+from python.datatypes.feature.kept_feature import KeptFeature
+from python.datatypes.feature.lost_feature import LostFeature
+from python.datatypes.feature.modified_feature import ModifiedFeature
+from python.datatypes.feature.new_feature import NewFeature
+from python.datatypes.feature_label import FeatureLabel
+from python.datatypes.sense import Sense, LABEL_CODES
+from python.datatypes.slotted import Slotted
+from python.datatypes.tikz import write_tikz
+from python.datatypes.tree_index import TreeIndex
+
+FEATURE_CLASSES = {
+    FeatureLabel.NEW: NewFeature,
+    FeatureLabel.KEPT: KeptFeature,
+    FeatureLabel.LOST: LostFeature,
+    FeatureLabel.MODIFIED: ModifiedFeature
+}
+
+
+def resolve_wordnet_attributes(wordforms):
+    # Looks up the lemma names and synsets of all unresolved senses at once, rather than one at a time as they are read
+    senses = [sense for wordform in wordforms for sense in wordform.senses
+              if not sense.is_virtual and sense._word_string is None]
+    entries = lookup_sense_keys(sense.wordnet_sense_id for sense in senses)
+    for sense in senses:
+        sense.resolve(entries[sense.wordnet_sense_id])
+
+
+class WordForm(Slotted):
+    """
+        Holds the parent row (-1 for prototypes), label code and position of each of its senses in compact arrays,
+        in sense order; the senses read them from here.
+    """
+
+    __slots__ = ['word_string', 'known', 'annotation_time', 'start_time', 'end_time', 'annotator_id', 'annotation_date',
+                 'senses', 'parents', 'labels', 'positions', '_tree_index']
+
+    transient = ('_tree_index',)
 
     def __init__(self, word_string, is_known, annotator_id, annotation_time, senses, annotation_date, start_time=None, end_time=None):
-        self.word_string = word_string
+        self.word_string = sys.intern(word_string)
         self.known = is_known
         self.annotation_time = annotation_time
         self.start_time = start_time
         self.end_time = end_time
-        self.annotator_id = annotator_id
+        self.annotator_id = sys.intern(annotator_id)
         self.annotation_date = annotation_date
 
         self.senses = sorted(senses, key=lambda x: x.position)
-        self.sense_dict = {sense.sense_id: sense for sense in self.senses}
-
-        for sense in self.senses:
+        self.pack()
+        self._tree_index = None
+
+    @classmethod
+    def from_dict(cls, data):
+        # Inverse of to_dict. Senses are created first, then parents and features are linked by id, so no WordNet
+        # lookups are made; the annotation date and start and end times are not in the release and are left as None
+        senses = [Sense.from_dict(sense_data, position) for position, sense_data in enumerate(data['senses'])]
+        senses_by_id = {sense.sense_id: sense for sense in senses}
+
+        features_by_id = {}
+        sources = []
+        for sense, sense_data in zip(senses, data['senses']):
+            if sense_data['child_of'] is not None:
+                sense.set_parent(senses_by_id[sense_data['child_of']])
+            for feature_data in sense_data['features']:
+                feature = FEATURE_CLASSES[FeatureLabel(feature_data['label'])].from_dict(feature_data, sense)
+                sense.add_feature(feature)
+                features_by_id[feature.feature_id] = feature
+                if feature_data['source_feature_id'] is not None:
+                    sources.append((feature, feature_data['source_feature_id']))
+        for feature, source_feature_id in sources:
+            feature.source_feature = features_by_id[source_feature_id]
+
+        return cls(word_string=data['wordform'], is_known=data['is_known'], annotator_id=data['annotator_id'],
+                   annotation_time=data['annotation_seconds'], senses=senses, annotation_date=None)
+
+    def __setstate__(self, state):
+        if isinstance(state, dict):
+            # Pickled before WordForm was slotted
+            super().__setstate__({name: value for name, value in state.items() if name != 'sense_dict'})
+            self.word_string = sys.intern(self.word_string)
+            self.pack()
+            self._tree_index = None
+        else:
+            super().__setstate__(state)
+
+    def pack(self):
+        # Moves the parent, label and position held on each (unattached) sense into this wordform's arrays
+        rows = {sense: row for row, sense in enumerate(self.senses)}
+        self.parents = array('h', [-1 if sense._parent is None else rows[sense._parent] for sense in self.senses])
+        self.labels = array('b', [LABEL_CODES[sense._label] for sense in self.senses])
+        self.positions = array('h', [sense._position for sense in self.senses])
+        for row, sense in enumerate(self.senses):
             sense.wordform = self
-            if not sense.is_virtual:
-                sense.word_string = sense.get_wordnet_sense().name()
-            else:
-                sense.word_string = sense.wordform.word_string
+            sense.index = row
+            sense._label = sense._position = sense._parent = sense._children = None
+
+    @property
+    def sense_dict(self):
+        return {sense.sense_id: sense for sense in self.senses}
+
+    def tree_index(self):
+        if self._tree_index is None:
+            self._tree_index = TreeIndex(self)
+        return self._tree_index
+
+    def children(self, row):
+        # In sense order, which is position order
+        return [self.senses[child] for child in self.tree_index().children[row]]
 
     def senses_by_wordnet_index(self):
         output = defaultdict(dict)
@@ -69,126 +158,6 @@ class WordForm:
         }
 
     def get_tikz(self, upward=False):
-        output = '''\\begin{center} \\resizebox{%
-      \\ifdim\\width>\\columnwidth
-        \\columnwidth
-      \\else
-        \\width
-      \\fi}{!}{
-\\begin{tikzpicture}[derivation]
-\\node[shape=coordinate] (origin) [node contents={}];\n'''
-
-        horizontal_queue = [sense for sense in self.senses if sense.label == SenseLabel.PROTOTYPE]
-
-        y_pos_to_last_sense = defaultdict(list)  # x_col -> sense_id
-        if upward:
-            y_pos_to_last_sense[-1].append("origin")
-        else:
-            y_pos_to_last_sense[1].append("origin")
-        seen_merged_senses = set()
-        furthest_right_per_row = {}
-
-        global furthest_right_node
-        furthest_right = {'node': None,
-                          'x': -1}
-
-        def tikz_subsection(x_pos, y_pos, vertical_queue, horizontal_queue, x_shift=1, y_shift=1, node_width=3):
-            if vertical_queue:
-                # Move down a level
-                next_chunk_1, next_x_1 = tikz_subsection(x_pos=x_pos, y_pos=y_pos+y_shift, vertical_queue=[],
-                                                         x_shift=x_shift, y_shift=y_shift, node_width=node_width,
-                                                         horizontal_queue=vertical_queue)
-                # Then move across
-                next_chunk_2, next_x_2 = tikz_subsection(x_pos=next_x_1, y_pos=y_pos, vertical_queue=[],
-                                                         x_shift=x_shift, y_shift=y_shift, node_width=node_width,
-                                                         horizontal_queue=horizontal_queue)
-                return next_chunk_1 + next_chunk_2, next_x_2
-            elif horizontal_queue:
-                # Move across a node
-                sense = horizontal_queue.pop(0)
-
-                # Get connection
-                if y_pos in y_pos_to_last_sense.keys():
-                    position = 'right'
-                    connecting_sense = f'{y_pos_to_last_sense[y_pos][-1]}'
-
-                    prev_furthest_right = furthest_right_per_row[y_pos]
-                    num_gaps = x_pos - prev_furthest_right - 1
-                    assert num_gaps >= 0
-                    if num_gaps > 0:
-                        if sense.label == SenseLabel.METAPHOR:
-                            # Below
-                            position = 'at'
-                            connecting_sense += f' -| {furthest_right["node"]}'
-                        else:
-                            connecting_sense += f' -| {furthest_right["node"]}.east'
-                    # if num_gaps > 0:
-                    #     extra_side = f'{num_gaps*(node_width+.5+.3) + .5}cm'
-                    # else:
-                    #     extra_side = None
-                else:
-                    if upward:
-                        position = 'above'
-                    else:
-                        position = 'below'
-                    connecting_sense = y_pos_to_last_sense[y_pos - y_shift][-1]
-                    # extra_side = None
-
-                if position != "at":
-                    position_code = f'[{position} =of {connecting_sense}]'
-                else:
-                    position_code = f'at ({connecting_sense})'
-                node = sense.get_tikz_box(position_code=position_code, width=f'{node_width}cm')
-                y_pos_to_last_sense[y_pos].append(sense.sense_id)
-                furthest_right_per_row[y_pos] = x_pos
-
-                # Update furthest right
-                if x_pos > furthest_right["x"]:
-                    furthest_right["x"] = x_pos
-                    furthest_right["node"] = sense.sense_id
-
-                # node = sense.get_tikz_box(self, right_sense, x_step=x_shift, pos_y=y_pos)
-                if sense.label == SenseLabel.METAPHOR:
-                    edge = f'\\draw[metaphor] ({sense.parent.sense_id}) -| ({sense.sense_id});\n'
-                elif sense.label == SenseLabel.METONYMY:
-                    if upward:
-                        edge = f'\\draw[metonymy] ({sense.parent.sense_id}) to [bend left=-45] ({sense.sense_id});\n'
-                    else:
-                        edge = f'\\draw[metonymy] ({sense.parent.sense_id}) to [bend left=45] ({sense.sense_id});\n'
-                else:
-                    assert sense.label == SenseLabel.PROTOTYPE
-                    # edge = f'\\draw[start] ({x_pos}, {y_pos+y_shift}) to ({sense.sense_id});\n'
-                    root_id = sense.sense_id + "_root"
-                    edge = f'\\path let \\p1 = ({sense.sense_id}) in node[shape=coordinate] ({root_id}) at (\\x1,{0}) {{}};\n\\draw[start] ({root_id}) to ({sense.sense_id});\n'
-
-                # If it is split draw a box around them
-                if sense.is_mixed:
-                    assert sense.sense_id not in seen_merged_senses
-                    seen_merged_senses.add(sense.sense_id)
-
-                    if "B" in sense.sense_id:
-                        other_half = sense.sense_id.replace('B', 'A')  #if 'B' in sense.sense_id else sense.sense_id.replace('A', 'B')
-                        assert other_half in seen_merged_senses
-                        edge += f"\\draw[split] ($({other_half}.north west) + (-0.2, 0.2)$)  rectangle ($({sense.sense_id}.south east) + (0.2, -0.55)$);\n"
-
-                vertical_queue = list(sense.get_metaphorical_children())
-                horizontal_queue = list(sense.get_associated_children()) + horizontal_queue
-                if not vertical_queue:
-                    # Shift right
-                    x_pos += x_shift
-                next_chunk, next_x = tikz_subsection(x_pos=x_pos, y_pos=y_pos, vertical_queue=vertical_queue,
-                                                     horizontal_queue=horizontal_queue, x_shift=x_shift,
-                                                     y_shift=y_shift, node_width=node_width)
-
-                return node + edge + next_chunk, next_x
-            else:
-                # Both are empty
-                return '', x_pos
-
-        tikz_text, _ = tikz_subsection(x_pos=0, y_pos=0, y_shift=1 if upward else -1,
-                                       vertical_queue=[], horizontal_queue=horizontal_queue)
-        output += tikz_text
-
-        output += '''\\end{tikzpicture} }
-\\end{center}'''
-        return output
+        stream = io.StringIO()
+        write_tikz(self, stream, upward=upward)
+        return stream.getvalue()
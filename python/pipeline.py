@@ -0,0 +1,299 @@
+import argparse
+import fnmatch
+import glob
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from datetime import datetime
+
+from python.common.common import info, warn
+
+LOG_DIR = 'bin/reports/logs'
+REPORT_DIR = 'bin/reports'
+
+
+class PipelineStage:
+
+    def __init__(self, name, inputs=(), outputs=()):
+        self.name = name
+        self.module = 'python.' + name.replace('/', '.')
+        self.inputs = list(inputs)
+        self.outputs = list(outputs)
+
+
+# Inputs and outputs are files, directories or glob patterns, relative to the root directory
+STAGES = [
+    PipelineStage('u1_collection/s1_extract_definitions',
+                  inputs=['data/collection/WordNet-3.0/glosstag/merged'],
+                  outputs=['bin/collection/concepts_to_definitions.pkl', 'bin/collection/example_sentences_princeton.pkl']),
+    PipelineStage('u1_collection/s2_build_lemma_to_sense_dict',
+                  outputs=['bin/collection/lemmas_to_senses.pkl']),
+    PipelineStage('u1_collection/s3_build_sense_to_info_dict',
+                  inputs=['bin/collection/example_sentences_princeton.pkl'],
+                  outputs=['bin/collection/senses_to_info.pkl']),
+    PipelineStage('u1_collection/s4_jsonify',
+                  inputs=['bin/collection/lemmas_to_senses.pkl', 'bin/collection/concepts_to_definitions.pkl',
+                          'bin/collection/senses_to_info.pkl', 'bin/collection/example_sentences_princeton.pkl'],
+                  outputs=['bin/lemmas_to_senses.json', 'bin/concepts_to_definitions.json', 'bin/senses_to_info.json',
+                           'bin/indices/spans']),
+    PipelineStage('u1_collection/s5_data_extractor',
+                  inputs=['bin/collection/metaphor-annotation-uk-default-rtdb-export.json', 'data/collection/users.json'],
+                  outputs=['bin/collection/output']),
+
+    PipelineStage('u2_analysis/s1_agreement',
+                  inputs=['bin/lemmas_to_senses.json', 'bin/collection/output', 'data/collection/queues.json']),
+    PipelineStage('u2_analysis/s2_analyse_features',
+                  inputs=['bin/collection/output', 'data/collection/queues.json', 'bin/analysis/feature_alignments.json']),
+    PipelineStage('u2_analysis/s3_build_chainnet',
+                  inputs=['bin/collection/output'],
+                  outputs=['bin/analysis/chainnet.pkl', 'bin/analysis/chainnet_forest', 'data/chainnet.json',
+                           'data/versions/store']),
+    PipelineStage('u2_analysis/s4_simplify_chainnet',
+                  inputs=['bin/analysis/chainnet_forest'],
+                  outputs=['data/chainnet_simple']),
+    PipelineStage('u2_analysis/s5_homonymy_analysis',
+                  inputs=['data/chainnet.json', 'data/analysis/within_pos_clusters.csv']),
+    PipelineStage('u2_analysis/s6_corpus_statistics',
+                  inputs=['bin/lemmas_to_senses.json', 'bin/analysis/chainnet_forest']),
+    PipelineStage('u2_analysis/s7_print_chainnet',
+                  inputs=['data/chainnet.json'],
+                  outputs=['bin/analysis/latex', 'bin/analysis/chainnet.tex']),
+
+    PipelineStage('u3_parsing/s1_extract_embeddings',
+                  inputs=['data/parsing/sensembert_data/sensembert_EN_supervised.txt'],
+                  outputs=['bin/parsing/sensembert_embeddings.pkl', 'bin/parsing/sense_vocabulary.pkl']),
+    PipelineStage('u3_parsing/s2_preprocess_corpus',
+                  inputs=['data/versions/store', 'bin/parsing/sense_vocabulary.pkl'],
+                  outputs=['bin/parsing/data']),
+    PipelineStage('u3_parsing/s3_train',
+                  inputs=['bin/parsing/sensembert_embeddings.pkl', 'bin/parsing/data/train.pkl', 'bin/parsing/data/dev.pkl'],
+                  outputs=['bin/parsing/models/biaffine_edge.pth', 'bin/parsing/models/biaffine_label.pth',
+                           'bin/parsing/models/contextless_label.pth']),
+    PipelineStage('u3_parsing/s4_compute_predictions',
+                  inputs=['bin/parsing/sensembert_embeddings.pkl', 'bin/parsing/data/dev.pkl', 'bin/parsing/data/test.pkl',
+                          'bin/parsing/models/*.pth'],
+                  outputs=['bin/parsing/output/*/connections/biaffine_edge.pkl',
+                           'bin/parsing/output/*/connections/gold_standard_edge.pkl',
+                           'bin/parsing/output/*/labels/biaffine_label.pkl',
+                           'bin/parsing/output/*/labels/contextless_label.pkl',
+                           'bin/parsing/output/*/labels/gold_standard_label.pkl']),
+    PipelineStage('u3_parsing/s5a_random_baseline',
+                  inputs=['bin/parsing/data/dev.pkl', 'bin/parsing/data/test.pkl', 'bin/parsing/sensembert_embeddings.pkl',
+                          'bin/parsing/sense_vocabulary.pkl'],
+                  outputs=['bin/parsing/output/*/connections/random_edge.pkl',
+                           'bin/parsing/output/*/labels/random_label.pkl']),
+    PipelineStage('u3_parsing/s5b_nearest_baseline',
+                  inputs=['bin/parsing/sensembert_embeddings.pkl', 'bin/parsing/sense_vocabulary.pkl',
+                          'bin/parsing/data/dev.pkl', 'bin/parsing/data/test.pkl',
+                          'bin/parsing/output/*/labels/contextless_label.pkl'],
+                  outputs=['bin/parsing/output/*/connections/neighbour_edge.pkl']),
+    PipelineStage('u3_parsing/s6_reformulate_contextless_labels',
+                  inputs=['bin/parsing/output/*/labels/contextless_label.pkl'],
+                  outputs=['bin/parsing/output/*/labels/contextless_label_reformed.pkl']),
+    PipelineStage('u3_parsing/s7_combine',
+                  inputs=['bin/parsing/data/dev.pkl', 'bin/parsing/data/test.pkl', 'bin/parsing/sense_vocabulary.pkl',
+                          'bin/parsing/output'],
+                  outputs=['bin/parsing/predictions']),
+    PipelineStage('u3_parsing/s8_evaluate',
+                  inputs=['bin/parsing/predictions']),
+]
+
+
+def overlaps(path_1, path_2):
+    # Whether two paths (or patterns) can refer to the same file
+    path_1 = os.path.normpath(path_1)
+    path_2 = os.path.normpath(path_2)
+    if path_1 == path_2:
+        return True
+    if path_1.startswith(path_2 + os.sep) or path_2.startswith(path_1 + os.sep):
+        return True
+    return fnmatch.fnmatch(path_1, path_2) or fnmatch.fnmatch(path_2, path_1)
+
+
+def exists(path):
+    return len(glob.glob(path)) > 0
+
+
+def build_dag(stages):
+    # stage name -> names of the stages whose outputs it reads
+    dependencies = {}
+    for stage in stages:
+        dependencies[stage.name] = set()
+        for other in stages:
+            if other is stage:
+                continue
+            if any(overlaps(i, o) for i in stage.inputs for o in other.outputs):
+                dependencies[stage.name].add(other.name)
+    return dependencies
+
+
+def topological_order(stages, dependencies):
+    order = []
+    done = set()
+    remaining = [stage.name for stage in stages]
+    while remaining:
+        ready = [name for name in remaining if dependencies[name] <= done]
+        assert ready, f'Cycle between stages {remaining}'
+        order.extend(ready)
+        done.update(ready)
+        remaining = [name for name in remaining if name not in done]
+    return order
+
+
+def select_stages(stages, dependencies, targets):
+    # The targeted stages (by name prefix) and everything upstream of them
+    if not targets:
+        return list(stages)
+    selected = {stage.name for stage in stages if any(stage.name.startswith(target) for target in targets)}
+    assert selected, f'No stages match {targets}'
+    queue = list(selected)
+    while queue:
+        for dependency in dependencies[queue.pop()]:
+            if dependency not in selected:
+                selected.add(dependency)
+                queue.append(dependency)
+    return [stage for stage in stages if stage.name in selected]
+
+
+def critical_path(dependencies, durations):
+    # Longest chain of stages by total duration, over the stages that ran
+    finish = {}
+    previous = {}
+    for name in [n for n in topological_order(STAGES, dependencies) if n in durations]:
+        upstream = max(dependencies[name] & durations.keys(), key=lambda n: finish[n], default=None)
+        finish[name] = durations[name] + (finish[upstream] if upstream is not None else 0)
+        previous[name] = upstream
+    if not finish:
+        return [], 0
+    name = max(finish, key=finish.get)
+    total = finish[name]
+    path = []
+    while name is not None:
+        path.append(name)
+        name = previous[name]
+    return list(reversed(path)), total
+
+
+class PipelineRunner:
+    """
+        Runs stages as separate processes, starting each one as soon as every stage it depends on has finished,
+        with at most `jobs` stages at a time. The first failure stops the run and terminates the other stages.
+    """
+
+    def __init__(self, stages, jobs=None):
+        self.stages = {stage.name: stage for stage in stages}
+        self.dependencies = build_dag(STAGES)
+        self.jobs = jobs if jobs is not None else (os.cpu_count() or 1)
+        self.processes = {}
+        self.durations = {}
+        self.statuses = {}
+
+    def check_inputs(self):
+        # Stages whose external inputs are missing can only be skipped, and only if their outputs already exist
+        produced = [o for stage in STAGES for o in stage.outputs]
+        runnable = {}
+        for name, stage in self.stages.items():
+            missing = [i for i in stage.inputs if not any(overlaps(i, o) for o in produced) and not exists(i)]
+            if not missing:
+                runnable[name] = stage
+            elif stage.outputs and all(exists(o) for o in stage.outputs):
+                warn(f'Skipping {name}: missing {missing}, using existing outputs')
+                self.statuses[name] = 'skipped'
+            else:
+                raise FileNotFoundError(f'Stage {name} needs {missing}')
+        self.stages = runnable
+
+    def run_stage(self, stage):
+        os.makedirs(LOG_DIR, exist_ok=True)
+        log_file = os.path.join(LOG_DIR, stage.name.replace('/', '.') + '.log')
+        start = time.perf_counter()
+        with open(log_file, 'w') as log:
+            process = subprocess.Popen([sys.executable, '-m', stage.module], stdout=log, stderr=subprocess.STDOUT,
+                                       stdin=subprocess.DEVNULL)
+            self.processes[stage.name] = process
+            return_code = process.wait()
+        return return_code, time.perf_counter() - start, log_file
+
+    def run(self):
+        self.check_inputs()
+        pending = dict(self.stages)
+        done = set(self.statuses.keys())
+        failed = None
+        start = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=self.jobs) as pool:
+            running = {}
+            while pending or running:
+                if failed is None:
+                    for name in [n for n, stage in pending.items() if (self.dependencies[n] & self.stages.keys()) <= done]:
+                        if len(running) >= self.jobs:
+                            break
+                        info(f'Starting {name}')
+                        running[pool.submit(self.run_stage, pending.pop(name))] = name
+                if not running:
+                    break
+
+                finished, _ = wait(running.keys(), return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    return_code, seconds, log_file = future.result()
+                    self.durations[name] = seconds
+                    if return_code == 0:
+                        info(f'Finished {name} in {seconds:.1f}s')
+                        self.statuses[name] = 'ok'
+                        done.add(name)
+                    elif failed is None:
+                        failed = name
+                        self.statuses[name] = 'failed'
+                        warn(f'{name} failed with exit code {return_code}; see {log_file}')
+                        for other, process in list(self.processes.items()):
+                            if other != name and process.poll() is None:
+                                process.terminate()
+                                self.statuses[other] = 'terminated'
+                    else:
+                        self.statuses.setdefault(name, 'failed')
+
+        wall_seconds = time.perf_counter() - start
+        self.report(wall_seconds, failed)
+        return failed is None
+
+    def report(self, wall_seconds, failed):
+        completed = {n: seconds for n, seconds in self.durations.items() if self.statuses.get(n) == 'ok'}
+        path, path_seconds = critical_path(self.dependencies, completed)
+        info(f'Wall time {wall_seconds:.1f}s; sum of stage times {sum(self.durations.values()):.1f}s')
+        info(f'Critical path ({path_seconds:.1f}s): ' + ' -> '.join(f'{n} ({self.durations[n]:.1f}s)' for n in path))
+        if failed is not None:
+            warn(f'Pipeline stopped after {failed} failed')
+
+        os.makedirs(REPORT_DIR, exist_ok=True)
+        file = os.path.join(REPORT_DIR, f'pipeline.{datetime.now().strftime("%Y%m%d-%H%M%S")}.json')
+        with open(file, 'w') as fp:
+            json.dump({
+                'wall_seconds': wall_seconds,
+                'failed': failed,
+                'stages': {n: {'status': self.statuses.get(n, 'not run'), 'seconds': self.durations.get(n)}
+                           for n in list(self.statuses.keys()) + [n for n in self.stages if n not in self.statuses]},
+                'critical_path': path,
+                'critical_path_seconds': path_seconds
+            }, fp, indent=4)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Run pipeline stages in dependency order, in parallel where possible')
+    parser.add_argument('targets', nargs='*', help='Stage names or prefixes (e.g. u3_parsing); defaults to all stages')
+    parser.add_argument('--jobs', type=int, default=None, help='Maximum number of stages to run at once')
+    parser.add_argument('--list', action='store_true', help='Print the selected stages and their dependencies')
+    args = parser.parse_args()
+
+    dependencies = build_dag(STAGES)
+    topological_order(STAGES, dependencies)
+    selected = select_stages(STAGES, dependencies, args.targets)
+
+    if args.list:
+        for stage in selected:
+            print(f'{stage.name} <- {", ".join(sorted(dependencies[stage.name])) or "-"}')
+    else:
+        sys.exit(0 if PipelineRunner(selected, jobs=args.jobs).run() else 1)
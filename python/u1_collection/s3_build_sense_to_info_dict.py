@@ -1,32 +1,40 @@
-from nltk.corpus import wordnet as wn
+import sys
+
 from python.common.common import info, open_pickle, save_pickle
+from python.common.lemma_index import lemma_index
+from python.common.pattern_matcher import PatternMatcher
+from python.common.stage_cache import Stage
+from python.common.wordnet_snapshot import open_wordnet_snapshot
 
+wn = open_wordnet_snapshot()
 assert wn.get_version() == '3.0'
 
+stage = Stage('u1_collection/s3_build_sense_to_info_dict', inputs=['bin/collection/example_sentences_princeton.pkl'],
+              code=[__file__, 'python/common/lemma_index.py', 'python/common/pattern_matcher.py'],
+              params={'wordnet': wn.get_version()})
+if stage.skip_if_fresh():
+    sys.exit(0)
+
 info('Loading examples')
 examples = open_pickle('bin/collection/example_sentences_princeton.pkl')
 
 info('Collating')
 sense_to_info = {}
 
-for synset in wn.all_synsets():
-    concept_id = synset.name()
+for concept_id, senses in lemma_index()['synsets'].items():
     synset_examples = examples[concept_id]
 
-    for sense in synset.lemmas():
-        sense_id = sense.key()
+    # Which of the synset's words each example contains, found in one pass over the example
+    matcher = PatternMatcher(word.lower().replace('_', ' ') for (sense_id, word) in senses)
+    example_matches = [(example.string, matcher.matched(example.string.lower())) for example in synset_examples]
 
+    for i, (sense_id, word) in enumerate(senses):
         if sense_id not in sense_to_info.keys():
-            word = sense.name()
-            assert sense.synset() == synset
-            synonyms = [{"string": info.name(), "sense_id": info.key()} for info in synset.lemmas() if info.name() != word]
+            synonyms = [{"string": other_word, "sense_id": other_sense_id} for (other_sense_id, other_word) in senses
+                        if other_word != word]
 
             # Find relevent examples
-            relevent_examples = []
-            for example in synset_examples:
-                example_string = example.string
-                if word.lower().replace('_', ' ') in example_string.lower():
-                    relevent_examples.append(example_string)
+            relevent_examples = [example_string for (example_string, matched) in example_matches if i in matched]
 
             sense_to_info[sense_id] = {
                 'examples': relevent_examples,
@@ -37,4 +45,4 @@ for synset in wn.all_synsets():
 
 info('Saving')
 save_pickle('bin/collection/senses_to_info.pkl', sense_to_info)
-
+stage.record()
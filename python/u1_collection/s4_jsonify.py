@@ -1,4 +1,16 @@
+import sys
+
 from python.common.common import info, open_pickle, save_json
+from python.common.span_index import span_index
+from python.common.stage_cache import Stage
+
+stage = Stage('u1_collection/s4_jsonify',
+              inputs=['bin/collection/lemmas_to_senses.pkl', 'bin/collection/concepts_to_definitions.pkl',
+                      'bin/collection/senses_to_info.pkl', 'bin/collection/example_sentences_princeton.pkl'],
+              code=[__file__, 'python/datatypes/annotated_string.py', 'python/common/span_index.py',
+                    'python/common/string_table.py'])
+if stage.skip_if_fresh():
+    sys.exit(0)
 
 info('Loading')
 lemma_to_senses = open_pickle('bin/collection/lemmas_to_senses.pkl')
@@ -33,3 +45,7 @@ sense_to_info_flattened = {}
 for sense_id, sense_info in sense_to_info.items():
     sense_to_info_flattened[sense_id] = sense_info
 save_json('bin/senses_to_info.json', sense_to_info_flattened)
+
+info('Indexing cited senses')
+span_index()
+stage.record()
@@ -1,6 +1,7 @@
 from dateutil import parser
 
 from python.common.common import warn, info, save_json, open_json, save_pickle
+from python.common.stage_cache import Stage
 from python.datatypes.feature.kept_feature import KeptFeature
 from python.datatypes.feature.lost_feature import LostFeature
 from python.datatypes.feature.modified_feature import ModifiedFeature
@@ -238,4 +239,9 @@ def main():
     info('Done')
 
 if __name__ == "__main__":
-    main()
+    stage = Stage('u1_collection/s5_data_extractor', inputs=['bin/collection/metaphor-annotation-uk-default-rtdb-export.json',
+                                                             'data/collection/users.json'],
+                  code=[__file__, 'python/datatypes'])
+    if not stage.skip_if_fresh():
+        main()
+        stage.record()
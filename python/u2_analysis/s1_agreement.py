@@ -1,15 +1,15 @@
-from sklearn.metrics import accuracy_score, cohen_kappa_score, \
-    adjusted_mutual_info_score, adjusted_rand_score, homogeneity_completeness_v_measure
 import itertools
 import math
 import warnings
 from collections import defaultdict
-from statsmodels.stats.inter_rater import fleiss_kappa, aggregate_raters
 import numpy as np
 import krippendorff
 
 from python.common.common import open_pickle, info, flatten, open_json
+from python.common.lazy import sklearn_metrics, inter_rater
 from python.datatypes.sense_label import SenseLabel
+from python.common.instrumentation import run_report
+
 
 def get_primary_sense(sense):
     if SenseLabel.PROTOTYPE in sense.keys():
@@ -43,41 +43,17 @@ def get_head(sense):
 
 
 def get_cluster_id(sense_obj, cluster_dict, collapse_metaphors=True):
-    # cluster dict is ID -> sense_set
-
-    # check if it is already in a cluster
-    for cluster_id, sense_ids in cluster_dict.items():
-        if sense_obj.sense_id in sense_ids:
-            return cluster_id, cluster_dict
-
-    # else add a new cluster
-    new_id = len(cluster_dict)
-    cluster_dict[new_id] = get_cluster(sense_obj, collapse_metaphors=collapse_metaphors)
-    return new_id, cluster_dict
+    # cluster dict is cluster root -> ID, with IDs given in order of first appearance
+    tree = sense_obj.wordform.tree_index()
+    root = sense_obj.wordform.senses[tree.cluster_root(sense_obj.index, collapse_metaphors=collapse_metaphors)]
+    if root not in cluster_dict:
+        cluster_dict[root] = len(cluster_dict)
+    return cluster_dict[root], cluster_dict
 
 
 def get_cluster(sense_obj, collapse_metaphors=True):
-    # Go to root
-    root = sense_obj
-    while root.parent is not None:
-        if collapse_metaphors or root.label != SenseLabel.METAPHOR:
-            root = root.parent
-        else:
-            break
-
-    # Go to all leaves
-    queue = [root]
-    visited = set()
-    while queue:
-        node = queue.pop(0)
-        assert node.sense_id not in visited
-        visited.add(node.sense_id)
-
-        for child_node in list(node.children):
-            if collapse_metaphors or child_node.label != SenseLabel.METAPHOR:
-                queue.append(child_node)
-
-    return visited
+    # Sense IDs in the same cluster
+    return sense_obj.wordform.tree_index().cluster(sense_obj.index, collapse_metaphors=collapse_metaphors)
 
 
 def get_labels_subsets(data):
@@ -156,8 +132,8 @@ def fleiss(label_data):
             data[i, annotator_id] = lab_code
 
     # input to add is subjects (items) in rows and raters in columns
-    agg_data = aggregate_raters(data)
-    kappa = fleiss_kappa(agg_data[0])
+    agg_data = inter_rater.aggregate_raters(data)
+    kappa = inter_rater.fleiss_kappa(agg_data[0])
 
     return kappa
 
@@ -199,39 +175,39 @@ def label_agreement(multi_data, num_annotators):
             anno_1_label_only = [datapoint == label for datapoint in flat_labels[0]]
             anno_2_label_only = [datapoint == label for datapoint in flat_labels[1]]
 
-            results[f'{label}:percent'] = accuracy_score(y_true=anno_1_label_only, y_pred=anno_2_label_only)
-            results[f'{label}:cohens'] = cohen_kappa_score(y1=anno_1_label_only, y2=anno_2_label_only)
+            results[f'{label}:percent'] = sklearn_metrics.accuracy_score(y_true=anno_1_label_only, y_pred=anno_2_label_only)
+            results[f'{label}:cohens'] = sklearn_metrics.cohen_kappa_score(y1=anno_1_label_only, y2=anno_2_label_only)
 
             anno_1_label_only_agreed_attachment = [datapoint == label for datapoint in
                                                    flat_labels_given_attachment[0]]
             anno_2_label_only_agreed_attachment = [datapoint == label for datapoint in
                                                    flat_labels_given_attachment[1]]
 
-            results[f'{label}|attachment:percent'] = accuracy_score(y_true=anno_1_label_only_agreed_attachment,
-                                                                            y_pred=anno_2_label_only_agreed_attachment)
-            results[f'{label}|attachment:cohens'] = cohen_kappa_score(
+            results[f'{label}|attachment:percent'] = sklearn_metrics.accuracy_score(y_true=anno_1_label_only_agreed_attachment,
+                                                                                    y_pred=anno_2_label_only_agreed_attachment)
+            results[f'{label}|attachment:cohens'] = sklearn_metrics.cohen_kappa_score(
                 y1=anno_1_label_only_agreed_attachment,
                 y2=anno_2_label_only_agreed_attachment)
 
             anno_1_label_only_agreed_core = [datapoint == label for datapoint in flat_labels_given_core[0]]
             anno_2_label_only_agreed_core = [datapoint == label for datapoint in flat_labels_given_core[1]]
 
-            results[f'{label}|prototype:percent'] = accuracy_score(y_true=anno_1_label_only_agreed_core,
-                                                                      y_pred=anno_2_label_only_agreed_core)
-            results[f'{label}|prototype:cohens'] = cohen_kappa_score(y1=anno_1_label_only_agreed_core,
-                                                                             y2=anno_2_label_only_agreed_core)
+            results[f'{label}|prototype:percent'] = sklearn_metrics.accuracy_score(y_true=anno_1_label_only_agreed_core,
+                                                                                   y_pred=anno_2_label_only_agreed_core)
+            results[f'{label}|prototype:cohens'] = sklearn_metrics.cohen_kappa_score(y1=anno_1_label_only_agreed_core,
+                                                                                     y2=anno_2_label_only_agreed_core)
 
-        results['all:percent'] = accuracy_score(y_true=flat_labels[0], y_pred=flat_labels[1])  # (LOS)
-        results['all:cohens'] = cohen_kappa_score(y1=flat_labels[0], y2=flat_labels[1])
+        results['all:percent'] = sklearn_metrics.accuracy_score(y_true=flat_labels[0], y_pred=flat_labels[1])  # (LOS)
+        results['all:cohens'] = sklearn_metrics.cohen_kappa_score(y1=flat_labels[0], y2=flat_labels[1])
 
-        results['all|attachment:percent'] = accuracy_score(y_true=flat_labels_given_attachment[0],
-                                                                   y_pred=flat_labels_given_attachment[1])
-        results['all|attachment:cohens'] = cohen_kappa_score(y1=flat_labels_given_attachment[0],
-                                                                          y2=flat_labels_given_attachment[1])
-        results['all|prototype:percent'] = accuracy_score(y_true=flat_labels_given_core[0],
-                                                             y_pred=flat_labels_given_core[1])
-        results['all|prototype:cohens'] = cohen_kappa_score(y1=flat_labels_given_core[0],
-                                                                    y2=flat_labels_given_core[1])
+        results['all|attachment:percent'] = sklearn_metrics.accuracy_score(y_true=flat_labels_given_attachment[0],
+                                                                           y_pred=flat_labels_given_attachment[1])
+        results['all|attachment:cohens'] = sklearn_metrics.cohen_kappa_score(y1=flat_labels_given_attachment[0],
+                                                                             y2=flat_labels_given_attachment[1])
+        results['all|prototype:percent'] = sklearn_metrics.accuracy_score(y_true=flat_labels_given_core[0],
+                                                                          y_pred=flat_labels_given_core[1])
+        results['all|prototype:cohens'] = sklearn_metrics.cohen_kappa_score(y1=flat_labels_given_core[0],
+                                                                            y2=flat_labels_given_core[1])
 
         for k, v in results.items():
             multi_results[k].append(v)
@@ -458,11 +434,11 @@ def cluster_agreement(multi_data, num_annotators):
                     anno_2_assignments.append(anno_2_cluster_id)
 
                 # Get result
-                ami_results.append(adjusted_mutual_info_score(anno_1_assignments, anno_2_assignments))
-                ari_results.append(adjusted_rand_score(anno_1_assignments, anno_2_assignments))
+                ami_results.append(sklearn_metrics.adjusted_mutual_info_score(anno_1_assignments, anno_2_assignments))
+                ari_results.append(sklearn_metrics.adjusted_rand_score(anno_1_assignments, anno_2_assignments))
 
-                homogeneity, completeness, v_measure = homogeneity_completeness_v_measure(anno_1_assignments,
-                                                                                          anno_2_assignments)
+                homogeneity, completeness, v_measure = sklearn_metrics.homogeneity_completeness_v_measure(anno_1_assignments,
+                                                                                                          anno_2_assignments)
                 v_measure_results.append(v_measure)
                 completeness_results.append(completeness)
                 homogeneity_results.append(homogeneity)
@@ -692,6 +668,7 @@ def main():
             f'{name} & {format_perc(results["A:all:uuas"])} & {format_perc(results["A:agreed_core:uuas"])} & {format_perc(results["A:all:ulas"])} & {format_perc(results["A:agreed_core:ulas"])} \\\\')
 
 if __name__ == "__main__":
+    run_report()
     with warnings.catch_warnings():
         warnings.simplefilter("ignore")
         main()
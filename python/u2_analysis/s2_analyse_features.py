@@ -2,14 +2,19 @@ import os.path
 
 from python.common.common import info, open_pickle, open_json, save_json
 from python.datatypes.feature_label import FeatureLabel
+from python.datatypes.feature_lineage import FeatureLineage
 from python.datatypes.sense_label import SenseLabel
 from colorama import Fore
 from colorama import Style
+from python.common.instrumentation import run_report
+
+if __name__ == "__main__":
+    run_report()
 
 def color(s, c):
     return f"{c}{s}{Style.RESET_ALL}"
 
-def process_feature(feature):
+def process_feature(feature, lineage):
     if feature.label == FeatureLabel.NEW:
         return None
 
@@ -18,19 +23,10 @@ def process_feature(feature):
     else:
         new_string = ''
 
-    base_string = None
-    parent = feature
-    while not base_string:
-        parent = parent.source_feature
-        if parent.label == FeatureLabel.NEW:
-            base_string = parent.feature_string
-        elif parent.label == FeatureLabel.MODIFIED:
-            base_string = parent.edited_feature_string
-
-    return (base_string, feature.label, new_string, feature.feature_id)
+    return (lineage.base_string(feature), feature.label, new_string, feature.feature_id)
 
-def extract_features(features):
-    output = [process_feature(f) for f in features]
+def extract_features(features, lineage):
+    output = [process_feature(f, lineage) for f in features]
     return [o for o in output if o is not None]
 
 def stringify(feature_tuple):
@@ -74,8 +70,13 @@ for queue, annotation in annotator_2_raw.items():
         if word in words:
             annotation_2[word] = anno
 
+info('Resolving feature lineage')
+lineage = FeatureLineage(list(annotation_1.values()) + list(annotation_2.values()))
+
 info('Running loop')
 output_file = f'bin/analysis/feature_alignments.json'
+data = open_json(output_file) if os.path.isfile(output_file) else []
+done = {(datapoint['word'], datapoint['sense']) for datapoint in data}
 count = 0
 for word in words:
 
@@ -85,15 +86,7 @@ for word in words:
     for wordnet_sense, anno_1_wn_sense in anno_1.items():
 
         # Check if done
-        already_annotated = False
-        data = []
-        if os.path.isfile(output_file):
-            data = open_json(output_file)
-            for datapoint in data:
-                if datapoint['word'] == word and datapoint['sense'] == wordnet_sense:
-                    already_annotated = True
-                    break
-        if already_annotated:
+        if (word, wordnet_sense) in done:
             count += 1
             continue
 
@@ -119,8 +112,8 @@ for word in words:
         definition = anno_1_sense.definition
         parent_definition = anno_2_sense.parent.definition
 
-        anno_1_features = extract_features(anno_1_sense.features)
-        anno_2_features = extract_features(anno_2_sense.features)
+        anno_1_features = extract_features(anno_1_sense.features, lineage)
+        anno_2_features = extract_features(anno_2_sense.features, lineage)
 
         code_map = {}
         print(f'\n({count}) Word: {word}')
@@ -159,6 +152,7 @@ for word in words:
             'excluded_features': remaining_features
         }
         data.append(output)
+        done.add((word, wordnet_sense))
         save_json(output_file, data)
 
 info("Analysing")
@@ -1,4 +1,10 @@
-from python.common.common import open_pickle, info, warn, save_pickle, save_json, open_json
+from python.common.common import open_pickle, info, warn, save_pickle
+from python.common.chainnet_export import Records, encode_records, save_json_stream, serialize_wordforms
+from python.common.chainnet_forest import save_chainnet_forest
+from python.common.version_store import open_version_store
+from python.common.stage_cache import Stage
+from python.datatypes.wordform import resolve_wordnet_attributes
+
 
 def get_anno_data(anno_id):
 
@@ -24,54 +30,74 @@ def get_anno_data(anno_id):
     info(f'{len(queues_done)} queues loaded for {anno_id} with {len(output)} words')
     return output
 
-chainnet = get_anno_data('annotator01')
 
-# Adding in 2nd annotator's words
-for other_annotator in ['annotator02', 'annotator03']:
-    chainnet_2 = get_anno_data(other_annotator)
+def main():
+
+    chainnet = get_anno_data('annotator01')
+
+    # Adding in 2nd annotator's words
+    for other_annotator in ['annotator02', 'annotator03']:
+        chainnet_2 = get_anno_data(other_annotator)
+
+        for k, v in chainnet_2.items():
+            if k not in chainnet.keys():
+                chainnet[k] = v
 
-    for k, v in chainnet_2.items():
-        if k not in chainnet.keys():
-            chainnet[k] = v
+    author_data = open_pickle(f'bin/collection/output/author.pkl')
+    edit_queues = sorted([q for q in author_data.keys() if 'edits' in q] + ['edits:0.9'], key=lambda x : float(x.split(':')[1].replace('d', '.')))
+    assert len(edit_queues) > 0
 
-author_data = open_pickle(f'bin/collection/output/author.pkl')
-edit_queues = sorted([q for q in author_data.keys() if 'edits' in q] + ['edits:0.9'], key=lambda x : float(x.split(':')[1].replace('d', '.')))
-assert len(edit_queues) > 0
+    version_store = open_version_store()
+    version_store.clear()
 
-for queue_id in edit_queues:
+    # The words of the last version stored; only the words replaced since then are serialised for the next one
+    stored = {}
 
-    version = queue_id.split(':')[1].replace('d', '.')
-    changed = 0
+    for queue_id in edit_queues:
 
-    if version == '1.0':
-        # Overriding overlaps
-        for q_id, data in author_data.items():
-            if "overlap" in q_id:
-                for wordform, word_data in data.items():
-                    assert wordform in chainnet.keys()
-                    chainnet[wordform] = word_data
-                    changed += 1
+        version = queue_id.split(':')[1].replace('d', '.')
+        changed = 0
 
-    if queue_id in author_data.keys():
-        queue_data = author_data[queue_id]
-        for wordform, word_data in queue_data.items():
-            assert wordform in chainnet.keys()
-            chainnet[wordform] = word_data
-            changed += 1
+        if version == '1.0':
+            # Overriding overlaps
+            for q_id, data in author_data.items():
+                if "overlap" in q_id:
+                    for wordform, word_data in data.items():
+                        assert wordform in chainnet.keys()
+                        chainnet[wordform] = word_data
+                        changed += 1
 
-    info(f'Saving ChainNet v{version} with a total of {len(chainnet)} words ({changed} changed)')
-    json_output = {
-        'metadata': {
+        if queue_id in author_data.keys():
+            queue_data = author_data[queue_id]
+            for wordform, word_data in queue_data.items():
+                assert wordform in chainnet.keys()
+                chainnet[wordform] = word_data
+                changed += 1
+
+        info(f'Saving ChainNet v{version} with a total of {len(chainnet)} words ({changed} changed)')
+        new_words = [word for wordform, word in chainnet.items() if stored.get(wordform) is not word]
+        resolve_wordnet_attributes(new_words)
+
+        metadata = {
             'resource': 'ChainNet',
             'author': "Rowan Hall Maudslay",
             'version': str(version)
-        },
-        'content': [word.to_dict() for word_string, word in chainnet.items()]
-    }  #sorted([word.to_dict() for word_string, word in chainnet.items()], key=lambda x: x['wordform'])
-    save_json(f'data/versions/chainnet_v{version}.json', json_output)
-
-info(f'Saving definitive v{version}')
-save_pickle('bin/analysis/chainnet.pkl', chainnet)
-save_json(f'data/chainnet.json', json_output)
-
-info('Done')
\ No newline at end of file
+        }
+        version_store.add_records(metadata, [word.word_string for word in chainnet.values()],
+                                  zip([word.word_string for word in new_words], serialize_wordforms(new_words)))
+        stored = dict(chainnet)
+
+    info(f'Saving definitive v{version}')
+    save_pickle('bin/analysis/chainnet.pkl', chainnet)
+    texts = []
+    records = encode_records((word.to_dict() for word in chainnet.values()), texts)
+    save_chainnet_forest('bin/analysis/chainnet_forest', {'metadata': metadata, 'content': records})
+    save_json_stream('data/chainnet.json', {'metadata': metadata, 'content': Records(texts)})
+    info('Done')
+
+
+if __name__ == "__main__":
+    stage = Stage('u2_analysis/s3_build_chainnet', inputs=['bin/collection/output'], code=[__file__, 'python/datatypes'])
+    if not stage.skip_if_fresh():
+        main()
+        stage.record()
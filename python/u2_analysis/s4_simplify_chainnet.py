@@ -1,12 +1,28 @@
+import sys
 from collections import defaultdict
 
-from python.common.common import info, open_json, safe_lemma_from_key, save_json, open_chainnet
+import numpy as np
+
+from python.common.common import info, save_json
+from python.common.sense_key_index import sense_key_synset
+from python.common.chainnet_forest import open_chainnet_forest
+from python.common.stage_cache import Stage
 from python.datatypes.sense_label import SenseLabel
 
+stage = Stage('u2_analysis/s4_simplify_chainnet', inputs=['bin/analysis/chainnet_forest'])
+if stage.skip_if_fresh():
+    sys.exit(0)
+
 info('Loading data')
-chainnet = open_json('data/chainnet.json')
-version = chainnet['metadata']['version']
-chainnet = chainnet['content']
+forest = open_chainnet_forest()
+version = forest.metadata['version']
+
+# The columns read per sense, as lists, since element access through numpy.memmap is slow
+sense_key = np.asarray(forest.sense_key).tolist()
+sense_parent = np.asarray(forest.sense_parent).tolist()
+sense_label = [forest.label(row) for row in range(len(forest.sense_label))]
+sense_is_virtual = (np.asarray(forest.sense_is_virtual) == 1).tolist()
+sense_is_split = (np.asarray(forest.sense_is_split) == 1).tolist()
 
 info('Processing into form')
 all_data = {}
@@ -17,71 +33,62 @@ connections = {
     'metonymy': []
 }
 
-for word_data in chainnet:
+for word_index in range(len(forest)):
 
-    wordform = word_data['wordform']
+    wordform = forest.wordform(word_index)
 
     # Build wordnet_id -> data map
     synset_edges = []
-    senses = word_data['senses']
-    sense_dict = {sense['sense_id']: sense for sense in senses}
 
     clusters = defaultdict(list)
 
-    for sense_info in senses:
-        sense_id = sense_info['sense_id']
+    for row in forest.sense_rows(word_index):
 
-        if sense_info['is_virtual']:
+        if sense_is_virtual[row]:
             continue
-        if sense_info['is_split'] and sense_info['label'] == 'metaphor':
+        if sense_is_split[row] and sense_label[row] == 'metaphor':
             continue
 
         # ID
-        wordnet_id = sense_info['wordnet_sense_id']
+        wordnet_id = forest.sense_keys[sense_key[row]]
 
         assert wordnet_id is not None
-        synset = safe_lemma_from_key(wordform, wordnet_id).synset().name()
+        synset = sense_key_synset(wordnet_id)
 
         # Label
-        sense_label = sense_info['label']
+        label = sense_label[row]
 
         parent_wordnet_id = None
-        if sense_label == SenseLabel.PROTOTYPE.value:
+        if label == SenseLabel.PROTOTYPE.value:
             parent_wordnet_id = None
             parent_synset = None
 
-            clusters[sense_id].append(wordnet_id)
+            clusters[row].append(wordnet_id)
         else:
-            head_sense_id = sense_info['child_of']
+            head_row = sense_parent[row]
             while not parent_wordnet_id:
-                parent_info = sense_dict[head_sense_id]
-
-                if not parent_info['is_virtual']:
-                    parent_wordnet_id = parent_info['wordnet_sense_id']
+                if not sense_is_virtual[head_row]:
+                    parent_wordnet_id = forest.sense_keys[sense_key[head_row]]
                 else:
-                    head_sense_id = parent_info['child_of']
-            parent_synset = safe_lemma_from_key(wordform, parent_wordnet_id).synset().name()
+                    head_row = sense_parent[head_row]
+            parent_synset = sense_key_synset(parent_wordnet_id)
 
             # Handle clusters
-            head_sense_id = sense_info['child_of']
-            while True:
-                parent_info = sense_dict[head_sense_id]
-                parent_core = parent_info['label'] == SenseLabel.PROTOTYPE.value
-                if parent_core:
-                    break
-                head_sense_id = parent_info['child_of']
-            clusters[head_sense_id].append(wordnet_id)
+            head_row = sense_parent[row]
+            while sense_label[head_row] != SenseLabel.PROTOTYPE.value:
+                head_row = sense_parent[head_row]
+            clusters[head_row].append(wordnet_id)
 
         synset_edges.append({
             'sense': wordnet_id,
             'concept': synset,
-            'connection': sense_label,
+            'connection': label,
             'parent_sense': parent_wordnet_id,
             'parent_concept': parent_synset
         })
 
-        if sense_label != SenseLabel.PROTOTYPE.value:
-            connections[sense_label].append({
+        if label != SenseLabel.PROTOTYPE.value:
+            connections[label].append({
                 'wordform': wordform,
                 'from_sense': parent_wordnet_id,
                 'to_sense': wordnet_id
@@ -112,5 +119,6 @@ def wrap_data(data, name):
 save_json('data/chainnet_simple/chainnet_metaphor.json', wrap_data(connections['metaphor'], 'Metaphor'))
 save_json('data/chainnet_simple/chainnet_metonymy.json', wrap_data(connections['metonymy'], 'Metonymy'))
 save_json('data/chainnet_simple/chainnet_homonymy.json', wrap_data(homonymy_data, 'Homonymy'))
+stage.record()
 
 info('Done')
\ No newline at end of file
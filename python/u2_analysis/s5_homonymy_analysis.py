@@ -1,13 +1,19 @@
 from collections import defaultdict
 
 import numpy as np
-from sklearn.metrics import adjusted_rand_score
-
-from python.common.common import open_dict_csv, safe_lemma_from_key, info, open_pickle, flatten
+from python.common.common import iter_dict_csv, info, open_json, flatten
+from python.common.sense_key_index import lookup_sense_key
+from python.common.lazy import sklearn_metrics
 from python.datatypes.sense_label import SenseLabel
+from python.datatypes.wordform import WordForm
+from python.common.instrumentation import run_report
+
+if __name__ == "__main__":
+    run_report()
 
 info('Loading chainnet')
-chainnet_data = open_pickle('bin/analysis/chainnet.pkl')
+chainnet_data = {word_data['wordform']: WordForm.from_dict(word_data)
+                 for word_data in open_json('data/chainnet.json')['content']}
 
 info('Finding basic statistics')
 total_words = 0
@@ -40,7 +46,7 @@ info(f'{metaphors}:{metonymys} metaphor:metonymy ({metaphors/metonymys})')
 info(f'{virtual_senses} Virtual and {mixed_senses} Mixed')
 
 info('Processing historical homonymys')
-data = open_dict_csv('data/analysis/within_pos_clusters.csv')
+data = iter_dict_csv('data/analysis/within_pos_clusters.csv')
 
 historical_homonyms_raw = defaultdict(set)
 for datapoint in data:
@@ -49,13 +55,12 @@ for datapoint in data:
     wordform = lemma.split('.')[0]
 
     sense_id = datapoint['wn_sense']
-    synset = safe_lemma_from_key(wordform, sense_id).synset()
+    entry = lookup_sense_key(sense_id)
 
-    if synset.pos() != 'n':
+    if entry.pos != 'n':
         continue
 
-    assert synset not in historical_homonyms_raw[lemma]
-    historical_homonyms_raw[lemma].add(synset.name())
+    historical_homonyms_raw[lemma].add(entry.synset)
 
 historical_homonyms = defaultdict(list)  # word -> list of sets of synset ids
 for lemma, synsets in historical_homonyms_raw.items():
@@ -68,18 +73,12 @@ info('Processing cognitive homonymys')
 cognitive_homonyms = defaultdict(list)
 for wordform, word_obj in chainnet_data.items():
 
-    clusters = []
+    tree = word_obj.tree_index()
+    clusters = {root: set() for root in tree.root_rows}
     for sense in word_obj.senses:
-        if sense.label == SenseLabel.PROTOTYPE:
-            cluster = {sense.get_wordnet_sense().synset().name()}
-            queue = list(sense.children)
-            while queue:
-                child = queue.pop()
-                queue.extend(list(child.children))
-                if child.wordnet_sense_id:
-                    cluster.add(child.get_wordnet_sense().synset().name())
-
-            clusters.append(cluster)
+        if sense.wordnet_sense_id:
+            clusters[tree.roots[sense.index]].add(sense.wordnet_synset_id)
+    clusters = list(clusters.values())
 
     assert len(set().union(*clusters)) == sum([len(c) for c in clusters])
     cognitive_homonyms[wordform] = clusters
@@ -167,7 +166,7 @@ for wordform, historical_clusters in historical_homonyms.items():
         historical_list.append(historical_itm)
 
     # Cluster agreement score
-    score = adjusted_rand_score(cognitive_list, historical_list)
+    score = sklearn_metrics.adjusted_rand_score(cognitive_list, historical_list)
     scores.append(score)
 
     # Counts
@@ -2,7 +2,13 @@ import math
 import random
 from collections import defaultdict
 
-from python.common.common import open_json, info, safe_lemma_from_key, open_pickle
+from python.common.common import open_json, info
+from python.common.chainnet_forest import open_chainnet_forest
+from python.common.wordnet_snapshot import open_wordnet_snapshot
+from python.common.instrumentation import run_report
+
+if __name__ == "__main__":
+    run_report()
 
 rand = random.Random(10)
 
@@ -87,6 +93,7 @@ lemmas_to_senses = lemmas_to_senses_filtered
 info('Filtering proper nouns')
 # Takes care of e.g. 'Macedonia'
 # (lemmas where every sense is an instance hypernym)
+wn = open_wordnet_snapshot()
 lemmas_to_senses_filtered = {}
 for lemma_id, sense_ids in lemmas_to_senses.items():
     word = lemma_id.split(':')[0]
@@ -95,7 +102,7 @@ for lemma_id, sense_ids in lemmas_to_senses.items():
     one_not_instance_hypernym = False
     one_lowercased = False
     for sense_id in sense_ids:
-        wn_lemma = safe_lemma_from_key(word, sense_id)
+        wn_lemma = wn.safe_lemma_from_key(sense_id)
         synset = wn_lemma.synset()
         instance_hypernyms = synset.instance_hypernyms()
         if len(instance_hypernyms) == 0:
@@ -131,8 +138,7 @@ lemmas_to_senses = lemmas_to_senses_filtered
 
 info('Filtering words done so far')
 done_words = set()
-chainnet_data = open_pickle('bin/analysis/chainnet.pkl')
-done_words = set(chainnet_data.keys())
+done_words = set(open_chainnet_forest().all_wordforms())
 
 info('Reformatting')
 num_senses_to_lemmas_all = defaultdict(set)
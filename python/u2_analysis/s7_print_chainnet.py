@@ -1,10 +1,23 @@
+import hashlib
+import io
+import json
+import os
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 
-from python.common.common import open_pickle, save_text_block, info, open_json
+from python.common.common import save_text_block, save_text_blocks, info, open_json, open_pickle, save_pickle
+from python.common.sense_key_index import INDEX_DIR, sense_key_index
+from python.common.stage_cache import Stage, hash_path
+from python.common.wordnet_snapshot import SNAPSHOT_DIR
+from python.datatypes.tikz import write_tikz
+from python.datatypes.wordform import WordForm, resolve_wordnet_attributes
 
-version = open_json('data/chainnet.json')['metadata']['version']
+RENDER_CACHE_FILE = 'bin/analysis/tikz_cache.pkl'
+RENDER_CODE = [__file__, 'python/datatypes/**/*.py', 'python/common/common.py', 'python/common/sense_key_index.py',
+               'python/common/wordnet_snapshot.py']
+RENDER_DATA = [INDEX_DIR, SNAPSHOT_DIR]  # WordNet attributes (such as word_string) are resolved from these
 
-output = r'''\documentclass[11pt]{article}
+PREAMBLE = r'''\documentclass[11pt]{article}
 \usepackage[a4paper, margin=0.8in]{geometry}
 \usepackage[T1]{fontenc} 
 \usepackage[english]{babel} 
@@ -78,7 +91,66 @@ output = r'''\documentclass[11pt]{article}
 \maketitle
 '''
 
-output += f'''
+
+def render_key(word_data, code_digest):
+    # Content hash of one word's release entry and the rendering code
+    digest = hashlib.sha256(code_digest.encode('utf-8'))
+    digest.update(json.dumps(word_data, sort_keys=True).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def render_sections(chapter_data):
+    # Renders the sections for a list of word entries; run in worker processes, one chapter at a time
+    words = [WordForm.from_dict(word_data) for word_data in chapter_data]
+    resolve_wordnet_attributes(words)
+
+    sections = []
+    for word_data, word in zip(chapter_data, words):
+        title = word_data['wordform'].upper()
+        if not word.known:
+            title += "\\textsuperscript{\\textcolor{Red}{$\\star$}}"
+
+        stream = io.StringIO()
+        stream.write(f'\n\\section{{{title}}}\n')
+        write_tikz(word, stream)
+        stream.write('\n')
+        sections.append(stream.getvalue())
+    return sections
+
+
+def main():
+    release = open_json('data/chainnet.json')
+    version = release['metadata']['version']
+
+    # Opened (and built if need be) first, so that the index and snapshot can be hashed, and before the workers start,
+    # which then share it rather than each building it
+    sense_key_index()
+    code_digest = ''.join(hash_path(path) or '' for path in RENDER_CODE + RENDER_DATA)
+    cache = open_pickle(RENDER_CACHE_FILE) if os.path.isfile(RENDER_CACHE_FILE) else {}
+
+    chapters = defaultdict(list)  # chapter code -> wordforms, in order
+    keys = {}
+    missing = defaultdict(list)  # chapter code -> word entries that are not cached
+    for word_data in sorted(release['content'], key=lambda word_data: word_data['wordform']):
+        wordform = word_data['wordform']
+        chapters[wordform[:2]].append(wordform)
+        keys[wordform] = render_key(word_data, code_digest)
+        if keys[wordform] not in cache:
+            missing[wordform[:2]].append(word_data)
+
+    info(f'Rendering {sum(len(chapter_data) for chapter_data in missing.values())} of {len(keys)} words '
+         f'({len(missing)} of {len(chapters)} chapters)')
+    if missing:
+        with ProcessPoolExecutor(max_workers=min(len(missing), os.cpu_count() or 1)) as executor:
+            for chapter_data, sections in zip(missing.values(), executor.map(render_sections, missing.values())):
+                for word_data, section in zip(chapter_data, sections):
+                    cache[keys[word_data['wordform']]] = section
+
+    for chapter_code, wordforms in chapters.items():
+        save_text_blocks(f'bin/analysis/latex/{chapter_code}.tex', (cache[keys[wordform]] for wordform in wordforms))
+
+    output = PREAMBLE
+    output += f'''
 \\paragraph{{ChainNet Version {version}}} The following is an automatically-generated PDF containing every ChainNet annotation.
 Because it was generated automatically, there are likely to be rendering mistakes.
 Each section corresponds to a word.
@@ -89,25 +161,18 @@ a red star by a sense ID indicates that the annotator did not know that sense.
 Features are not shown.
 '''
 
-chainnet = open_pickle('bin/analysis/chainnet.pkl')
-
-chapters = defaultdict(str)
-for i, wordform in enumerate(sorted(chainnet.keys())):
-
-    word = chainnet[wordform]
-
-    title = wordform.upper()
-    if not word.known:
-        title += "\\textsuperscript{\\textcolor{Red}{$\\star$}}"
-
-    chapters[wordform[:2]] += f'\n\\section{{{title}}}\n'+word.get_tikz()+'\n'
+    output += ''.join(f"\n\\input{{latex/{chapter_code}}}" for chapter_code in chapters.keys())
+    output += '\n\n\\end{document}'
+    save_text_block('bin/analysis/chainnet.tex', output)
 
-for chapter_code, chapter_output in chapters.items():
+    # Only entries for the current release are kept
+    save_pickle(RENDER_CACHE_FILE, {key: cache[key] for key in keys.values()})
 
-    output += f"\n\\input{{latex/{chapter_code}}}"
-    save_text_block(f'bin/analysis/latex/{chapter_code}.tex', chapter_output)
+    info('Done')
 
-output += '\n\n\\end{document}'
-save_text_block('bin/analysis/chainnet.tex', output)
 
-info('Done')
+if __name__ == "__main__":
+    stage = Stage('u2_analysis/s7_print_chainnet', inputs=['data/chainnet.json'], code=[__file__, 'python/datatypes'])
+    if not stage.skip_if_fresh():
+        main()
+        stage.record()
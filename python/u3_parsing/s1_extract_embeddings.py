@@ -1,14 +1,24 @@
 # Build dicts of embeddings, and vocabulary
 import os
+import sys
 import numpy as np
 from bidict import bidict
-from gensim.models import KeyedVectors
 from nltk.corpus import wordnet as wn
 from python.common.common import info, save_pickle, warn
+from python.common.lazy import lazy_import
+from python.common.stage_cache import Stage
+
+KeyedVectors = lazy_import('gensim.models', 'KeyedVectors')
 
 
 assert wn.get_version() == '3.0'
 
+stage = Stage('u3_parsing/s1_extract_embeddings',
+              inputs=['data/parsing/sensembert_data/sensembert_EN_supervised.txt'],
+              outputs=['bin/parsing/sensembert_embeddings.bin'], params={'wordnet': wn.get_version()})
+if stage.skip_if_fresh():
+    sys.exit(0)
+
 info("Opening sense embeddings")
 
 sensembert_file = 'bin/parsing/sensembert_embeddings.bin'
@@ -63,3 +73,4 @@ save_pickle('bin/parsing/sensembert_embeddings.pkl', sensembert_embeddings)
 save_pickle('bin/parsing/sense_vocabulary.pkl', bidict(sense_vocabulary))  # WN sense ('lemma') IDS -> index of emb
 
 info('Done')
+stage.record()
@@ -1,22 +1,29 @@
 import numpy as np
 import torch
 
-from python.common.common import open_pickle, info, save_pickle, flatten, open_chainnet
+from python.common.common import open_pickle, info, save_pickle, flatten, chainnet_file
+from python.common.stage_cache import Stage
+from python.common.chainnet_reader import open_chainnet_reader
 import random
+import sys
 
 from python.common.global_variables import EDGE_TYPE_MAP, seed
 from python.datatypes.sense_label import SenseLabel
 
 random.seed(seed)
 
+stage = Stage('u3_parsing/s2_preprocess_corpus', inputs=[chainnet_file(version="0.9"), 'bin/parsing/sense_vocabulary.pkl'],
+              params={'seed': seed, 'edge_types': EDGE_TYPE_MAP})
+if stage.skip_if_fresh():
+    sys.exit(0)
+
 info('Loading data')
-chainnet = open_chainnet(version="0.9")
+chainnet = open_chainnet_reader(version="0.9")
 vocab = open_pickle('bin/parsing/sense_vocabulary.pkl')
 
 # Fix order for backward compatibility with checkpoint models
 ordered_words = ['almanac', 'can', 'diary', 'ghetto', 'individual', 'insult', 'layout', 'nodule', 'patient', 'range', 'cologne', 'company', 'congestion', 'flounder', 'homo', 'leaf', 'mosaic', 'peacemaker', 'shield', 'volunteer', 'cathedral', 'chestnut', 'goaltender', 'liberal', 'neighborhood', 'person', 'receipt', 'rose', 'situation', 'superior', 'bunker', 'chow', 'compression', 'dial', 'filter', 'freshman', 'imperium', 'pawn', 'phosphorus', 'process', 'agonist', 'bag', 'beneficiary', 'bop', 'bosom', 'emblem', 'lap', 'mess', 'whisper', 'zaire', 'backup', 'circle', 'cola', 'dam', 'fender', 'pearl', 'reproduction', 'rosemary', 'vegetation', 'yoga', 'camp', 'holler', 'inflation', 'landmark', 'maiden', 'mirage', 'programme', 'slant', 'tummy', 'wreck', 'aficionado', 'chlamys', 'commonwealth', 'delegation', 'medallion', 'prospect', 'reel', 'ring', 'title', 'twin', 'assessment', 'gyro', 'horseman', 'hunchback', 'letter', 'middle', 'plan', 'quack', 'quirk', 'stag', 'advantage', 'amp', 'bevel', 'branch', 'couplet', 'foreground', 'jungle', 'pet', 'poker', 'profession', 'arc', 'catalyst', 'facility', 'farmer', 'ford', 'obstacle', 'predecessor', 'pulse', 'resource', 'review', 'aba', 'apathy', 'fingerboard', 'metric', 'nude', 'oppression', 'outburst', 'poultry', 'suckling', 'tent', 'caliphate', 'colours', 'navy', 'oscillation', 'outfit', 'palace', 'purchase', 'tension', 'theory', 'warmth', 'bamboo', 'energy', 'equilibrium', 'hull', 'junkie', 'measure', 'monster', 'parade', 'punch', 'station', 'bride', 'contusion', 'doe', 'dumbbell', 'henry', 'hill', 'libertarian', 'manzanita', 'sap', 'spin', 'advent', 'exodus', 'magazine', 'mobile', 'polo', 'sanctum', 'sea', 'sentence', 'spider', 'style', 'anatomy', 'century', 'conspiracy', 'crossbar', 'davenport', 'drone', 'farce', 'pectoral', 'rapture', 'toilet', 'adobe', 'dogma', 'forwarding', 'impost', 'journal', 'liberty', 'newspaper', 'passport', 'perch', 'volleyball', 'aberration', 'arms', 'black', 'chick', 'companion', 'distribution', 'heather', 'item', 'passageway', 'viola', 'basin', 'boarding', 'cicero', 'design', 'digest', 'grade', 'level', 'lobe', 'snare', 'web', 'cell', 'conservative', 'correlation', 'embassy', 'headman', 'jewel', 'startup', 'tan', 'tarantula', 'vehicle', 'attack', 'bucket', 'example', 'forward', 'harbour', 'jazz', 'message', 'money', 'protest', 'theater', 'archer', 'calf', 'diamante', 'displacement', 'newmarket', 'seat', 'segment', 'terror', 'vent', 'worship', 'antecedent', 'downfall', 'iron', 'journalist', 'mythology', 'picnic', 'request', 'sampling', 'slipper', 'spell', 'audit', 'boom', 'country', 'eighth', 'element', 'friend', 'overture', 'sweet', 'transcript', 'variety', 'airing', 'bursa', 'corona', 'dead', 'ideal', 'inhalation', 'prime', 'resort', 'singles', 'skill', 'alpha', 'anticipation', 'bible', 'hemisphere', 'inventory', 'joint', 'par', 'quantum', 'spring', 'subtlety', 'bodyguard', 'chou', 'cleavage', 'craftsman', 'descent', 'priority', 'royalty', 'stuff', 'sugar', 'western', 'deal', 'fitness', 'lesson', 'lid', 'plaza', 'rutherford', 'segregation', 'selection', 'sense', 'steering', 'bale', 'bat', 'bonding', 'breeding', 'cancer', 'cd', 'contempt', 'hut', 'lee', 'raceway', 'atmosphere', 'blight', 'coconut', 'indie', 'lyceum', 'mezzo', 'prophet', 'sock', 'stove', 'three', 'birth', 'cash', 'conservatory', 'dick', 'os', 'perimeter', 'picture', 'pueblo', 'saddle', 'treatment', 'best', 'blasphemy', 'cantor', 'doctor', 'grounds', 'imperialism', 'invasion', 'newton', 'portal', 'sedan', 'banding', 'embroidery', 'excellence', 'flank', 'justice', 'kraal', 'quad', 'reply', 'villa', 'weaver', 'bulb', 'escort', 'flute', 'interface', 'olive', 'plane', 'proxy', 'tank', 'trump', 'watershed', 'barrage', 'girlfriend', 'horse', 'inmate', 'may', 'obstruction', 'patron', 'shoe', 'trailer', 'wrench', 'almond', 'auction', 'bolivar', 'bravo', 'bug', 'fantasy', 'mph', 'origin', 'retainer', 'wolf', 'alcohol', 'bang', 'cable', 'coffee', 'consonant', 'covert', 'emirate', 'fringe', 'illusion', 'sound', 'aisle', 'atom', 'chile', 'convocation', 'in', 'lesion', 'mirror', 'orphan', 'relative', 'window', 'array', 'billfish', 'cloak', 'currant', 'event', 'fluid', 'lane', 'natural', 'trio', 'tyranny', 'backbone', 'clay', 'fanny', 'fry', 'heist', 'increment', 'mate', 'rain', 'skate', 'toe', 'burnside', 'cast', 'code', 'gate', 'miller', 'pagan', 'plea', 'print', 'sleeve', 'spectrum', 'ashram', 'deputy', 'notch', 'pastor', 'pause', 're', 'senate', 'slug', 'topography', 'traffic', 'discrimination', 'forties', 'gossip', 'hazard', 'history', 'pint', 'rice', 'savoy', 'uncertainty', 'wherry', 'arm', 'classic', 'fraternity', 'khan', 'nationalist', 'neologism', 'requiem', 'south', 'steel', 'tactics', 'bid', 'box', 'condominium', 'force', 'interview', 'irrigation', 'joy', 'maillot', 'patriarchate', 'store', 'allegation', 'configuration', 'crater', 'endocrine', 'horror', 'moonshine', 'ohm', 'sheep', 'traitor', 'vice', 'basil', 'information', 'ingredient', 'lattice', 'merlin', 'ossification', 'partner', 'rick', 'staple', 'target', 'apex', 'guard', 'ham', 'jet', 'premium', 'rest', 'secret', 'settlement', 'technique', 'vector', 'alloy', 'ballot', 'clash', 'discount', 'guru', 'hospice', 'monsoon', 'motor', 'seminar', 'umbrella', 'cairn', 'convection', 'cost', 'fraud', 'genesis', 'hide', 'hulk', 'loss', 'parallel', 'substructure', 'cookie', 'editor', 'eight', 'mecca', 'memory', 'probability', 'ransom', 'recapitulation', 'solution', 'witness', 'communication', 'compass', 'despair', 'duet', 'planetarium', 'pole', 'predator', 'property', 'province', 'tyre', 'contingent', 'etymology', 'fang', 'magus', 'organisation', 'pascal', 'prayer', 'protocol', 'separate', 'woe', 'armour', 'chain', 'compensation', 'doc', 'fire', 'lien', 'needle', 'short', 'staff', 'sunshine', 'affairs', 'bust', 'conflict', 'contestant', 'hollow', 'pennant', 'scholastic', 'semiconductor', 'third', 'wight', 'chad', 'client', 'community', 'emperor', 'grenadier', 'homestretch', 'mail', 'pivot', 'tongue', 'turf', 'bourbon', 'gold', 'interrogation', 'mercantilism', 'path', 'puff', 'strap', 'tempo', 'trout', 'violet', 'bay', 'beaver', 'fluff', 'gem', 'hum', 'manuscript', 'mold', 'neurology', 'railroad', 'value', 'collection', 'harness', 'lorry', 'martin', 'recoil', 'rigour', 'riot', 'rook', 'shoal', 'spar', 'antenna', 'archangel', 'eve', 'floor', 'hike', 'midway', 'prefecture', 'prop', 'rubber', 'waltz', 'capacity', 'cole', 'dower', 'down', 'gown', 'ire', 'latex', 'platform', 'trick', 'weapon', 'cap', 'conference', 'cot', 'doll', 'drag', 'fig', 'fraction', 'manna', 'parry', 'temple', 'bank', 'brahmin', 'contrast', 'echidna', 'elf', 'enamel', 'melody', 'model', 'shipping', 'telecommunication', 'cannabis', 'charter', 'intelligence', 'mason', 'mission', 'moloch', 'rally', 'rue', 'vigil', 'wireless', 'admiral', 'baron', 'civilization', 'ebb', 'faculty', 'folk', 'ribbon', 'turret', 'vintage', 'zone', 'academy', 'banquet', 'chance', 'craft', 'eddy', 'guy', 'honour', 'maroon', 'topology', 'wake', 'bullpen', 'deviation', 'flashback', 'ghost', 'groundnut', 'homecoming', 'machine', 'precipitation', 'sweat', 'ulster', 'advertising', 'aliyah', 'fog', 'football', 'impotence', 'mallet', 'nurse', 'special', 'subscription', 'thread', 'activity', 'chi', 'estate', 'fabric', 'gesture', 'hare', 'jurist', 'kale', 'leeway', 'relay', 'aspect', 'embryo', 'gospel', 'missionary', 'orb', 'overload', 'sawmill', 'shuffle', 'territory', 'unison', 'beef', 'bike', 'breach', 'copy', 'glycine', 'gypsy', 'hacker', 'nerd', 'site', 'softball', 'dill', 'excavation', 'hair', 'none', 'plantain', 'solid', 'spinach', 'sympathy', 'trash', 'vessel', 'carnival', 'cycle', 'diamond', 'ecology', 'imp', 'judgement', 'pumpkin', 'quarantine', 'trust', 'yarn', 'annihilation', 'canton', 'frequency', 'interception', 'java', 'luck', 'phone', 'snail', 'spiral', 'tissue', 'argyle', 'cascade', 'cumulus', 'easter', 'heat', 'horizon', 'jug', 'proof', 'sultana', 'turntable', 'blockade', 'expiry', 'gambit', 'honey', 'hotspot', 'landholding', 'miscarriage', 'palatinate', 'sapper', 'shoulder', 'bombardment', 'bundle', 'chocolate', 'computer', 'consciousness', 'elephant', 'epoch', 'nickname', 'piston', 'warner', 'blank', 'chapter', 'environment', 'hedgehog', 'illiteracy', 'malice', 'mint', 'quadrangle', 'square', 'utopia', 'barrio', 'conservancy', 'distortion', 'facelift', 'foil', 'liability', 'marble', 'obelisk', 'panorama', 'plume', 'arctic', 'constellation', 'crop', 'culture', 'gill', 'hub', 'pad', 'percentage', 'soddy', 'vestibule', 'autocracy', 'commission', 'menu', 'naturalist', 'party', 'porter', 'professional', 'stew', 'territorial', 'yuan', 'bedding', 'couple', 'dollar', 'exit', 'phrase', 'piano', 'shin', 'shire', 'span', 'violation', 'boulder', 'casualty', 'championship', 'mafia', 'marseille', 'mesh', 'pessimism', 'population', 'tab', 'voyage', 'avalanche', 'baronetage', 'flick', 'fuller', 'latitude', 'mace', 'perfection', 'poplar', 'stage', 'yakuza', 'amount', 'bloodline', 'girl', 'holdout', 'initiative', 'lever', 'marine', 'rupture', 'swamp', 'wilt', 'den', 'detective', 'flesh', 'horseback', 'pen', 'platoon', 'rattle', 'sparrow', 'temperature', 'trotter', 'acid', 'alien', 'caput', 'colony', 'concussion', 'fin', 'lease', 'revere', 'tape', 'zero', 'complexion', 'dolly', 'essay', 'fee', 'ovule', 'recreation', 'sample', 'subject', 'turmoil', 'tweed', 'collocation', 'evidence', 'min', 'package', 'pot', 'roost', 'sanctuary', 'secession', 'shelter', 'wisdom', 'chuck', 'edda', 'hitch', 'knee', 'occult', 'respiration', 'scout', 'stream', 'sum', 'theme', 'alphabet', 'basswood', 'city', 'commuter', 'depletion', 'general', 'headshot', 'immortality', 'outflow', 'rotation', 'carol', 'complex', 'dissonance', 'kamikaze', 'morning', 'proximity', 'qibla', 'repertoire', 'train', 'venue', 'behaviour', 'birch', 'cherry', 'crust', 'culverin', 'extra', 'federation', 'fledgling', 'outsider', 'runway', 'bore', 'collaboration', 'contrary', 'equity', 'fool', 'grave', 'group', 'kestrel', 'photography', 'west', 'beehive', 'cloud', 'drill', 'experiment', 'first', 'hours', 'isthmus', 'mind', 'possession', 'whale', 'appreciation', 'biotechnology', 'broccoli', 'business', 'episode', 'flax', 'forester', 'heel', 'scheme', 'shamrock', 'chevalier', 'comrade', 'cork', 'ego', 'escadrille', 'generation', 'obsession', 'pile', 'reincarnation', 'yeoman', 'crux', 'gentile', 'gum', 'knife', 'neighbourhood', 'phalanx', 'stall', 'trimester', 'verse', 'zinfandel', 'bark', 'bomb', 'brazil', 'constant', 'curve', 'dodge', 'juxtaposition', 'kingpin', 'option', 'savage', 'bonus', 'captivity', 'carpet', 'distress', 'handful', 'idea', 'momentum', 'oat', 'policy', 'speedway', 'administration', 'camouflage', 'dissent', 'gamble', 'injustice', 'lace', 'payload', 'persona', 'sovereignty', 'streamer', 'castle', 'endeavor', 'innovation', 'laboratory', 'manufacturer', 'merit', 'outlet', 'reservoir', 'tribe', 'troy', 'acetate', 'appendix', 'chief', 'earth', 'proconsul', 'provincial', 'quince', 'scooter', 'sheath', 'suicide', 'armband', 'basic', 'beast', 'excess', 'landslide', 'maxim', 'orchestra', 'penalty', 'preconception', 'tar', 'debate', 'donor', 'fibre', 'filament', 'gazetteer', 'grid', 'iris', 'jam', 'opposite', 'pasture', 'assault', 'axis', 'bartlett', 'breakdown', 'class', 'draught', 'garbage', 'prosperity', 'refund', 'token', 'alabaster', 'halfback', 'hockey', 'pipeline', 'rust', 'sake', 'sanitation', 'shuttle', 'supply', 'vanguard', 'arbitration', 'bannister', 'canary', 'cuckoo', 'dolphin', 'grease', 'iteration', 'mesa', 'oath', 'pipe', 'bait', 'beheading', 'brute', 'hamburger', 'jacket', 'jonah', 'megabyte', 'parole', 'rage', 'vocal', 'colon', 'cult', 'fear', 'infrared', 'narcissus', 'patriarch', 'personnel', 'stint', 'tough', 'vat', 'battle', 'bobsleigh', 'corpus', 'dress', 'eagle', 'family', 'pencil', 'spectre', 'sport', 'spruce', 'chip', 'compassion', 'cypress', 'edition', 'honor', 'patent', 'protagonist', 'son', 'twins', 'varlet', 'ammonia', 'ass', 'association', 'belt', 'button', 'cinnamon', 'expenditure', 'pruning', 'trunk', 'whiplash', 'bourne', 'capital', 'chase', 'headquarters', 'mi', 'millinery', 'organ', 'peacock', 'total', 'venturi', 'champion', 'executive', 'font', 'lactation', 'neck', 'novice', 'plank', 'response', 'texture', 'verge', 'bey', 'dipole', 'levy', 'ling', 'marketplace', 'musk', 'port', 'readability', 'regression', 'salmon', 'abortion', 'charity', 'chemise', 'director', 'dot', 'faction', 'fidelity', 'interference', 'perry', 'priest', '78', 'glory', 'hour', 'klondike', 'lama', 'pang', 'pouch', 'sacrifice', 'thaw', 'toy', 'brush', 'detachment', 'fate', 'gender', 'mandarin', 'seventh', 'strut', 'vane', 'will', 'word', 'clutch', 'falls', 'inquiry', 'lubrication', 'mar', 'penny', 'question', 'roundhead', 'talent', 'voodoo', 'cistern', 'coral', 'excuse', 'favour', 'fragrance', 'gap', 'garibaldi', 'sheik', 'soy', 'university', 'bus', 'concern', 'contour', 'guest', 'lodge', 'market', 'mechanism', 'regalia', 'sol', 'wiener', 'anthem', 'boy', 'brother', 'challenge', 'complication', 'demon', 'jinx', 'knight', 'limerick', 'ten', 'atrocity', 'comedy', 'cyclone', 'fare', 'kelvin', 'monologue', 'parasite', 'peddler', 'predisposition', 'redhead', 'abundance', 'dollhouse', 'footstep', 'fur', 'inferior', 'map', 'motif', 'mourning', 'school', 'woman', 'atm', 'chinook', 'flair', 'hypothesis', 'paradigm', 'pinnacle', 'shape', 'spectator', 'sweetheart', 'testament', 'capitol', 'deformity', 'lemon', 'overtime', 'peck', 'pyjama', 'rave', 'rupee', 'sterilization', 'street', 'bench', 'claw', 'cusp', 'dent', 'dough', 'loyalty', 'miniature', 'snout', 'superman', 'vault', 'engineering', 'fiber', 'fluctuation', 'footing', 'grape', 'methodology', 'observatory', 'rap', 'suit', 'turnout', 'corn', 'crowd', 'effect', 'inroad', 'lobster', 'orange', 'razorback', 'saint', 'upper', 'waratah', 'counterpart', 'crap', 'donation', 'dwarf', 'hardware', 'legend', 'runaway', 'scale', 'watercolor', 'wicket', 'automation', 'axiom', 'beech', 'exemption', 'flagpole', 'gray', 'inquisition', 'load', 'spate', 'toll', 'art', 'extreme', 'forbearance', 'grouse', 'jade', 'marsh', 'meal', 'puzzle', 'ruth', 'truth', 'amputation', 'ape', 'appeal', 'cereal', 'marquee', 'pattern', 'pollution', 'secretariat', 'seven', 'symphony', 'armyworm', 'bitch', 'bluff', 'commando', 'cowhide', 'maid', 'purpose', 'radio', 'salt', 'skeleton', 'audio', 'barrel', 'disguise', 'footwear', 'lavender', 'rapper', 'sin', 'soup', 'trail', 'vulture', 'ark', 'circuit', 'coyote', 'elevation', 'mechanization', 'mould', 'pamphlet', 'screen', 'single', 'tuition', 'broom', 'cape', 'chicken', 'circulation', 'cosmology', 'dixie', 'goon', 'pilot', 'science', 'secrecy', 'army', 'brahman', 'citizenship', 'crest', 'ferry', 'fixation', 'kern', 'region', 'thanksgiving', 'witch', 'alert', 'fluke', 'gin', 'lithograph', 'marijuana', 'sack', 'salvo', 'superintendent', 'throat', 'virgin', 'bastard', 'condition', 'depression', 'discretion', 'fragment', 'limb', 'modernization', 'passion', 'quota', 'skin', 'cartoon', 'cradle', 'currency', 'effort', 'fruit', 'magnitude', 'rifleman', 'shore', 'still', 'sun', 'benedictine', 'cage', 'difficulty', 'echo', 'flap', 'funk', 'millet', 'official', 'spy', 'tool', 'bone', 'dignity', 'experience', 'jackknife', 'progress', 'proportion', 'setup', 'source', 'trough', 'uptake', 'derision', 'ear', 'fortune', 'midland', 'must', 'pier', 'pop', 'quintessence', 'teddy', 'wedge', 'combustion', 'commissary', 'host', 'insurgent', 'outboard', 'pat', 'pillbox', 'pons', 'transplant', 'underworld', 'coma', 'cricket', 'custody', 'hazel', 'holdup', 'rill', 'safety', 'sand', 'sort', 'unit', 'aviation', 'command', 'fort', 'goose', 'grub', 'napoleon', 'philosophy', 'reactor', 'silesia', 'straits', 'ab', 'concentration', 'diet', 'dispossession', 'formula', 'lamp', 'page', 'project', 'rabbit', 'tenth', 'arch', 'cognate', 'exhibition', 'folio', 'gig', 'glass', 'hardship', 'humour', 'mount', 'patronage', 'blood', 'bread', 'creole', 'forte', 'insight', 'maize', 'pump', 'rebellion', 'snipe', 'video', 'awareness', 'bishop', 'clasp', 'electromagnetism', 'gibbon', 'macintosh', 'output', 'pig', 'stake', 'transmission', 'aperture', 'college', 'deanery', 'disagreement', 'function', 'polarization', 'prohibition', 'shortstop', 'surprise', 'victim', 'ablation', 'bard', 'boa', 'bud', 'convention', 'dickens', 'fact', 'ore', 'peer', 'quintal', 'affinity', 'berry', 'biogenesis', 'flannel', 'menace', 'mutation', 'suspense', 'universe', 'vision', 'wheel', 'alliance', 'cent', 'exercise', 'fun', 'incident', 'playground', 'quadrant', 'snow', 'tail', 'teacup', 'assassination', 'becket', 'bunny', 'degree', 'lumberjack', 'pinch', 'story', 'theology', 'tram', 'transition', 'comb', 'dirt', 'dose', 'knot', 'mew', 'phenomenon', 'pup', 'rasp', 'septum', 'substrate', 'bantamweight', 'cone', 'mouth', 'repertory', 'riff', 'riverside', 'shark', 'solicitor', 'tang', 'whey', 'ballgame', 'dripping', 'ejaculation', 'maffia', 'piste', 'plasmodium', 'rotogravure', 'treadmill', 'vanilla', 'whiff', 'anthrax', 'cityscape', 'curd', 'firefly', 'litany', 'looking', 'lunatic', 'outpouring', 'perseverance', 'splendour', 'bittersweet', 'capriole', 'celery', 'fervour', 'hoot', 'nosedive', 'rake', 'shallot', 'sidebar', 'tessellation', 'betrothal', 'burlesque', 'haddock', 'keystone', 'nod', 'permutation', 'sixties', 'swab', 'ultramarine', 'waters', 'airstream', 'blossom', 'disfavor', 'eucalyptus', 'genotype', 'husk', 'paraffin', 'stature', 'tee', 'upsurge', 'asparagus', 'castration', 'hajji', 'magnolia', 'munition', 'oka', 'pee', 'quadruplet', 'recompense', 'tingle', 'beachhead', 'fraise', 'gimmick', 'goldeneye', 'narthex', 'palpitation', 'retort', 'shank', 'tinsel', 'tit', 'echelon', 'fizzle', 'inconvenience', 'pussycat', 'ragweed', 'ramification', 'rein', 'rep', 'valence', 'yarder', 'anathema', 'caesura', 'carioca', 'crumb', 'elixir', 'goldfinch', 'jumble', 'midriff', 'phylum', 'tontine', 'afterglow', 'amplitude', 'bast', 'buffer', 'camlet', 'ferret', 'hotbed', 'krone', 'mocha', 'obscurantism', 'absinthe', 'beadle', 'bollock', 'canto', 'fils', 'lull', 'marrow', 'orris', 'repletion', 'wainscot', 'agnostic', 'checkout', 'chesterfield', 'depravity', 'fatalism', 'italic', 'palette', 'parquet', 'rout', 'rubric', 'adoration', 'discolouration', 'gestation', 'groundwork', 'lump', 'misapplication', 'nip', 'parrot', 'pinstripe', 'recourse', 'chivalry', 'dentition', 'egoism', 'fawn', 'martingale', 'pennon', 'pip', 'sigh', 'snuff', 'swede', 'bight', 'conscience', 'dragnet', 'epilogue', 'funnel', 'intermezzo', 'masquerade', 'nozzle', 'sardine', 'swath', 'comma', 'counterattack', 'denim', 'fermi', 'macula', 'parterre', 'phantasy', 'polyester', 'quicksand', 'turpentine', 'attic', 'auricula', 'blackfish', 'hock', 'mime', 'paternoster', 'pinpoint', 'sphinx', 'warpath', 'wilding', 'alewife', 'bogie', 'dimple', 'envelope', 'exorcist', 'juggernaut', 'miscue', 'secant', 'superscription', 'transferee', 'coffer', 'marchioness', 'overgrowth', 'siren', 'squid', 'sterilisation', 'tremor', 'wafer', 'wallop', 'winkle', 'bur', 'convulsion', 'instability', 'lint', 'pacifism', 'pondweed', 'prudence', 'radiology', 'spasm', 'swag', 'catchword', 'chauvinism', 'disjunction', 'effusion', 'fleece', 'fugitive', 'furor', 'loophole', 'millenary', 'static', 'bolero', 'consumerism', 'distrust', 'indigo', 'rostrum', 'shroud', 'skank', 'spearhead', 'theocracy', 'throttle', 'bazar', 'coho', 'dialectic', 'draftsman', 'evensong', 'gourd', 'quotient', 'seine', 'spatula', 'translocation', 'grunt', 'harpy', 'hassock', 'kink', 'lethargy', 'nutcracker', 'pillage', 'poinciana', 'tarmac', 'townsman', 'conformity', 'flounce', 'grandstand', 'mush', 'plait', 'procurator', 'puffball', 'scorcher', 'silkworm', 'sorrow', 'blueberry', 'carillon', 'descender', 'dulcimer', 'koine', 'locating', 'roan', 'seclusion', 'tomato', 'words', 'appropriateness', 'citron', 'deuce', 'haymaker', 'insulation', 'lineament', 'mayflower', 'rondeau', 'semblance', 'yak', 'flatfish', 'forfeiture', 'hypocrisy', 'levity', 'lifeblood', 'lockup', 'proscription', 'shipway', 'sodom', 'whopper', 'disfigurement', 'fount', 'foursome', 'musketry', 'oriole', 'sable', 'sconce', 'scow', 'sideshow', 'tutelage', 'bent', 'clout', 'eclat', 'extrusion', 'fecundity', 'fob', 'funfair', 'plagiarism', 'solferino', 'trusteeship', 'caller', 'capitalisation', 'correction', 'crow', 'gaiter', 'guava', 'lurch', 'plumbing', 'roundel', 'tenderness', 'basso', 'calabash', 'cocoa', 'halcyon', 'hotdog', 'impaction', 'jab', 'plastron', 'sextette', 'shock', 'bole', 'offset', 'pallium', 'passing', 'positiveness', 'slice', 'substratum', 'suede', 'tumult', 'whitefish', 'beefwood', 'brownie', 'chastity', 'clipper', 'launching', 'nightcap', 'preemption', 'tithe', 'valency', 'widowhood', 'albatross', 'centralization', 'condensation', 'contrivance', 'debacle', 'gad', 'gillie', 'modifier', 'sledge', 'trill', 'baster', 'beat', 'cant', 'commonness', 'dinar', 'heartsease', 'occlusion', 'reverberation', 'sleeper', 'underbelly', 'bathing', 'breadfruit', 'deliverer', 'derivation', 'disintegration', 'disrespect', 'lowness', 'mellowness', 'sewerage', 'tread', 'anklet', 'bondsman', 'conceit', 'condenser', 'crock', 'flutter', 'hypostasis', 'inadequacy', 'lining', 'severeness', 'catch', 'concatenation', 'glee', 'graphics', 'illumination', 'plainness', 'quandong', 'rendering', 'shadow', 'vandal', 'alerting', 'crotchet', 'deepness', 'derogation', 'grandness', 'handwriting', 'neutralization', 'recall', 'traditionalism', 'wink', 'ambrosia', 'blush', 'cutoff', 'flush', 'largeness', 'orderly', 'pawpaw', 'photogravure', 'pool', 'scalawag', 'coriander', 'efflorescence', 'fixer', 'fossa', 'grind', 'miter', 'rant', 'rhumba', 'robe', 'tribalism', 'cheat', 'cob', 'delicacy', 'pestle', 'saltation', 'skunk', 'smoothness', 'stinger', 'waterspout', 'zombi', 'dresser', 'drumbeat', 'flak', 'housebreaker', 'lather', 'lure', 'makeover', 'nonconformity', 'perfumery', 'replication', 'backseat', 'cassava', 'courser', 'falsification', 'floater', 'lentil', 'normality', 'phallus', 'raffia', 'simpleness', 'armoury', 'concoction', 'moulding', 'politics', 'pommel', 'preponderance', 'sharpness', 'smack', 'sprat', 'wisp', 'carotene', 'congener', 'firebird', 'flue', 'granadilla', 'misdirection', 'proliferation', 'quintette', 'quiver', 'sestet', 'caper', 'diwan', 'drogue', 'enchantment', 'fennel', 'ingenue', 'medulla', 'sensationalism', 'smallness', 'throwaway', 'aspergillosis', 'aster', 'bathos', 'dado', 'drove', 'fiddler', 'orgy', 'prelim', 'prose', 'reversal', 'depersonalization', 'dram', 'exaltation', 'neophyte', 'priming', 'puddle', 'reflexion', 'scourge', 'softness', 'thatch', 'affirmation', 'filler', 'folly', 'postscript', 'scoop', 'sheldrake', 'sloppiness', 'tabasco', 'taro', 'whitehead', 'acquirer', 'bikini', 'bonito', 'comforter', 'louse', 'menorah', 'papilla', 'profundity', 'relaxation', 'stilt', 'consort', 'enormity', 'excitement', 'lanyard', 'pick', 'radish', 'stepper', 'superiority', 'trimmer', 'want', 'exposure', 'fuzz', 'heaving', 'hunt', 'receptacle', 'septet', 'sitter', 'skimming', 'torment', 'tumbler', 'clap', 'cock', 'connexion', 'corydalis', 'inwardness', 'judicature', 'paprika', 'schtick', 'shortness', 'squeeze', 'birthplace', 'bow', 'discharge', 'fascia', 'feeder', 'gag', 'header', 'rustication', 'spray', 'vexation', 'absolutism', 'caisson', 'coney', 'familiarity', 'kauri', 'minim', 'sucker', 'transmutation', 'variance', 'wildness', 'faintness', 'gait', 'heave', 'insufficiency', 'medlar', 'mover', 'respite', 'savory', 'stoop', 'tierce', 'deadwood', 'diagonal', 'dirham', 'firmness', 'helleborine', 'knocker', 'lug', 'ordinary', 'prosody', 'scintillation', 'accretion', 'bellow', 'crib', 'okra', 'plunger', 'pyrethrum', 'recital', 'sop', 'sparkle', 'whim', 'assimilation', 'canvasser', 'dullness', 'hydrant', 'reasonableness', 'sorrel', 'superposition', 'swing', 'transcriber', 'yearling', 'bombshell', 'cranberry', 'dynamism', 'molding', 'rawness', 'reduplication', 'sequestration', 'smartness', 'snapper', 'voider', 'candle', 'capitalization', 'chop', 'finisher', 'impulse', 'peg', 'pocketbook', 'realization', 'smoke', 'soybean', 'baulk', 'chalk', 'czar', 'desktop', 'desolation', 'doomsday', 'gravure', 'hack', 'nautilus', 'peanut', 'circlet', 'cutting', 'devastation', 'drift', 'liege', 'parsnip', 'pompano', 'regionalism', 'rescript', 'whistler', 'annoyance', 'bran', 'collage', 'constriction', 'creep', 'epigraph', 'lamella', 'sandbox', 'sling', 'undercut', 'gantlet', 'hangover', 'honeysuckle', 'kip', 'pacemaker', 'quid', 'quintuplet', 'tart', 'wash', 'wintergreen', 'annulet', 'deflection', 'filling', 'fix', 'flatness', 'float', 'refinement', 'stiffness', 'stocks', 'wiper', 'crappie', 'ironwood', 'mackinaw', 'pallet', 'rocker', 'simplification', 'straddle', 'tick', 'whipping', 'withdrawer', 'andromeda', 'categorisation', 'isolation', 'maguey', 'narrowness', 'preserver', 'retardation', 'ringlet', 'rump', 'slop', 'abandon', 'despotism', 'eroticism', 'etna', 'hairline', 'humus', 'misgiving', 'modesty', 'pap', 'quartette', 'dilation', 'elision', 'ether', 'flagstaff', 'followup', 'frill', 'obbligato', 'quaternary', 'snub', 'sudra', 'blond', 'demigod', 'drip', 'getaway', 'hookup', 'impasse', 'lark', 'patella', 'reprieve', 'vitriol', 'agglomerate', 'dentin', 'doughnut', 'fascicle', 'mitre', 'mortification', 'precondition', 'psychopathology', 'sidewall', 'statistician', 'annunciation', 'bleach', 'colt', 'estrangement', 'farmstead', 'gallon', 'impoverishment', 'leveling', 'scorn', 'spud', 'apostasy', 'britt', 'croton', 'daemon', 'foam', 'kingwood', 'paste', 'quantifier', 'thunderbolt', 'turnoff', 'bunt', 'discord', 'lustre', 'patchwork', 'perpendicular', 'perversion', 'restraint', 'spread', 'stowage', 'tuck', 'barley', 'broadbill', 'hibernation', 'mantra', 'pitch', 'sob', 'soma', 'topper', 'toughness', 'uneasiness', 'calamus', 'feeler', 'gash', 'indorsement', 'leash', 'platen', 'presumption', 'rosewood', 'rouleau', 'thoughtfulness', 'bunk', 'deceleration', 'hammer', 'indenture', 'intrusion', 'pull', 'scup', 'shake', 'smut', 'vet', 'apparition', 'basilisk', 'closet', 'herring', 'millstone', 'poop', 'roaster', 'tartar', 'transposition', 'trap', 'arousal', 'backdoor', 'chamois', 'chino', 'insolation', 'larch', 'latch', 'scrape', 'spoiler', 'warhorse', 'blackjack', 'canvass', 'elaboration', 'foliation', 'foulness', 'panhandle', 'projection', 'roughness', 'sprocket', 'yoke', 'cavalier', 'cumin', 'flourish', 'heaviness', 'lunacy', 'middleman', 'mistletoe', 'omnivore', 'periwinkle', 'sharpie', 'champaign', 'depersonalisation', 'gangway', 'guile', 'inversion', 'pretence', 'richness', 'rigger', 'scaffold', 'tumbleweed', 'chickpea', 'isometry', 'looseness', 'overcast', 'penetration', 'perceptiveness', 'sprinkling', 'superlative', 'turning', 'videotape', 'awkwardness', 'cottonwood', 'crammer', 'crick', 'disdain', 'fineness', 'gaff', 'gaffer', 'officeholder', 'solidness', 'agape', 'autograph', 'chameleon', 'diaphragm', 'eulogy', 'naturalization', 'neutralisation', 'rumination', 'scallop', 'snatch', 'dip', 'flyover', 'freshness', 'muller', 'prevision', 'quart', 'restlessness', 'saccade', 'tightness', 'upright', 'assignment', 'coon', 'hooker', 'perforation', 'promenade', 'rascal', 'ringer', 'ruination', 'stemmer', 'trot', 'avatar', 'boomerang', 'caramel', 'cockpit', 'cutout', 'distillation', 'fervor', 'fez', 'specialty', 'cruelty', 'demerara', 'elation', 'fever', 'hiatus', 'omnibus', 'puck', 'ratio', 'snorkel', 'checkmate', 'comeback', 'modulation', 'stick', 'thimble', 'whiz', 'wren', 'brat', 'male', 'mandate', 'socialism', 'surety', 'tabernacle', 'trademark', 'truffle', 'alpaca', 'authentication', 'banting', 'church', 'dagger', 'grievance', 'metropolis', 'terminus', 'contract', 'descriptor', 'dialog', 'outrage', 'recombination', 'sextant', 'solfege', 'vocation', 'category', 'deacon', 'freak', 'hadith', 'lord', 'tornado', 'ward', 'account', 'cabaret', 'cotter', 'disc', 'matte', 'negative', 'saskatoon', 'local', 'matter', 'morale', 'obedience', 'shingle', 'spaghetti', 'vowel', 'week', 'work', 'belly', 'breakup', 'deposit', 'gallery', 'materialism', 'overflow', 'practice', 'regicide', 'elan', 'emergency', 'grill', 'mortmain', 'nose', 'petition', 'primary', 'puritan', 'ration', 'rehearsal', 'aurora', 'beatification', 'bodywork', 'chicane', 'consumption', 'grief', 'horseshoe', 'interpretation', 'nonsense', 'polemic', 'catapult', 'otter', 'peel', 'principle', 'resurrection', 'stack', 'symbolism', 'threshold', 'vicissitude', 'airway', 'farmland', 'gamma', 'ligament', 'rift', 'squire', 'stampede', 'substitute', 'tone', 'tramp', 'deformation', 'lime', 'mackintosh', 'mast', 'patty', 'pollack', 'psi', 'tanker', 'thane', 'tripoli', 'catastrophe', 'democrat', 'eleven', 'gauss', 'ichor', 'mug', 'sax', 'surge', 'village', 'asylum', 'bear', 'idolatry', 'immortal', 'inset', 'maxwell', 'pan', 'parameter', 'abdomen', 'afternoon', 'cirrus', 'congregation', 'directory', 'frost', 'gull', 'ping', 'porthole', 'spa', 'allegiance', 'chill', 'interaction', 'martyr', 'matrix', 'mum', 'naiad', 'nirvana', 'prognosis', 'upheaval', 'anime', 'device', 'dike', 'glitter', 'goodwill', 'headstone', 'marshal', 'minstrelsy', 'pink', 'standby', 'acumen', 'beetle', 'ebony', 'fanfare', 'forgiveness', 'hawk', 'ledger', 'louvre', 'robbery', 'butte', 'coercion', 'gas', 'hamlet', 'hertz', 'hijab', 'impetus', 'intoxication', 'royal', 'slur', 'banana', 'crew', 'cube', 'feedback', 'good', 'groove', 'individualism', 'kaleidoscope', 'literature', 'price', 'accuracy', 'bongo', 'decentralization', 'dobson', 'extermination', 'ivory', 'mass', 'quoin', 'takeaway', 'bracket', 'brass', 'giro', 'metre', 'mitt', 'sept', 'slaughter', 'athletics', 'crime', 'fair', 'fireman', 'flat', 'hire', 'infancy', 'mishap', 'degradation', 'harmony', 'residue', 'respect', 'ridge', 'trey', 'tryout', 'vibration', 'waterloo', 'aa', 'boniface', 'bonnet', 'cashmere', 'education', 'influence', 'metabolism', 'quiet', 'squash', 'acre', 'alibi', 'cashier', 'jolly', 'nationalisation', 'paddy', 'scrub', 'scum', 'tubercle', 'varsity', 'callus', 'chronology', 'expanse', 'fleet', 'flock', 'hodgepodge', 'keynote', 'license', 'lyricism', 'privateer', 'cask', 'elder', 'hostess', 'longevity', 'partisan', 'peduncle', 'salute', 'steward', 'trinity', 'watercolour', 'centrepiece', 'compartment', 'crinoline', 'dodo', 'genus', 'goliath', 'interior', 'moment', 'sanction', 'secularization', 'conjecture', 'crackle', 'disquiet', 'epithet', 'fox', 'gear', 'gravity', 'hospital', 'perfume', 'angle', 'beam', 'catalogue', 'hippocampus', 'limpet', 'outside', 'poetry', 'seed', 'stud', 'bunch', 'cavity', 'hag', 'ilium', 'industry', 'motivation', 'ninja', 'seal', 'te', 'walnut', 'blizzard', 'cathode', 'dialogue', 'godfather', 'lough', 'rendezvous', 'route', 'rover', 'taxation', 'bearskin', 'broth', 'bulk', 'do', 'favor', 'gratification', 'porgy', 'shortage', 'uplift', 'voucher', 'brick', 'buck', 'bypass', 'diode', 'freemasonry', 'glare', 'reign', 'stamp', 'stump', 'ana', 'bridle', 'colleague', 'mat', 'seeker', 'tune', 'wand', 'widget', 'yearbook', 'cordoba', 'grille', 'investigation', 'irregular', 'reshuffle', 'secondary', 'series', 'sill', 'trophy', 'acquaintance', 'adjective', 'chassis', 'constitution', 'ease', 'heap', 'inclination', 'pecan', 'prescription', 'tower', 'bagnio', 'castor', 'columbarium', 'deed', 'expedition', 'reprint', 'slump', 'standstill', 'balboa', 'cab', 'elbow', 'enlightenment', 'incision', 'lacquer', 'lauder', 'opera', 'shit', 'tragedy', 'arrow', 'glide', 'nucleus', 'padre', 'past', 'prank', 'reform', 'relic', 'turkey', 'authority', 'cabal', 'cm', 'crab', 'interlude', 'nan', 'petunia', 'pill', 'praise', 'heartbreaker', 'homestead', 'landscape', 'nutrient', 'prelude', 'probe', 'railhead', 'salon', 'stele', 'access', 'blimp', 'compromise', 'ding', 'flint', 'injection', 'malpractice', 'sister', 'stoker', 'airspace', 'basketball', 'combat', 'legitimacy', 'moratorium', 'morbidity', 'tile', 'tribune', 'weber', 'artillery', 'main', 'meridian', 'mine', 'overhaul', 'wings', 'yesterday', 'burr', 'desire', 'fat', 'length', 'pyramid', 'roach', 'snake', 'ti', 'wind', 'horseradish', 'loan', 'plastic', 'primer', 'privilege', 'radical', 'rope', 'saber', 'sucre', 'animation', 'argus', 'casket', 'catechism', 'citrus', 'default', 'detection', 'image', 'lullaby', 'reward', 'cupola', 'dalmatian', 'document', 'footprint', 'lancet', 'parody', 'sewer', 'turmeric', 'vinegar', 'ar', 'cache', 'character', 'cuff', 'millennium', 'outfielder', 'roof', 'tract', 'wildcat', 'censorship', 'clump', 'disobedience', 'irruption', 'kettle', 'officer', 'sergeant', 'thoroughbred', 'attache', 'confluence', 'due', 'dyke', 'enthusiasm', 'inflorescence', 'linden', 'meat', 'parity', 'trek', 'basket', 'brawl', 'breeze', 'day', 'exposition', 'finale', 'roe', 'unity', 'intro', 'missile', 'novelty', 'pane', 'quaker', 'ripple', 'romp', 'thumb', 'wall', 'alligator', 'debt', 'leviathan', 'nun', 'panel', 'pavement', 'queue', 'wonderland', 'aggregate', 'airline', 'baseline', 'el', 'idol', 'jaw', 'pilgrim', 'salamander', 'simulation', 'terpsichore', 'click', 'encroachment', 'hearth', 'manioc', 'mound', 'penance', 'phoebe', 'quill', 'serenity', 'tug', 'caption', 'cramp', 'crematorium', 'dear', 'monitor', 'octet', 'scanner', 'sufficiency', 'tranquility', 'caretaker', 'cony', 'grey', 'irregularity', 'midwifery', 'onslaught', 'payback', 'straw', 'walkabout', 'assurance', 'cucumber', 'deputation', 'emptiness', 'fritillary', 'gumbo', 'maverick', 'reader', 'study', 'beak', 'birthright', 'boards', 'dismissal', 'fatherhood', 'interpreter', 'pitcher', 'portrayal', 'sitting', 'withdrawal', 'angelfish', 'cutlery', 'kiwi', 'macadam', 'retrogression', 'rhea', 'sexton', 'stay', 'titi', 'verity', 'cobbler', 'federalist', 'futurist', 'gel', 'peacekeeper', 'pickup', 'scavenger', 'skipjack', 'stooge', 'workhorse', 'chaff', 'dominance', 'gall', 'geneva', 'historiography', 'leech', 'schoolmaster', 'skinner', 'wright', 'avarice', 'bangle', 'booster', 'choreography', 'predestination', 'roller', 'skimmer', 'struma', 'thenar', 'tractor', 'adequacy', 'annulus', 'bluegrass', 'bondage', 'chat', 'haste', 'meniscus', 'polymorphism', 'sole', 'tunic', 'anchorage', 'cordon', 'delinquency', 'dump', 'giant', 'gutter', 'melioration', 'sincerity', 'ulceration', 'wain', 'distraction', 'eagerness', 'hickey', 'idiom', 'magnificence', 'remission', 'rib', 'ritz', 'upbeat', 'wart', 'denial', 'disposition', 'endemic', 'failure', 'fodder', 'irritation', 'purification', 'suspension', 'tyrant', 'absorption', 'adhesion', 'brit', 'compact', 'epistle', 'foothold', 'merriment', 'ply', 'sura', 'transgression', 'accumulator', 'capture', 'fleabane', 'knob', 'mousetrap', 'multitude', 'pathway', 'scene', 'sweetness', 'concertina', 'conjugation', 'culmination', 'dissemination', 'reversion', 'scuffle', 'serenade', 'skid', 'wainscoting', 'weakness', 'changeling', 'connection', 'florist', 'grapevine', 'prick', 'snowball', 'walker', 'young', 'bathhouse', 'composition', 'curb', 'hypo', 'mouthpiece', 'offering', 'portmanteau', 'radiography', 'realism', 'summons', 'backlog', 'coming', 'felicity', 'flamenco', 'hearing', 'incontinence', 'moderation', 'para', 'pity', 'reverse', 'accounting', 'address', 'advance', 'chlamydia', 'direction', 'disruption', 'estimate', 'fingerprint', 'substance', 'teaspoon', 'alveolus', 'bite', 'confederacy', 'enlargement', 'etiology', 'hatchet', 'incendiary', 'mole', 'pusher', 'dun', 'jute', 'locust', 'mitzvah', 'palsy', 'pike', 'siamese', 'tragedian', 'transfusion', 'alienation', 'bastion', 'beard', 'equinox', 'freeze', 'glow', 'hazelnut', 'sextet', 'thumbscrew', 'tinker', 'burl', 'corrections', 'doubles', 'miracle', 'noose', 'ramrod', 'shame', 'tonic', 'vicuna', 'bolus', 'chariot', 'galley', 'headhunter', 'hold', 'muzzle', 'obfuscation', 'recitation', 'slough', 'suspicion', 'chorus', 'diffusion', 'dig', 'mackerel', 'monotype', 'replacement', 'slider', 'stratification', 'transportation', 'wimp', 'apron', 'aristocracy', 'cassia', 'clue', 'curie', 'jezebel', 'raise', 'satsuma', 'string', 'blackthorn', 'cachet', 'crystal', 'domestication', 'encumbrance', 'ewe', 'maniac', 'slick', 'subtitle', 'tautology', 'anchovy', 'boxer', 'climber', 'flow', 'modification', 'ostrich', 'superannuation', 'toot', 'tutu', 'build', 'citation', 'crease', 'dud', 'hint', 'memoir', 'mogul', 'plotter', 'roulette', 'aim', 'buckeye', 'cloakroom', 'foliage', 'ghoul', 'ordeal', 'rank', 'yield', 'zodiac', 'cataclysm', 'helmet', 'ligature', 'magenta', 'nylon', 'observation', 'plum', 'sweep', 'switch', 'windward', 'convertible', 'feeling', 'hood', 'intimacy', 'king', 'rattrap', 'sight', 'woodwork', 'accent', 'authorization', 'barbeque', 'commotion', 'cubicle', 'jag', 'liquor', 'misunderstanding', 'rectification', 'wahoo', 'architrave', 'colossus', 'copperplate', 'fly', 'incitement', 'nebula', 'quotation', 'rad', 'repercussion', 'crusade', 'fetish', 'flux', 'hospitalization', 'medusa', 'mercer', 'regularization', 'running', 'share', 'venom', 'embolism', 'honeymoon', 'indication', 'judgment', 'lumen', 'magnification', 'overall', 'prelature', 'pus', 'spark', 'accompaniment', 'brotherhood', 'chine', 'flinders', 'radiation', 'retreat', 'rotor', 'succession', 'tango', 'tor', 'cartridge', 'determination', 'endorsement', 'judas', 'laughter', 'malacca', 'playfulness', 'restitution', 'scorpion', 'stringer', 'breath', 'chit', 'classicist', 'countryman', 'membrane', 'protection', 'smash', 'stigma', 'treason', 'acceptance', 'camber', 'commutation', 'designer', 'engagement', 'jealousy', 'kola', 'muck', 'turnover', 'whitebait', 'chopper', 'hardness', 'hoop', 'insert', 'laugh', 'rattan', 'ruin', 'separation', 'silhouette', 'vacuum', 'accession', 'amazon', 'antagonism', 'crossfire', 'drop', 'exclusion', 'indictment', 'lifeline', 'luster', 'rise', 'barricade', 'confusion', 'gnome', 'harshness', 'negativity', 'net', 'schooner', 'signature', 'tenor', 'topaz', 'accommodation', 'afghan', 'calcification', 'column', 'covering', 'dark', 'lightweight', 'proposition', 'rack', 'swell', 'apostle', 'better', 'console', 'cushion', 'guarani', 'lineman', 'pathos', 'recorder', 'romantic', 'sampler', 'annals', 'bluebell', 'concurrence', 'divider', 'dory', 'incubation', 'mayhem', 'mixture', 'qualm', 'seaman', 'aide', 'confession', 'cream', 'fairyland', 'fixing', 'mohawk', 'pi', 'presentation', 'roundup', 'bulwark', 'eon', 'indemnity', 'pretense', 'saucer', 'scattering', 'sheepskin', 'som', 'spade', 'takeoff', 'closure', 'digression', 'inheritance', 'leak', 'limitation', 'muse', 'rubbish', 'sisal', 'undercurrent', 'worst', 'civilisation', 'closeness', 'darkness', 'deposition', 'festoon', 'fitting', 'knock', 'landfall', 'pyrimidine', 'tripper', 'abutment', 'accelerator', 'devotion', 'enclosure', 'fellow', 'fillet', 'gopher', 'lashing', 'rial', 'serration', 'assemblage', 'behalf', 'cover', 'cyclops', 'deficit', 'depreciation', 'high', 'imitation', 'motion', 'shift', 'bunting', 'counter', 'giveaway', 'glimpse', 'hind', 'patrician', 'peppermint', 'reaper', 'sidecar', 'argument', 'bombardier', 'escutcheon', 'midden', 'nothingness', 'perturbation', 'statement', 'tracer', 'aggression', 'diligence', 'ecstasy', 'gent', 'gravy', 'guideline', 'hammerhead', 'helm', 'purse', 'whip', 'breadbasket', 'burn', 'cheerleader', 'crud', 'eighties', 'fabrication', 'lick', 'meany', 'staging', 'vest', 'concretion', 'dandruff', 'entrant', 'genius', 'glaze', 'humpback', 'instant', 'interlocutor', 'recap', 'spat', 'brokerage', 'buildup', 'cisco', 'curfew', 'divination', 'ending', 'generalisation', 'snag', 'sticker', 'trace', 'accumulation', 'adjustment', 'carver', 'confinement', 'epiphany', 'firing', 'popcorn', 'runoff', 'tally', 'baton', 'bream', 'decay', 'fairness', 'modality', 'pheasant', 'precedent', 'squawk', 'tincture', 'borrowing', 'burst', 'coloratura', 'crotch', 'devil', 'initiation', 'primate', 'pylon', 'stranger', 'sycamore', 'complement', 'farewell', 'hoodoo', 'muscat', 'ploy', 'rationalisation', 'sensation', 'tilt', 'undertone', 'beau', 'bluster', 'butter', 'flagellum', 'fold', 'identification', 'indicator', 'scrap', 'siemens', 'articulation', 'binder', 'butternut', 'crossing', 'fork', 'renunciation', 'resilience', 'alto', 'castaway', 'conciliation', 'contractor', 'dressing', 'emission', 'kremlin', 'lea', 'pendant', 'syntax', 'assumption', 'catbird', 'despatch', 'environs', 'glimmer', 'lip', 'mahogany', 'pressman', 'sod', 'supplication', 'argyll', 'carambola', 'coarseness', 'inability', 'magpie', 'ogre', 'sobriety', 'summation', 'urgency', 'blind', 'detritus', 'exponent', 'indentation', 'inspiration', 'laver', 'pygmy', 'shooter', 'subordination', 'vein', 'bottom', 'buff', 'circumcision', 'coupon', 'cry', 'danger', 'graft', 'insubordination', 'lust', 'ornamentation', 'clemency', 'fireside', 'go', 'ingenuity', 'stargazer', 'straightness', 'taste', 'upgrade', 'waterworks', 'bearer', 'buzz', 'dab', 'darling', 'inflammation', 'kiss', 'slam', 'springboard', 'stretcher', 'triton', 'bound', 'collet', 'fuss', 'installment', 'litchi', 'mare', 'melancholy', 'pa', 'venter', 'wad', 'circumference', 'confirmation', 'content', 'cutaway', 'drain', 'gelatin', 'jargon', 'potpourri', 'raspberry', 'tupelo', 'apprehension', 'ballistics', 'bellwether', 'bum', 'lookout', 'oyster', 'paddle', 'spindle', 'suffering', 'villainy', 'gage', 'hopper', 'howl', 'loading', 'middleweight', 'misappropriation', 'referent', 'sharpshooter', 'stoma', 'agitation', 'apricot', 'balk', 'conclusion', 'pluralism', 'posture', 'quint', 'shipbuilder', 'thinness', 'wrongdoing', 'bending', 'bluebonnet', 'buffet', 'caution', 'clinch', 'implication', 'intercourse', 'rosebud', 'slack', 'toroid', 'blackcap', 'cognizance', 'dec', 'delusion', 'estimation', 'flip', 'instrumentation', 'polka', 'preventative', 'teak', 'alfalfa', 'arse', 'garland', 'hackney', 'intervention', 'limbo', 'newsroom', 'pedal', 'scratch', 'tiller', 'asshole', 'parliamentarian', 'rip', 'strength', 'thresher', 'timekeeper', 'toast', 'turner', 'tympanum', 'alkali', 'botany', 'escalator', 'flurry', 'genet', 'mil', 'rendition', 'stain', 'takedown', 'thong', 'burning', 'dipper', 'enthusiast', 'khanate', 'mink', 'passage', 'procrastination', 'shiner', 'strife', 'vignette', 'crossroads', 'excursion', 'fraudulence', 'hemlock', 'itch', 'liberalism', 'ms', 'muffler', 'ram', 'runner', 'boar', 'conservator', 'contribution', 'disappearance', 'gulden', 'imperative', 'lunette', 'powerhouse', 'quetzal', 'smear', 'carrot', 'colouration', 'crucifixion', 'entree', 'notice', 'push', 'restoration', 'tramway', 'trillion', 'turnaround', 'evasion', 'infusion', 'manifestation', 'objection', 'preparation', 'pressure', 'transfiguration', 'traverse', 'turtledove', 'upset', 'adagio', 'assortment', 'carnivore', 'flotilla', 'midterm', 'refreshment', 'slash', 'walk', 'amity', 'gal', 'intemperance', 'kick', 'marguerite', 'odor', 'reservation', 'sinus', 'vesper', 'yogi', 'argonaut', 'cubeb', 'debenture', 'dope', 'magnetism', 'pudding', 'rush', 'silence', 'speculum', 'whiting', 'amalgam', 'cat', 'facing', 'hive', 'invocation', 'pack', 'plague', 'rand', 'sash', 'wolverine', 'bearing', 'blowout', 'coating', 'huckleberry', 'lavatory', 'mimosa', 'plough', 'salvation', 'saturation', 'backfire', 'blackout', 'char', 'condemnation', 'grant', 'indulgence', 'intermarriage', 'madness', 'valve', 'arrangement', 'continuation', 'escarpment', 'filth', 'fireball', 'marshall', 'misfire', 'orthodoxy', 'termination', 'amortization', 'consideration', 'filing', 'hallucination', 'handmaid', 'hose', 'lackey', 'passer', 'stopper', 'stripper', 'assay', 'atrium', 'attachment', 'dehydration', 'hermit', 'immersion', 'infanticide', 'liver', 'loft', 'starter', 'behemoth', 'confrontation', 'mantle', 'nipple', 'racer', 'satisfaction', 'shakedown', 'stubble', 'sump', 'wicker', 'cohort', 'consistency', 'cos', 'epitaph', 'excision', 'exhaust', 'hydroxide', 'leading', 'portion', 'tuft', 'door', 'inhibition', 'like', 'penstock', 'rumba', 'shred', 'stimulation', 'stretch', 'tabu', 'atonement', 'cracker', 'cultivation', 'dislike', 'emphasis', 'fullness', 'nightingale', 'shrew', 'sphere', 'trumpeter', 'ballpark', 'candidate', 'constraint', 'legion', 'playbook', 'session', 'tat', 'wire', 'defect', 'destination', 'disk', 'lawlessness', 'minuet', 'mistrust', 'opinion', 'pretext', 'two', 'allies', 'bend', 'enslavement', 'gun', 'hedonism', 'independent', 'metamorphosis', 'notion', 'tube', 'vapor', 'badlands', 'bloom', 'fallout', 'immigration', 'perspicacity', 'pharmacy', 'plant', 'screw', 'till', 'vertex', 'appropriation', 'flower', 'leap', 'migration', 'mill', 'opossum', 'phase', 'ranger', 'ray', 'alder', 'bath', 'choice', 'festival', 'modernism', 'mouse', 'sally', 'cheese', 'groin', 'legislation', 'levitation', 'plenty', 'role', 'fullback', 'fusion', 'humor', 'swimmer', 'yeomanry', 'detention', 'flash', 'herald', 'lighting', 'storm', 'tapestry', 'volume', 'windmill', 'blackberry', 'intercession', 'jihad', 'raft', 'sketch', 'town', 'zoology', 'zoom', 'bureaucracy', 'catechu', 'communist', 'handicap', 'la', 'plain', 'plaque', 'subgroup', 'turtle', 'varna', 'barbarian', 'cleanup', 'groom', 'immediacy', 'means', 'parish', 'remedy', 'tanner', 'whin', 'aerial', 'bolt', 'capacitance', 'cedar', 'costa', 'orientation', 'pansy', 'shop', 'borough', 'brief', 'corruption', 'crash', 'id', 'kite', 'quartet', 'taxis', 'balmoral', 'dime', 'mechanic', 'pirate', 'pontoon', 'surrey', 'ton', 'vote', 'well', 'bacon', 'crate', 'domain', 'frigate', 'impression', 'millionth', 'omega', 'rate', 'troll', 'wick', 'area', 'catalog', 'curse', 'flavour', 'log', 'nail', 'oracle', 'rye', 'senior', 'slope', 'behavior', 'cardamom', 'caste', 'edge', 'lyric', 'militia', 'pea', 'plus', 'viewpoint', 'escapade', 'formalism', 'instance', 'mileage', 'name', 'pace', 'silk', 'thirst', 'vigilance', 'badge', 'calibre', 'consolation', 'divine', 'footage', 'obi', 'peso', 'republican', 'silver', 'spear', 'ceiling', 'compliance', 'cross', 'friction', 'niche', 'ovary', 'partizan', 'pony', 'spit', 'treasure', 'brain', 'chancellor', 'clip', 'duct', 'exile', 'gilbert', 'roadblock', 'sac', 'sortie', 'thesis', 'ammunition', 'cad', 'deception', 'dove', 'league', 'shrimp', 'toxicity', 'transom', 'aerosol', 'attrition', 'election', 'facade', 'semi', 'showcase', 'stereo', 'tournament', 'veto', 'barber', 'caveat', 'chair', 'corps', 'damage', 'format', 'intolerance', 'peak', 'trauma', 'bailey', 'concord', 'concourse', 'forehead', 'foreigner', 'hook', 'jingle', 'jut', 'ochre', 'treasury', 'canvas', 'color', 'corporation', 'homer', 'ice', 'manila', 'prize', 'sunfish', 'terry', 'wager', 'demand', 'melon', 'pageant', 'security', 'spice', 'strand', 'synthesis', 'tandem', 'virus', 'doubt', 'fifth', 'notebook', 'result', 'soul', 'triplet', 'victor', 'vigour', 'bargain', 'bladder', 'garage', 'ginger', 'lefty', 'railway', 'satellite', 'viceroy', 'wit', 'agency', 'criterion', 'fascination', 'gar', 'heavy', 'imperial', 'ladder', 'pedestal', 'troop', 'trouser', 'benefit', 'chap', 'cylinder', 'gridiron', 'herd', 'mafioso', 'myriad', 'north', 'outlook', 'rudder', 'admiralty', 'extinction', 'heller', 'heron', 'hysteria', 'lifesaver', 'minstrel', 'panic', 'privacy', 'southwest', 'bill', 'broadcasting', 'ceremony', 'fission', 'parenthesis', 'precursor', 'quantity', 'six', 'taboo', 'world', 'arena', 'consequence', 'gradient', 'ira', 'quarterback', 'shade', 'structure', 'vestry', 'wise', 'altar', 'asphalt', 'benedict', 'channel', 'covenant', 'fairy', 'fermentation', 'logic', 'mite', 'potential', 'back', 'charade', 'chest', 'network', 'offspring', 'panther', 'register', 'regulation', 'tackle', 'whistle', 'bash', 'devaluation', 'dream', 'learning', 'mask', 'pelvis', 'real', 'repair', 'studio', 'adonis', 'affair', 'food', 'maximum', 'precept', 'rocket', 'solo', 'song', 'telephone', 'cornice', 'encampment', 'generalization', 'kitty', 'misconduct', 'mortar', 'nine', 'octave', 'squirrel', 'unction', 'china', 'medalist', 'method', 'occasion', 'stomach', 'timothy', 'unrest', 'version', 'war', 'zip', 'bottlenose', 'communion', 'home', 'injunction', 'kabbalist', 'kickoff', 'legation', 'minister', 'object', 'teal', 'charm', 'clown', 'cortex', 'danish', 'deceit', 'ottoman', 'preview', 'size', 'spotlight', 'universal', 'boot', 'canon', 'cod', 'dawn', 'envoy', 'season', 'time', 'adventurer', 'butcher', 'film', 'lizard', 'nerve', 'slate', 'twenty', 'veneer', 'feather', 'holocaust', 'nightlife', 'noun', 'savannah', 'semester', 'tantra', 'waste', 'act', 'aggregation', 'at', 'bottle', 'cadence', 'inside', 'million', 'rotary', 'success', 'bead', 'goat', 'investment', 'luxury', 'madras', 'soap', 'stool', 'team', 'whimsy', 'age', 'biscuit', 'bubble', 'clavier', 'god', 'grad', 'patience', 'root', 'stride', 'flora', 'hat', 'ken', 'lichen', 'nation', 'piedmont', 'sequence', 'spiritualism', 'tanka', 'flume', 'fresco', 'gallantry', 'library', 'nelson', 'pocket', 'scar', 'sponge', 'sting', 'triple', 'author', 'babe', 'core', 'error', 'forest', 'gut', 'jay', 'recess', 'seminary', 'coward', 'dome', 'entropy', 'featherweight', 'hydra', 'livery', 'monk', 'pair', 'shovel', 'spite', 'con', 'egg', 'gang', 'gooseberry', 'master', 'mountain', 'robin', 'routine', 'soldier', 'space', 'assembly', 'conservation', 'fossil', 'hero', 'nut', 'overtone', 'people', 'sabre', 'attitude', 'buttery', 'chinchilla', 'crane', 'mara', 'repression', 'wardrobe', 'ace', 'asp', 'caliber', 'distance', 'enmity', 'hostel', 'mother', 'ordnance', 'pageantry', 'silo', 'bolivia', 'charlotte', 'deliberation', 'fell', 'gorge', 'insurance', 'reputation', 'tonsure', 'boat', 'clause', 'cooperative', 'crossover', 'grace', 'lox', 'news', 'structuralism', 'years', 'brier', 'endeavour', 'floss', 'grocery', 'leavening', 'mufti', 'outcome', 'waterwheel', 'whirl', 'accessory', 'canker', 'deluge', 'last', 'lineup', 'manner', 'prosecution', 'siding', 'soil', 'arcade', 'curacao', 'frank', 'granite', 'heath', 'patch', 'trade', 'vapour', 'architecture', 'bullet', 'elm', 'grove', 'malformation', 'trench', 'warfare', 'watt', 'allegory', 'decomposition', 'frailty', 'grass', 'lounge', 'psychotherapy', 'reef', 'shelf', 'summer', 'today', 'bourgeois', 'brown', 'catfish', 'comedian', 'count', 'hound', 'particle', 'pedagogy', 'tin', 'appendage', 'artery', 'bee', 'calendar', 'cornucopia', 'custom', 'transcription', 'warrant', 'bookmaker', 'cabin', 'chamberlain', 'creed', 'destiny', 'heresy', 'norm', 'redoubt', 'scenario', 'thatcher', 'cannon', 'captain', 'cub', 'east', 'eponym', 'mystery', 'reed', 'status', 'thorax', 'villain', 'congress', 'insect', 'prison', 'regime', 'spine', 'stem', 'tea', 'weight', 'works', 'amendment', 'coal', 'hanuman', 'manor', 'mix', 'node', 'reverend', 'salinity', 'tobacco', 'touchdown', 'aspiration', 'bureau', 'depth', 'forefront', 'height', 'operative', 'pain', 'palm', 'strip', 'wavelength', 'approximation', 'bugle', 'dean', 'health', 'horde', 'mastermind', 'prism', 'tree', 'trend', 'acknowledgement', 'canister', 'critic', 'heaven', 'imprint', 'juice', 'lightning', 'overhead', 'portfolio', 'tip', 'annexation', 'buffalo', 'interest', 'mg', 'monument', 'polity', 'quintet', 'revolver', 'streak', 'benjamin', 'billion', 'drum', 'goal', 'joke', 'peach', 'plantation', 'temperament', 'tolerance', 'warp', 'alley', 'cocktail', 'din', 'goldsmith', 'orbit', 'partition', 'physique', 'view', 'zeal', 'berth', 'centre', 'discrepancy', 'lad', 'lens', 'psalm', 'scenery', 'shower', 'smith', 'trouble', 'bathroom', 'blues', 'cue', 'hen', 'hunter', 'intake', 'quest', 'sugarcane', 'anemone', 'appointment', 'bye', 'engine', 'idyl', 'messiah', 'panda', 'parent', 'red', 'sermon', 'abdication', 'boss', 'convoy', 'heir', 'hoof', 'lock', 'pathology', 'peace', 'propensity', 'sorghum', 'ballad', 'biomass', 'bumper', 'deathbed', 'dish', 'hob', 'puppet', 'strategy', 'tattoo', 'test', 'bean', 'booth', 'coca', 'organization', 'replay', 'solitude', 'theatre', 'upstart', 'vogue', 'wave', 'antiquity', 'gift', 'harp', 'label', 'noodle', 'sink', 'tuna', 'vernier', 'wood', 'wrangler', 'alarm', 'billy', 'depot', 'detergent', 'mania', 'mode', 'room', 'shamanism', 'unoriginality', 'weed', 'climax', 'diameter', 'divisor', 'flight', 'heritage', 'northeast', 'paper', 'punt', 'queen', 'skirt', 'coat', 'connotation', 'enigma', 'grandeur', 'loch', 'sunrise', 'swift', 'threat', 'wonder', 'benny', 'certainty', 'charcoal', 'fracture', 'guide', 'lieutenant', 'rabbi', 'truss', 'upkeep', 'bail', 'bronze', 'care', 'meteor', 'pineapple', 'pitman', 'representative', 'roar', 'syncretism', 'vegetable', 'brace', 'constable', 'finger', 'lovage', 'manual', 'rock', 'torture', 'vortex', 'cove', 'dame', 'harbor', 'hierarchy', 'leger', 'misfortune', 'rape', 'swarm', 'tomorrow', 'viewing', 'blade', 'champagne', 'dickey', 'junior', 'letters', 'mummy', 'starch', 'tucker', 'uncle', 'ala', 'budget', 'calvary', 'delta', 'misery', 'plot', 'reconstruction', 'revolution', 'yahoo', 'bottleneck', 'electrophorus', 'heart', 'hole', 'kit', 'morocco', 'revival', 'syndrome', 'venture', 'whorl', 'burgess', 'crepe', 'diesel', 'inflection', 'signal', 'spinster', 'stunt', 'surgery', 'torch', 'council', 'crayfish', 'fifty', 'handout', 'jumper', 'mob', 'partridge', 'picket', 'ruby', 'wrath', 'battery', 'bogey', 'cockney', 'committee', 'flagship', 'institution', 'intersection', 'moor', 'negotiation', 'preoccupation', 'amber', 'caravan', 'diving', 'incidence', 'instrument', 'objective', 'pall', 'pantheon', 'polish', 'sitcom', 'climate', 'heroine', 'inspector', 'lesbian', 'lira', 'metalwork', 'usury', 'wagon', 'waist', 'warming', 'chaos', 'endowment', 'fauna', 'gadfly', 'government', 'makeup', 'manhattan', 'nest', 'president', 'samurai', 'barony', 'bracelet', 'cavalry', 'fourth', 'incentive', 'no', 'seam', 'shepherd', 'theorem', 'tooth', 'bin', 'dummy', 'greed', 'iota', 'march', 'organiser', 'playback', 'pork', 'cabbage', 'car', 'coalition', 'congo', 'denomination', 'infringement', 'monochrome', 'parcel', 'pepper', 'rail', 'amphibian', 'amphitheatre', 'canal', 'domino', 'flake', 'galaxy', 'gore', 'green', 'outpost', 'speck', 'beauty', 'continent', 'edict', 'ensemble', 'ma', 'prodigy', 'scripture', 'scull', 'takeover', 'wheat', 'canopy', 'cement', 'link', 'lope', 'parlor', 'radius', 'refuge', 'trojan', 'blaze', 'complaint', 'counsel', 'extortion', 'fence', 'gauge', 'mortality', 'mushroom', 'reaction', 'sale', 'baritone', 'browning', 'disturbance', 'gamecock', 'hop', 'infection', 'john', 'pest', 'reserve', 'strait', 'baby', 'blister', 'crack', 'dimension', 'facet', 'hell', 'inertia', 'kali', 'lotus', 'tenant', 'elk', 'hedge', 'impairment', 'kin', 'maze', 'parliament', 'species', 'sub', 'weir', 'cow', 'drought', 'harvest', 'lamb', 'love', 'rum', 'singleton', 'slit', 'specific', 'vernacular', 'circus', 'fault', 'heretic', 'jury', 'language', 'leopard', 'low', 'sentiment', 'willow', 'year', 'blast', 'cabinet', 'capillary', 'epitome', 'evening', 'freight', 'jurisdiction', 'milestone', 'mischief', 'prey', 'aging', 'ambition', 'asperity', 'bluebird', 'breadth', 'factor', 'modulus', 'skyline', 'stern', 'temperance', 'dart', 'disco', 'dude', 'duo', 'half', 'hieroglyph', 'mud', 'slave', 'solitaire', 'uproar', 'brake', 'eruption', 'monopoly', 'monotony', 'mustard', 'pope', 'star', 'volcano', 'warbler', 'waterway', 'barb', 'compound', 'dash', 'disposal', 'grillwork', 'inscription', 'rebound', 'temptation', 'truck', 'vinyl', 'aegis', 'blue', 'context', 'list', 'palatine', 'phantom', 'phosphate', 'rear', 'serpent', 'shag', 'arsenal', 'barn', 'bridge', 'magic', 'mead', 'moiety', 'racism', 'samba', 'shell', 'splash', 'article', 'campaign', 'carousel', 'cinema', 'integrity', 'li', 'profile', 'squadron', 'tour', 'agenda', 'award', 'discipline', 'macon', 'match', 'mile', 'milk', 'monkey', 'municipality', 'slap', 'barrier', 'chin', 'comfort', 'enrollment', 'explosion', 'pastry', 'ravel', 'rehabilitation', 'times', 'carter', 'chapel', 'clone', 'cuticle', 'facsimile', 'judge', 'ounce', 'tablet', 'thunder', 'usher', 'braille', 'brewer', 'brink', 'hope', 'input', 'ministry', 'moon', 'rod', 'timber', 'angelica', 'birthday', 'blitz', 'child', 'club', 'county', 'forum', 'jar', 'student', 'tempest', 'altitude', 'ballast', 'bedfellow', 'clerk', 'fanlight', 'module', 'oil', 'rig', 'slide', 'timetable', 'analysis', 'blessing', 'contingency', 'hurdle', 'leg', 'lineage', 'rainbow', 'reason', 'research', 'vampirism', 'era', 'javelin', 'meditation', 'oak', 'pentagon', 'revenue', 'scrutiny', 'spirit', 'virtue', 'yam', 'butterfly', 'coach', 'japan', 'moderator', 'press', 'taxonomy', 'teaser', 'yen', 'bazaar', 'franklin', 'granny', 'holiday', 'labor', 'maneuver', 'mezzanine', 'music', 'collins', 'five', 'matron', 'ocean', 'park', 'pincer', 'rim', 'scotch', 'sequel', 'steamer', 'capsule', 'concession', 'faith', 'fatigue', 'grip', 'inlet', 'tiger', 'verb', 'yard', 'battalion', 'cataract', 'gammon', 'jenny', 'murmur', 'nature', 'puppy', 'stub', 'ticket', 'yew', 'anxiety', 'cord', 'dispute', 'inquisitor', 'maple', 'navigation', 'owner', 'redemption', 'reliance', 'shilling', 'angel', 'cooperation', 'decoy', 'faggot', 'filibuster', 'harassment', 'hip', 'injury', 'raid', 'silenus', 'approach', 'armory', 'fret', 'habit', 'problem', 'summit', 'tie', 'valentine', 'vicar', 'avenue', 'chamber', 'chili', 'member', 'memorial', 'occurrence', 'onset', 'parlour', 'worm', 'allegro', 'baker', 'heartbeat', 'lumber', 'sec', 'solace', 'supper', 'virtuoso', 'volley', 'voltage', 'balcony', 'berlin', 'coast', 'cox', 'ex', 'exterior', 'index', 'pro', 'quality', 'thrill', 'chimney', 'cup', 'myrtle', 'plasma', 'powder', 'purgatory', 'record', 'row', 'transsexual', 'viscount', 'agora', 'blueprint', 'collar', 'conglomeration', 'cotton', 'handball', 'marquis', 'potato', 'slot', 'veil', 'breakthrough', 'browser', 'interchange', 'jerk', 'laundry', 'quartz', 'registrar', 'spill', 'storyteller', 'stupor', 'broadening', 'chord', 'ditch', 'dormitory', 'idealism', 'libel', 'parsley', 'pulp', 'triumph', 'tuber', 'border', 'cake', 'caterpillar', 'copper', 'disaster', 'mango', 'muscle', 'painting', 'reproach', 'toehold', 'attribute', 'duplex', 'earthquake', 'flood', 'frontier', 'haw', 'peasant', 'phoenix', 'rhetoric', 'tenure', 'bed', 'cardinal', 'collision', 'costume', 'flop', 'fowler', 'marquess', 'vaccination', 'welfare', 'abuse', 'bootleg', 'competition', 'frog', 'lion', 'medina', 'probation', 'race', 'reflection', 'won', 'anomaly', 'broadside', 'cook', 'don', 'duck', 'duty', 'father', 'finance', 'fir', 'payoff', 'biology', 'conquest', 'fundraiser', 'hybrid', 'mama', 'maria', 'mulberry', 'probate', 'road', 'tide', 'abbey', 'beta', 'lx', 'peril', 'repose', 'rhythm', 'si', 'simple', 'youth', 'bowl', 'carina', 'course', 'harrier', 'ideology', 'lake', 'lisle', 'oxford', 'percussion', 'python', 'amphitheater', 'antagonist', 'burden', 'framework', 'liquid', 'noise', 'payroll', 'plaster', 'ritual', 'yolk', 'background', 'brine', 'dislocation', 'emerald', 'keyboard', 'left', 'one', 'router', 'sex', 'tesla', 'basis', 'chapman', 'colloquium', 'cornerstone', 'forerunner', 'future', 'infrastructure', 'lot', 'manifold', 'manoeuvre', 'cellar', 'dragon', 'famine', 'leisure', 'pate', 'rebate', 'submarine', 'subsidiary', 'ware', 'bet', 'butt', 'hogan', 'humanist', 'jelly', 'loon', 'mercy', 'mood', 'pie', 'wig', 'ash', 'donkey', 'loaf', 'pottery', 'preposition', 'text', 'ultrasound', 'van', 'veteran', 'wrinkle', 'agriculture', 'aid', 'bush', 'convenience', 'evil', 'pleasure', 'sideline', 'symmetry', 'television', 'warren', 'apostrophe', 'computing', 'daphne', 'duration', 'flag', 'laurel', 'liaison', 'script', 'slang', 'strawberry', 'ancestry', 'chute', 'garrison', 'loop', 'meteorology', 'peroxide', 'scribe', 'sixteenth', 'tribute', 'frieze', 'haven', 'microwave', 'period', 'pore', 'rambler', 'saving', 'spam', 'thrust', 'wine', 'anil', 'buoyancy', 'conception', 'grand', 'itinerary', 'meeting', 'pardon', 'saffron', 'soda', 'tier', 'bitterness', 'cam', 'canteen', 'dispatch', 'living', 'nib', 'rat', 'reinforcement', 'southeast', 'suggestion', 'coordination', 'couch', 'feature', 'fissure', 'habitation', 'location', 'stave', 'tom', 'triangle', 'worker', 'butler', 'casino', 'efficiency', 'heraldry', 'inclusion', 'marking', 'orient', 'redwood', 'striker', 'tabby', 'anemia', 'calypso', 'codex', 'curtain', 'dedication', 'dock', 'escape', 'grasp', 'regular', 'umpire', 'atheism', 'contraction', 'declaration', 'delight', 'demonstration', 'emu', 'reality', 'ringtail', 'sector', 'trance', 'backlash', 'coil', 'confederation', 'mansion', 'mistake', 'sect', 'system', 'transparency', 'trilby', 'vamp', 'abnormality', 'combination', 'commander', 'deduction', 'detail', 'handicraft', 'realm', 'receiver', 'screening', 'symbol', 'building', 'chloride', 'material', 'multiplex', 'nausea', 'observance', 'privy', 'specimen', 'speculation', 'stress', 'brow', 'cotillion', 'firestone', 'garlic', 'icon', 'lettuce', 'lollipop', 'pine', 'rating', 'thrush', 'audience', 'construction', 'esteem', 'minimum', 'parr', 'pledge', 'regard', 'saloon', 'troika', 'visit', 'bam', 'celebrity', 'em', 'feminism', 'flaw', 'hogg', 'jockey', 'liquidation', 'medic', 'surfeit', 'commune', 'foodstuff', 'increase', 'landsman', 'novel', 'operator', 'procedure', 'rosette', 'traction', 'zombie', 'blowup', 'boiling', 'characteristic', 'electioneering', 'fundamental', 'marathon', 'possibility', 'reading', 'small', 'standoff', 'certification', 'gunman', 'metropolitan', 'onion', 'recollection', 'sentimentalism', 'start', 'submission', 'task', 'wattle', 'aura', 'iodine', 'jersey', 'labour', 'occupation', 'player', 'sunset', 'tangent', 'terminal', 'yawl', 'basement', 'extremity', 'island', 'meter', 'pellet', 'sculpture', 'steamroller', 'suite', 'watercourse', 'wound', 'blow', 'chess', 'crunch', 'cryptography', 'exarch', 'mo', 'ordination', 'tentacle', 'thousandth', 'totalitarianism', 'cause', 'cooper', 'fiend', 'golem', 'octopus', 'papyrus', 'pollock', 'sr', 'transport', 'wipeout', 'air', 'balloon', 'bias', 'crewman', 'divergence', 'gulf', 'lambert', 'nuisance', 'suture', 'tailback', 'chosen', 'drawing', 'four', 'front', 'major', 'pride', 'printing', 'roadster', 'toothbrush', 'transformation', 'atlas', 'burgundy', 'dm', 'graham', 'he', 'infatuation', 'mannerism', 'peter', 'representation', 'stasis', 'associate', 'bullion', 'conviction', 'foundation', 'instruction', 'mistress', 'pointer', 'sapphire', 'senility', 'training', 'alcoholism', 'amusement', 'arsenic', 'breast', 'economy', 'humiliation', 'import', 'readiness', 'resonance', 'writing', 'absence', 'balsam', 'drunkenness', 'fashion', 'jig', 'nightmare', 'pillar', 'romance', 'socket', 'takeout', 'authorisation', 'correspondence', 'fable', 'fund', 'gain', 'intensity', 'neglect', 'remuneration', 'revelation', 'somerset', 'baggage', 'blanket', 'circumstance', 'latency', 'open', 'protuberance', 'rascality', 'rider', 'seizure', 'xi', 'coup', 'favoritism', 'girdle', 'joker', 'postmortem', 'public', 'supporter', 'tabloid', 'urn', 'variable', 'chew', 'fight', 'glove', 'hi', 'nm', 'safe', 'scope', 'surface', 'technical', 'viscose', 'empire', 'helix', 'hyacinth', 'jump', 'juniper', 'keel', 'linen', 'margin', 'paradise', 'wag', 'ai', 'barrow', 'decompression', 'downhill', 'esquire', 'fertilization', 'flycatcher', 'fountain', 'geek', 'linebacker', 'ageing', 'current', 'mousse', 'need', 'packet', 'precaution', 'repository', 'sanatorium', 'second', 'stalk', 'answer', 'arbor', 'bob', 'chelation', 'contamination', 'fan', 'focus', 'molecule', 'putrefaction', 'residence', 'abstraction', 'depiction', 'fame', 'lottery', 'medicine', 'placenta', 'redundancy', 'relish', 'sixth', 'smell', 'admixture', 'athenaeum', 'credit', 'cutter', 'hatch', 'induction', 'involvement', 'kernel', 'quarry', 'tender', 'attention', 'chieftain', 'kino', 'leadership', 'liner', 'lisp', 'nazi', 'pelt', 'report', 'self', 'blending', 'bout', 'drama', 'erosion', 'scandal', 'scent', 'spur', 'stalemate', 'terrace', 'wrestling', 'acme', 'bohemia', 'carriage', 'collapse', 'dealer', 'derivative', 'dickie', 'night', 'piquet', 'search', 'action', 'cruiser', 'decision', 'declination', 'dissolution', 'hog', 'product', 'program', 'pupil', 'republic', 'basilica', 'boundary', 'capitulation', 'hit', 'lay', 'mailer', 'relationship', 'secretion', 'shear', 'state', 'audition', 'critique', 'expansion', 'lapse', 'law', 'lucifer', 'office', 'sheet', 'sire', 'steeplechase', 'apocalypse', 'development', 'dismay', 'examination', 'mall', 'promotion', 'sludge', 'storage', 'table', 'wish', 'bass', 'beginning', 'fixture', 'hygiene', 'luger', 'mane', 'northwest', 'simplicity', 'tunnel', 'woodruff', 'agent', 'cliffhanger', 'dashboard', 'delivery', 'dog', 'expectation', 'interval', 'painter', 'perspective', 'scholar', 'addiction', 'allocation', 'career', 'drake', 'generator', 'levee', 'morphology', 'schism', 'show', 'stiff', 'coke', 'commitment', 'courthouse', 'dissociation', 'fit', 'manta', 'shrubbery', 'thorn', 'upbringing', 'vanity', 'briar', 'brig', 'chandler', 'corduroy', 'fen', 'liturgy', 'nationalism', 'nickel', 'pursuit', 'watch', 'alum', 'bohemian', 'bounty', 'cartwright', 'display', 'enterprise', 'fancy', 'perception', 'pod', 'saratoga', 'accord', 'agreement', 'bridgehead', 'cadre', 'collectivism', 'corrosion', 'dance', 'garden', 'squad', 'veneration', 'ban', 'brand', 'crank', 'genealogy', 'lecture', 'scroll', 'speech', 'trim', 'variant', 'yeast', 'acrylic', 'bond', 'buckle', 'chancery', 'franchise', 'holly', 'landing', 'nebuchadnezzar', 'shiva', 'tendency', 'decrease', 'dropout', 'headpiece', 'kabbalah', 'langley', 'leaning', 'month', 'poison', 'spoon', 'wedding', 'draw', 'eel', 'incarnation', 'iniquity', 'liparis', 'masterpiece', 'patrol', 'sir', 'trip', 'type', 'benchmark', 'encounter', 'frontal', 'interpolation', 'poll', 'preference', 'renegade', 'renovation', 'reticulum', 'subway', 'approval', 'creation', 'duke', 'enquiry', 'hands', 'insectivore', 'parsimony', 'reception', 'rotunda', 'wool', 'aeon', 'confidence', 'derrick', 'entry', 'legume', 'monarch', 'oxbow', 'preliminary', 'principal', 'reach', 'claim', 'crush', 'dust', 'execution', 'hostility', 'look', 'multiplicity', 'specter', 'speed', 'stein', 'attempt', 'countenance', 'note', 'ramp', 'registration', 'resident', 'sailing', 'talk', 'thickness', 'trial', 'cyberpunk', 'growth', 'headgear', 'hobby', 'jock', 'mainstay', 'miscellany', 'plight', 'secretary', 'wealth', 'boiler', 'bologna', 'classification', 'conversion', 'enticement', 'gauntlet', 'genre', 'jean', 'metal', 'nanny', 'allowance', 'anachronism', 'bullock', 'chink', 'dahl', 'steps', 'striation', 'tub', 'violence', 'water', 'disapproval', 'flathead', 'homeboy', 'illustration', 'jellyfish', 'lemma', 'linkage', 'preservation', 'proselytism', 'subsistence', 'baseball', 'bird', 'dugout', 'elongation', 'expense', 'ink', 'newcomer', 'publication', 'reference', 'rejection', 'bodkin', 'burger', 'carbon', 'conductor', 'duel', 'elimination', 'fuji', 'performance', 'standard', 'teardrop', 'apache', 'board', 'drink', 'expression', 'headrest', 'heavyweight', 'hemp', 'kb', 'ponce', 'vitality', 'blackwood', 'cavern', 'employment', 'ethic', 'fiction', 'gram', 'proficiency', 'sharing', 'spectrograph', 'springer', 'attraction', 'bowling', 'chemistry', 'collector', 'convergence', 'finish', 'intimidation', 'layer', 'regent', 'twilight', 'banner', 'belvedere', 'camera', 'fury', 'grail', 'killer', 'profit', 'subdivision', 'technology', 'understanding', 'baronetcy', 'cheek', 'dinner', 'distinction', 'episcopate', 'goalkeeper', 'nativity', 'nit', 'raja', 'steroid', 'barbecue', 'commons', 'concurrency', 'demoiselle', 'harm', 'lady', 'litter', 'right', 'rumble', 'wilderness', 'anise', 'carp', 'choir', 'discomfort', 'duster', 'identity', 'knockout', 'maintenance', 'presence', 'regeneration', 'baroque', 'closing', 'freedom', 'gloss', 'hart', 'masonry', 'monad', 'opposition', 'recognition', 'trigon', 'divan', 'driver', 'essence', 'feast', 'footwork', 'graduation', 'humanitarian', 'pant', 'rent', 'soprano', 'cowboy', 'decline', 'duplicity', 'fish', 'recession', 'sachem', 'survey', 'swagger', 'turnpike', 'walkover', 'admission', 'batch', 'decade', 'landau', 'offence', 'sensitivity', 'sleep', 'stroma', 'surrender', 'trifle', 'alignment', 'crook', 'enemy', 'ensign', 'nectar', 'nostrum', 'seigneury', 'symptom', 'tarragon', 'use', 'dada', 'diaper', 'double', 'formation', 'incubus', 'obligation', 'omission', 'power', 'punk', 'racket', 'addition', 'conglomerate', 'cope', 'creek', 'foresight', 'pix', 'relation', 'strongman', 'transfer', 'withe', 'apparatus', 'date', 'endgame', 'evangelist', 'gathering', 'manhood', 'move', 'production', 'souvenir', 'titan', 'beacon', 'cane', 'capitulum', 'cashew', 'contact', 'inferno', 'insecurity', 'perm', 'sausage', 'triad', 'aftermath', 'diaspora', 'disorder', 'eye', 'offense', 'paw', 'purge', 'rodeo', 'severity', 'translation', 'chum', 'clam', 'indifference', 'lance', 'nexus', 'society', 'specification', 'ut', 'welterweight', 'workshop', 'department', 'equivalent', 'help', 'introduction', 'premier', 'sierra', 'tangerine', 'temper', 'term', 'torpedo', 'compilation', 'distributor', 'emergence', 'file', 'junction', 'mule', 'roundabout', 'saw', 'tear', 'wizard', 'amnesty', 'discovery', 'guinea', 'halo', 'hickory', 'hunger', 'limit', 'locus', 'pedigree', 'server', 'album', 'bankruptcy', 'berg', 'capstone', 'deck', 'deficiency', 'deletion', 'marriage', 'mussel', 'toggle', 'debut', 'dividend', 'divinity', 'feel', 'gymnasium', 'lobby', 'menagerie', 'pavlova', 'tv', 'wheeler', 'apple', 'establishment', 'germ', 'kingdom', 'nymph', 'ontology', 'potency', 'stripe', 'toponymy', 'vaccinia', 'appraisal', 'atrophy', 'change', 'confectionery', 'fugue', 'herb', 'ki', 'mullet', 'particular', 'royalist', 'bighorn', 'casting', 'constituent', 'embarrassment', 'inch', 'labyrinth', 'motley', 'provision', 'tag', 'throw', 'appliance', 'deforestation', 'degeneracy', 'exception', 'inaugural', 'panacea', 'projectile', 'sage', 'screwball', 'suppression', 'accident', 'adult', 'courtesy', 'death', 'pasta', 'pigment', 'retribution', 'setting', 'utility', 'vocabulary', 'ascension', 'bachelor', 'disappointment', 'flavor', 'kid', 'planet', 'providence', 'shenanigan', 'ventilation', 'wasp', 'ballet', 'binding', 'calliope', 'coolness', 'daylight', 'imbalance', 'immunity', 'impact', 'mixer', 'squatter', 'appearance', 'conjunction', 'convent', 'density', 'lupus', 'quarrel', 'rag', 'shellac', 'teller', 'upholstery', 'application', 'bailiwick', 'difference', 'grinder', 'hotspur', 'mercury', 'rut', 'strike', 'tamarind', 'taper', 'agaric', 'anchor', 'chart', 'clove', 'defamation', 'numbers', 'pioneer', 'rebirth', 'sloth', 'throne', 'applesauce', 'batten', 'colour', 'contest', 'discourse', 'gismo', 'oversight', 'plug', 'reparation', 'spare', 'acquisition', 'ambassador', 'brave', 'fragmentation', 'frustration', 'minute', 'ninth', 'risk', 'sunburst', 'thought', 'gentleman', 'lappet', 'malt', 'nick', 'ox', 'pox', 'remainder', 'shipwreck', 'topic', 'tot']
-chainnet_dict = {sense['wordform']: sense for sense in chainnet}
-chainnet = [chainnet_dict[w] for w in ordered_words]
+chainnet = chainnet.get_many(ordered_words)
 
 info('Processing into form')
 all_data = []
@@ -113,3 +120,4 @@ for name, d in output:
     save_pickle(f'bin/parsing/data/{name}.pkl', d)
 
 info('Done')
+stage.record()
@@ -1,16 +1,28 @@
 import os
+import sys
 
 import torch
 from sklearn.metrics import accuracy_score
 from torch.utils.data import DataLoader
 
 from python.common.common import info, open_pickle, warn, flatten
+from python.common.stage_cache import Stage
 from python.common.global_variables import device, BATCH_SIZE, EARLY_STOPPING, TESTING, seed, RESTART_WITH_DIVISOR, \
     LEARNING_RATE, BETAS
 from python.u3_parsing.utils.training_utils import simple_collate_fn, initialise_model
 
 torch.manual_seed(seed=seed)
 
+stage = Stage('u3_parsing/s3_train', inputs=['bin/parsing/sensembert_embeddings.pkl', 'bin/parsing/data/train.pkl',
+                                             'bin/parsing/data/dev.pkl'],
+              outputs=['bin/parsing/models/biaffine_edge.pth', 'bin/parsing/models/biaffine_label.pth',
+                       'bin/parsing/models/contextless_label.pth'],
+              code=[__file__, 'python/u3_parsing/models', 'python/u3_parsing/utils'],
+              params={'seed': seed, 'batch_size': BATCH_SIZE, 'early_stopping': EARLY_STOPPING, 'testing': TESTING,
+                      'restarts': RESTART_WITH_DIVISOR, 'learning_rate': LEARNING_RATE, 'betas': BETAS})
+if stage.skip_if_fresh():
+    sys.exit(0)
+
 
 info('Loading embeddings')
 embeddings = open_pickle('bin/parsing/sensembert_embeddings.pkl')
@@ -163,3 +175,4 @@ for model_name in ['biaffine_edge', 'biaffine_label', 'contextless_label']:
     torch.save(model.state_dict(), os.path.join(f'bin/parsing/models/{model_name}.pth'))
 
 info('Training complete')
+stage.record()
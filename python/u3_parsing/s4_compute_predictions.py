@@ -1,12 +1,14 @@
 import glob
 import os
 import random
+import sys
 from collections import defaultdict
 
 import torch
 from torch.utils.data import DataLoader
 
 from python.common.common import open_pickle, info, save_pickle
+from python.common.stage_cache import Stage
 from python.common.global_variables import BATCH_SIZE, seed, device
 from python.u3_parsing.models.edge.biaffine_edge import BiaffineEdge
 from python.u3_parsing.utils.training_utils import simple_collate_fn, initialise_model
@@ -14,6 +16,14 @@ from python.u3_parsing.utils.training_utils import simple_collate_fn, initialise
 random.seed(seed)
 torch.manual_seed(seed=seed)
 
+stage = Stage('u3_parsing/s4_compute_predictions',
+              inputs=['bin/parsing/sensembert_embeddings.pkl', 'bin/parsing/data/dev.pkl', 'bin/parsing/data/test.pkl',
+                      'bin/parsing/models/*.pth'],
+              code=[__file__, 'python/u3_parsing/models', 'python/u3_parsing/utils'],
+              params={'seed': seed, 'batch_size': BATCH_SIZE})
+if stage.skip_if_fresh():
+    sys.exit(0)
+
 def get_lengths(lst):
     return [len(item) for item in lst]
 
@@ -110,3 +120,4 @@ for dataset in ['test', 'dev']:
     save_pickle(f'bin/parsing/output/{dataset}/labels/gold_standard_label.pkl', output)
 
 info('Done')
+stage.record()
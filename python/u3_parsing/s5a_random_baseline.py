@@ -1,14 +1,23 @@
+import sys
 from collections import defaultdict
 
 import numpy as np
 
 from python.common.common import open_pickle, info, save_pickle
+from python.common.stage_cache import Stage
 import random
 
 from python.common.global_variables import seed
 
 random.seed(seed)
 
+stage = Stage('u3_parsing/s5a_random_baseline',
+              inputs=['bin/parsing/data/dev.pkl', 'bin/parsing/data/test.pkl', 'bin/parsing/sensembert_embeddings.pkl',
+                      'bin/parsing/sense_vocabulary.pkl'],
+              params={'seed': seed})
+if stage.skip_if_fresh():
+    sys.exit(0)
+
 info('Loading data')
 for dataset in 'dev', 'test':
 
@@ -59,4 +68,4 @@ for dataset in 'dev', 'test':
     info('Saving')
     save_pickle(f'bin/parsing/output/{dataset}/connections/random_edge.pkl', random_heads)
     save_pickle(f'bin/parsing/output/{dataset}/labels/random_label.pkl', random_labels)
-
+stage.record()
@@ -1,9 +1,11 @@
+import sys
 from collections import defaultdict
 
 import numpy as np
 import torch
 
 from python.common.common import open_pickle, info, save_pickle
+from python.common.stage_cache import Stage
 import random
 from scipy.sparse.csgraph import minimum_spanning_tree
 
@@ -11,6 +13,15 @@ from python.common.global_variables import seed
 
 random.seed(seed)
 
+stage = Stage('u3_parsing/s5b_nearest_baseline',
+              inputs=['bin/parsing/sensembert_embeddings.pkl', 'bin/parsing/sense_vocabulary.pkl',
+                      'bin/parsing/data/dev.pkl', 'bin/parsing/data/test.pkl',
+                      'bin/parsing/output/dev/labels/contextless_label.pkl',
+                      'bin/parsing/output/test/labels/contextless_label.pkl'],
+              params={'seed': seed})
+if stage.skip_if_fresh():
+    sys.exit(0)
+
 sense_embs = open_pickle('bin/parsing/sensembert_embeddings.pkl')
 vocab = open_pickle('bin/parsing/sense_vocabulary.pkl')
 
@@ -130,4 +141,4 @@ for dataset in ['test', 'dev']:
 
     info('Saving')
     save_pickle(f'bin/parsing/output/{dataset}/connections/neighbour_edge.pkl', nearest_heads)
-
+stage.record()
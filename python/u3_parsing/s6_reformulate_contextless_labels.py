@@ -1,10 +1,19 @@
 import random
+import sys
 
 from python.common.common import open_pickle, save_pickle, info
+from python.common.stage_cache import Stage
 from python.common.global_variables import seed
 
 random.seed(seed)
 
+stage = Stage('u3_parsing/s6_reformulate_contextless_labels',
+              inputs=['bin/parsing/output/dev/labels/contextless_label.pkl',
+                      'bin/parsing/output/test/labels/contextless_label.pkl'],
+              params={'seed': seed})
+if stage.skip_if_fresh():
+    sys.exit(0)
+
 for dataset in ['dev', 'test']:
     labels = open_pickle(f'bin/parsing/output/{dataset}/labels/contextless_label.pkl')
 
@@ -25,3 +34,4 @@ for dataset in ['dev', 'test']:
     save_pickle(f'bin/parsing/output/{dataset}/labels/contextless_label_reformed.pkl', labels)
 
 info('Done')
+stage.record()
@@ -1,10 +1,19 @@
+import sys
 from collections import defaultdict
 
 from bidict import bidict
 
 from python.common.common import open_pickle, info, save_csv
+from python.common.stage_cache import Stage
 from python.common.global_variables import EDGE_TYPE_MAP
 
+stage = Stage('u3_parsing/s7_combine',
+              inputs=['bin/parsing/data/dev.pkl', 'bin/parsing/data/test.pkl', 'bin/parsing/sense_vocabulary.pkl',
+                      'bin/parsing/output/*/labels/*.pkl', 'bin/parsing/output/*/connections/*.pkl'],
+              params={'edge_types': EDGE_TYPE_MAP})
+if stage.skip_if_fresh():
+    sys.exit(0)
+
 for dataset in ['test', 'dev']:
 
     test = open_pickle(f'bin/parsing/data/{dataset}.pkl')
@@ -67,3 +76,4 @@ for dataset in ['test', 'dev']:
                 save_csv(f'bin/parsing/predictions/{dataset}/{combined_name}.csv', comb)
             else:
                 save_csv(f'bin/parsing/predictions/{dataset}/{combined_name}_top{n}.csv', comb)
+stage.record()
@@ -4,43 +4,32 @@ import os.path
 import re
 from collections import defaultdict
 
-from sklearn.metrics import accuracy_score
-
-from python.common.common import info, open_dict_csv
+from python.common.common import info, open_csv_columns
+from python.common.lazy import sklearn_metrics
+from python.common.instrumentation import run_report, timer
 from python.datatypes.sense_label import SenseLabel
 from python.u3_parsing.utils.evaluation_utils import permutation_test
 
 
 def los(gold, predicted):
-    pred_labels = []
-    gold_labels = []
-    for index, gold_anno in gold.items():
-        predicted_anno = predicted[index]
-
-        gold_label = gold_anno['label']
-        predicted_label = predicted_anno['label']
-
-        pred_labels.append(predicted_label)
-        gold_labels.append(gold_label)
-    return accuracy_score(y_true=gold_labels, y_pred=pred_labels)
+    # Predictions are aligned to the row order of the gold standard by reformat_data
+    assert predicted['index'] == gold['index']
+    return sklearn_metrics.accuracy_score(y_true=gold['label'], y_pred=predicted['label'])
 
 
 def extract_undirected_connections(data, labelled):
     connections = set()
-    for key, annotation in data.items():
-
-        sense_1 = annotation['sense_id']
-        head_index = int(annotation["head"])
-        label = annotation['label']
+    rows = {index: row for row, index in enumerate(data['index'])}
+    for sense_1, head_index, label, wordform_index, wordform in zip(data['sense_id'], data['head'], data['label'],
+                                                                    data['wordform_index'], data['wordform']):
         if head_index == 0:
             assert label == SenseLabel.PROTOTYPE.value
             sense_2 = 'ROOT'
         else:
             assert label != SenseLabel.PROTOTYPE.value
-            head_key = f'{annotation["wordform_index"]}.{head_index}'
-            head_annotation = data[head_key]
-            assert head_annotation['wordform'] == annotation['wordform']
-            sense_2 = head_annotation['sense_id']
+            head_row = rows[f'{wordform_index}.{head_index}']
+            assert data['wordform'][head_row] == wordform
+            sense_2 = data['sense_id'][head_row]
 
         if labelled:
             connections.add((frozenset({sense_1, sense_2}), label))
@@ -73,20 +62,43 @@ def format_perc(value):
     value = "${}$".format(value)
     return value
 
-def reformat_data(data):
-    indices = set()
-    for d in data:
-        index = d['index']
-        assert index not in indices
-        indices.add(index)
-    return {d['index']: d for d in data}
+def open_predictions(file):
+    return open_csv_columns(file, dtypes={'wordform_index': int, 'head': int})
+
+
+def reformat_data(data, order=None):
+    # Checks that indices are unique, and reorders the rows to follow the given indices (which may be a superset)
+    indices = data['index']
+    rows = {index: row for row, index in enumerate(indices)}
+    assert len(rows) == len(indices)
+    if order is None:
+        return data
+    selected = [rows[index] for index in order if index in rows]
+    assert len(selected) == len(indices)
+    return select_rows(data, selected)
 
 
+def select_rows(data, rows):
+    return {name: [column[row] for row in rows] for name, column in data.items()}
+
+
+def group_rows(data):
+    # wordform index -> rows of that word
+    groups = defaultdict(list)
+    for row, wordform_index in enumerate(data['wordform_index']):
+        groups[wordform_index].append(row)
+    return groups
+
+
+if __name__ == "__main__":
+    run_report()
+
 for dataset in ['test']:
 
     info(f"Loading {dataset} predictions")
 
-    gold_data = reformat_data(open_dict_csv(f'bin/parsing/predictions/{dataset}/gold_standard.csv'))
+    gold_data = reformat_data(open_predictions(f'bin/parsing/predictions/{dataset}/gold_standard.csv'))
+    gold_order = gold_data['index']
 
     predictions = {}
     predictions_alts = defaultdict(list)
@@ -96,49 +108,51 @@ for dataset in ['test']:
         if name == 'gold_standard':
             continue
 
-        data = reformat_data(open_dict_csv(file))
+        data = reformat_data(open_predictions(file), order=gold_order)
 
         if '_top' in name:
             name_fixed = name.replace('_top', '')
             name_fixed = re.sub(r'[0-9]', '', name_fixed)
             predictions_alts[name_fixed].append(data)
         else:
-            assert set(data.keys()) == set(gold_data.keys())
+            assert data['index'] == gold_order
             predictions[name] = data
 
     # Stuff needed for top_n
-    all_wordform_indices = {d['wordform_index'] for d in gold_data.values()}
+    gold_groups = group_rows(gold_data)
 
     for name, data in predictions.items():
         predictions_alts[name].append(data)
 
     info('Finding top_n predictions')
     for name, datas in predictions_alts.items():
-        all_best_biaff_data = []
-        for wf_index in all_wordform_indices:
-            gold_filtered = {k: d for k, d in gold_data.items() if d['wordform_index'] == wf_index}
+        data_groups = [group_rows(baiff_data) for baiff_data in datas]
+        default_groups = group_rows(predictions[name])
+        all_best_biaff_data = defaultdict(list)
+        for wf_index, gold_rows in gold_groups.items():
+            gold_filtered = select_rows(gold_data, gold_rows)
             best_score = float('-inf')
             best_biaff_data = None
-            for baiff_data in datas:
-                baiff_data_filtered = {k: d for k, d in baiff_data.items() if d['wordform_index'] == wf_index}
-                if len(baiff_data_filtered) == 0:
+            for baiff_data, groups in zip(datas, data_groups):
+                if wf_index not in groups:
                     continue
-                assert len(baiff_data_filtered) == len(gold_filtered)
+                baiff_data_filtered = select_rows(baiff_data, groups[wf_index])
+                assert len(groups[wf_index]) == len(gold_rows)
 
-                local_score = uuas(gold=gold_filtered, predicted=baiff_data_filtered)
+                with timer('top_n uuas'):
+                    local_score = uuas(gold=gold_filtered, predicted=baiff_data_filtered)
                 if local_score > best_score:
                     best_score = local_score
                     best_biaff_data = baiff_data_filtered
             assert best_biaff_data is not None
-            if len(gold_filtered) > 1:
-                all_best_biaff_data.extend(best_biaff_data.values())
-            else:
-                default_filtered = {k: d for k, d in predictions[name].items() if d['wordform_index'] == wf_index}
-                all_best_biaff_data.extend(default_filtered.values())
+            if len(gold_rows) == 1:
+                best_biaff_data = select_rows(predictions[name], default_groups[wf_index])
+            for column_name, column in best_biaff_data.items():
+                all_best_biaff_data[column_name].extend(column)
 
-        reformed_biaff_data = reformat_data(all_best_biaff_data)
+        reformed_biaff_data = reformat_data(dict(all_best_biaff_data), order=gold_order)
         predictions[name+'+n'] = reformed_biaff_data
-        assert set(reformed_biaff_data.keys()) == set(gold_data.keys())
+        assert reformed_biaff_data['index'] == gold_order
 
     info('Computing')
     output = {}
@@ -148,7 +162,8 @@ for dataset in ['test']:
         significance = {}
 
         for model_name, predicted in predictions.items():
-            score = metric(gold=gold_data, predicted=predicted)
+            with timer(f'score {metric_name}'):
+                score = metric(gold=gold_data, predicted=predicted)
             scores[model_name] = score
 
         for model_name_1, model_name_2 in itertools.combinations(predictions.keys(), 2):
@@ -161,7 +176,8 @@ for dataset in ['test']:
             predicted_1 = predictions[model_name_1]
             predicted_2 = predictions[model_name_2]
 
-            p = permutation_test(predicted_1, predicted_2, gold_data, metric, r=10000)
+            with timer(f'permutation_test {metric_name}'):
+                p = permutation_test(predicted_1, predicted_2, gold_data, metric, r=10000)
             significance[f'{model_name_1}/{model_name_2}'] = p
 
         output[metric_name] = (scores, significance)
@@ -1,6 +1,5 @@
 # evaluation scripts
 import random
-from collections import defaultdict
 
 from python.common.common import info
 from python.common.global_variables import seed
@@ -9,24 +8,23 @@ random.seed(seed)
 
 
 def shuffle(predictions_1, predictions_2):
-    assert len(predictions_1) == len(predictions_2)
-    word_indices_to_keys = defaultdict(set)
-    for key in predictions_1.keys():
-        assert key in predictions_2.keys()
+    # Predictions are dicts of columns with rows in the same order; all rows of a word are swapped together
+    assert predictions_1['index'] == predictions_2['index']
+    flips = {}
+    swapped = []
+    for key in predictions_1['index']:
         word_index = key.split('.')[0]
-        word_indices_to_keys[word_index].add(key)
+        if word_index not in flips:
+            flips[word_index] = random.getrandbits(1)
+        swapped.append(flips[word_index])
 
     shuffled_1 = {}
     shuffled_2 = {}
-    for keys in word_indices_to_keys.values():
-        flip = random.getrandbits(1)
-        for key in keys:
-            if flip:
-                shuffled_1[key] = predictions_2[key]
-                shuffled_2[key] = predictions_1[key]
-            else:
-                shuffled_1[key] = predictions_1[key]
-                shuffled_2[key] = predictions_2[key]
+    for name in predictions_1.keys():
+        column_1 = predictions_1[name]
+        column_2 = predictions_2[name]
+        shuffled_1[name] = [b if flip else a for flip, a, b in zip(swapped, column_1, column_2)]
+        shuffled_2[name] = [a if flip else b for flip, a, b in zip(swapped, column_1, column_2)]
 
     return shuffled_1, shuffled_2
 
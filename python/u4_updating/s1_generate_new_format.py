@@ -1,6 +1,11 @@
-from python.common.common import open_json, save_csv
+from python.common.common import save_csv
+from python.common.chainnet_reader import open_chainnet_reader
+from python.common.instrumentation import run_report
 
-chainnet = open_json("data/chainnet.json")['content']
+if __name__ == "__main__":
+    run_report()
+
+chainnet = open_chainnet_reader()
 
 virtual_senses = []
 edges = []
@@ -1,39 +1,44 @@
-from collections import defaultdict
+from collections import defaultdict, Counter
 
-from python.common.common import open_dict_csv
-from nltk.corpus import wordnet as wn
+from python.common.common import open_csv_columns
+from python.common.lazy import wordnet_snapshot
+from python.common.instrumentation import run_report
 
-assert wn.get_version() == '3.0'
-edges = open_dict_csv('data/working_files/chainnet_edges.tsv')
-virtuals = open_dict_csv('data/working_files/chainnet_virtuals.tsv')
+if __name__ == "__main__":
+    run_report()
+
+edges = open_csv_columns('data/working_files/chainnet_edges.tsv', categorical=['wordform', 'label'])
+virtuals = open_csv_columns('data/working_files/chainnet_virtuals.tsv')
 
 # Virtual checks
-virtual_sense_ids = {v['sense_id'] for v in virtuals}
-assert len(virtual_sense_ids) == len(virtuals), "Repeat entries with the same sense ID (chainnet_virtuals.tsv)"
-virtual_sense_ids_to_wordform = {v['sense_id']: v['wordform'] for v in virtuals}
-origin_senses = [v['origin_sense_id'] for v in virtuals if v['origin_sense_id'] != ""]
-assert all([v['definition'] != "" for v in virtuals]), "Definition(s) missing in chainnet_virtuals.tsv"
-for s1 in origin_senses:
-    assert len([s2 for s2 in origin_senses if s2 == s1]) == 2, f'Split sense {s1} does not have two components in chainnet_virtuals.tsv'
+virtual_sense_ids = set(virtuals['sense_id'])
+assert len(virtual_sense_ids) == len(virtuals['sense_id']), "Repeat entries with the same sense ID (chainnet_virtuals.tsv)"
+virtual_sense_ids_to_wordform = dict(zip(virtuals['sense_id'], virtuals['wordform']))
+origin_sense_counts = Counter(o for o in virtuals['origin_sense_id'] if o != "")
+assert all([d != "" for d in virtuals['definition']]), "Definition(s) missing in chainnet_virtuals.tsv"
+for s1, count in origin_sense_counts.items():
+    assert count == 2, f'Split sense {s1} does not have two components in chainnet_virtuals.tsv'
 
 # Basic checks
+wn = wordnet_snapshot.open_wordnet_snapshot()
+assert wn.get_version() == '3.0'
+invalid_labels = set(edges['label'].categories) - {'metaphor', 'metonymy'}
+for i, label in enumerate(edges['label']):
+    assert label not in invalid_labels, f"Edge label {label} invalid; must read \'metaphor\' or \'metonymy\' (line {i+2} of chainnet_edges.tsv)"
+
 to_senses = set()
-wordforms = set()
-for i, edge in enumerate(edges):
-    wordforms.add(edge['wordform'])
-    assert edge['label'] in {'metaphor', 'metonymy'}, f"Edge label {edge['label']} invalid; must read \'metaphor\' or \'metonymy\' (line {i+2} of chainnet_edges.tsv)"
-
-    for sense_id in ['from_sense_id', 'to_sense_id']:
-        if '%V' not in edge[sense_id] and '%M' not in edge[sense_id]:
-            to_sense = wn.lemma_from_key(edge[sense_id])
-            assert to_sense.name().lower() == edge['wordform'], f"Sense {edge[sense_id]} is not a sense of \'{edge['wordform']}\' (line {i+2} of chainnet_edges.tsv)"
+for i, (wordform, from_sense_id, to_sense_id) in enumerate(zip(edges['wordform'], edges['from_sense_id'], edges['to_sense_id'])):
+    for sense_id in [from_sense_id, to_sense_id]:
+        if '%V' not in sense_id and '%M' not in sense_id:
+            to_sense = wn.lemma_from_key(sense_id)
+            assert to_sense.name().lower() == wordform, f"Sense {sense_id} is not a sense of \'{wordform}\' (line {i+2} of chainnet_edges.tsv)"
         else:
-            assert edge[sense_id] in virtual_sense_ids_to_wordform.keys()
-            assert edge['wordform'] == virtual_sense_ids_to_wordform[edge[sense_id]], f"Virtual sense {edge[sense_id]} given inconsistent wordform label in chainnet_virtuals.tsv and chainnet_edges.tsv"
-            virtual_sense_ids.discard(edge[sense_id])
+            assert sense_id in virtual_sense_ids_to_wordform.keys()
+            assert wordform == virtual_sense_ids_to_wordform[sense_id], f"Virtual sense {sense_id} given inconsistent wordform label in chainnet_virtuals.tsv and chainnet_edges.tsv"
+            virtual_sense_ids.discard(sense_id)
 
-    assert edge['to_sense_id'] not in to_senses, f"Sense {edge['to_sense_id']} has two incoming edges (repeat on line {i+2} of chainnet_edges.tsv)"
-    to_senses.add(edge['to_sense_id'])
+    assert to_sense_id not in to_senses, f"Sense {to_sense_id} has two incoming edges (repeat on line {i+2} of chainnet_edges.tsv)"
+    to_senses.add(to_sense_id)
 
 assert len(virtual_sense_ids) == 0, f"Virtual sense IDs in chainnet_virtuals.tsv that do not appear in chainnet_edges.tsv: {virtual_sense_ids}"
 
@@ -79,8 +84,11 @@ def is_valid_forest(edges):
     return len(visited) == len(nodes)
 
 # Forest check
-for wordform in wordforms:
-    edge_subset = [(e['from_sense_id'], e['to_sense_id']) for e in edges if e['wordform'] == wordform]
+edges_by_wordform = defaultdict(list)
+for code, from_sense_id, to_sense_id in zip(edges['wordform'].codes, edges['from_sense_id'], edges['to_sense_id']):
+    edges_by_wordform[code].append((from_sense_id, to_sense_id))
+for code, edge_subset in edges_by_wordform.items():
+    wordform = edges['wordform'].categories[code]
     assert is_valid_forest(edge_subset), f"Wordform \'{wordform}\' is not a valid forest structure"
 
 print('PASSED')
\ No newline at end of file
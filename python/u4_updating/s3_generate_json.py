@@ -1,11 +1,15 @@
 from collections import defaultdict
 
-from python.common.common import open_dict_csv, open_json, save_json
-from nltk.corpus import wordnet as wn
+from python.common.common import open_csv_columns, iter_dict_csv, open_json, save_json
+from python.common.sense_key_index import sense_key_synset
+from python.common.instrumentation import run_report
+
+if __name__ == "__main__":
+    run_report()
 
 # Loading edges
-edges = open_dict_csv('data/working_files/chainnet_edges.tsv')
-virtual_dict = {v['sense_id']: v for v in open_dict_csv('data/working_files/chainnet_virtuals.tsv')}
+edges = open_csv_columns('data/working_files/chainnet_edges.tsv')
+virtual_dict = {v['sense_id']: v for v in iter_dict_csv('data/working_files/chainnet_virtuals.tsv')}
 
 # Loading needed data
 synset_to_definition = {k: v['string'] for k, v in open_json('bin/concepts_to_definitions.json').items()}
@@ -23,33 +27,25 @@ for sense in virtual_dict.keys():
     sense_remap[sense] = sense
 
 # Adding prototypical senses
-all_wordforms = set({e['wordform'] for e in edges})
+all_wordforms = set(edges['wordform'])
 all_sense_ids_by_wordform = {w: set(words_to_senses[w]) for w in all_wordforms}
 for v, d in virtual_dict.items():
     wordform = d['wordform']
     all_sense_ids_by_wordform[wordform].add(v)
     if d['origin_sense_id'] != "":
         all_sense_ids_by_wordform[wordform].discard(d['origin_sense_id'])
-all_to_senses = set({e['to_sense_id'] for e in edges})
+all_to_senses = set(edges['to_sense_id'])
 for w, senses in all_sense_ids_by_wordform.items():
     for s in senses:
         if s not in all_to_senses:
-            prototype_edge = {
-                'wordform': w,
-                'from_sense_id': None,
-                'to_sense_id': s,
-                'label': "prototype"
-            }
-            edges.append(prototype_edge)
+            edges['wordform'].append(w)
+            edges['from_sense_id'].append(None)
+            edges['to_sense_id'].append(s)
+            edges['label'].append("prototype")
 
 # Process sense information into json form
 chainnet_temp = defaultdict(list)
-for edge in edges:
-    wordform = edge['wordform']
-    parent_sense_id = edge['from_sense_id']
-    sense_id = edge['to_sense_id']
-    label = edge['label']
-
+for wordform, parent_sense_id, sense_id, label in zip(edges['wordform'], edges['from_sense_id'], edges['to_sense_id'], edges['label']):
     is_mixed = '%M' in sense_id
     is_virtual = '%V' in sense_id
 
@@ -61,7 +57,7 @@ for edge in edges:
 
     wordnet_synset_id = None
     if wordnet_sense_id is not None:
-        wordnet_synset_id = wn.lemma_from_key(wordnet_sense_id).synset().name()
+        wordnet_synset_id = sense_key_synset(wordnet_sense_id)
 
     if is_virtual or is_mixed:
         definition = virtual_dict[sense_id]['definition']